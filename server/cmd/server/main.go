@@ -1,8 +1,11 @@
 package main
 
 import (
+	"context"
 	"log"
 	"os"
+	"os/signal"
+	"syscall"
 
 	"github.com/anath2/language-app/internal/config"
 	httprouter "github.com/anath2/language-app/internal/http"
@@ -22,6 +25,12 @@ func main() {
 		addr = ":" + envPort
 	}
 
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	defer stop()
+
 	log.Printf("server listening on %s", addr)
-	log.Fatal(httprouter.ListenAndServe(addr, cfg))
+	if err := httprouter.ListenAndServe(ctx, addr, cfg); err != nil {
+		log.Fatal(err)
+	}
+	log.Print("server stopped")
 }
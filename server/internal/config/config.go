@@ -10,6 +10,8 @@ import (
 )
 
 const defaultSessionMaxAgeHours = 168
+const defaultLLMConcurrency = 16
+const defaultJobConcurrency = 4
 
 type Config struct {
 	Addr                   string
@@ -24,6 +26,8 @@ type Config struct {
 	OpenAIChatModel        string
 	OpenAIBaseURL          string
 	OpenAIDebugLog         bool
+	LLMConcurrency         int
+	JobConcurrency         int
 }
 
 func Load() (Config, error) {
@@ -65,6 +69,24 @@ func Load() (Config, error) {
 		sessionHours = parsed
 	}
 
+	llmConcurrency := defaultLLMConcurrency
+	if raw := os.Getenv("LLM_CONCURRENCY"); raw != "" {
+		parsed, err := strconv.Atoi(raw)
+		if err != nil || parsed < 1 {
+			return Config{}, fmt.Errorf("invalid LLM_CONCURRENCY: must be a positive integer, got %q", raw)
+		}
+		llmConcurrency = parsed
+	}
+
+	jobConcurrency := defaultJobConcurrency
+	if raw := os.Getenv("TRANSLATION_JOB_CONCURRENCY"); raw != "" {
+		parsed, err := strconv.Atoi(raw)
+		if err != nil || parsed < 1 {
+			return Config{}, fmt.Errorf("invalid TRANSLATION_JOB_CONCURRENCY: must be a positive integer, got %q", raw)
+		}
+		jobConcurrency = parsed
+	}
+
 	addr := os.Getenv("APP_ADDR")
 	if addr == "" {
 		addr = ":8080"
@@ -93,6 +115,8 @@ func Load() (Config, error) {
 		OpenAIChatModel:        openAIChatModel,
 		OpenAIBaseURL:          openAIBaseURL,
 		OpenAIDebugLog:         strings.EqualFold(envFirstOrDefault([]string{"OPENAI_DEBUG_LOG", "OPENROUTER_DEBUG_LOG"}, ""), "true"),
+		LLMConcurrency:         llmConcurrency,
+		JobConcurrency:         jobConcurrency,
 	}, nil
 }
 
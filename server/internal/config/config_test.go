@@ -103,6 +103,65 @@ func TestLoadNormalizesOpenAIBaseURL(t *testing.T) {
 	}
 }
 
+func TestLoadLLMConcurrency(t *testing.T) {
+	repoRoot := createTempRepoRoot(t)
+	withChdir(t, repoRoot)
+
+	t.Setenv("APP_PASSWORD", "pw")
+	t.Setenv("APP_SECRET_KEY", "secret")
+	t.Setenv("OPENAI_API_KEY", "oa-key")
+	t.Setenv("OPENAI_TRANSLATION_MODEL", "openai/gpt-4o-mini")
+	t.Setenv("OPENAI_CHAT_MODEL", "openai/gpt-4o-mini")
+
+	t.Setenv("LLM_CONCURRENCY", "")
+	cfg, err := Load()
+	if err != nil {
+		t.Fatalf("load config: %v", err)
+	}
+	if cfg.LLMConcurrency != defaultLLMConcurrency {
+		t.Fatalf("expected default LLM concurrency %d, got %d", defaultLLMConcurrency, cfg.LLMConcurrency)
+	}
+
+	t.Setenv("LLM_CONCURRENCY", "0")
+	if _, err := Load(); err == nil {
+		t.Fatal("expected error for non-positive LLM_CONCURRENCY")
+	}
+}
+
+func TestLoadJobConcurrency(t *testing.T) {
+	repoRoot := createTempRepoRoot(t)
+	withChdir(t, repoRoot)
+
+	t.Setenv("APP_PASSWORD", "pw")
+	t.Setenv("APP_SECRET_KEY", "secret")
+	t.Setenv("OPENAI_API_KEY", "oa-key")
+	t.Setenv("OPENAI_TRANSLATION_MODEL", "openai/gpt-4o-mini")
+	t.Setenv("OPENAI_CHAT_MODEL", "openai/gpt-4o-mini")
+
+	t.Setenv("TRANSLATION_JOB_CONCURRENCY", "")
+	cfg, err := Load()
+	if err != nil {
+		t.Fatalf("load config: %v", err)
+	}
+	if cfg.JobConcurrency != defaultJobConcurrency {
+		t.Fatalf("expected default job concurrency %d, got %d", defaultJobConcurrency, cfg.JobConcurrency)
+	}
+
+	t.Setenv("TRANSLATION_JOB_CONCURRENCY", "8")
+	cfg, err = Load()
+	if err != nil {
+		t.Fatalf("load config: %v", err)
+	}
+	if cfg.JobConcurrency != 8 {
+		t.Fatalf("expected job concurrency 8, got %d", cfg.JobConcurrency)
+	}
+
+	t.Setenv("TRANSLATION_JOB_CONCURRENCY", "-1")
+	if _, err := Load(); err == nil {
+		t.Fatal("expected error for non-positive TRANSLATION_JOB_CONCURRENCY")
+	}
+}
+
 func TestLoadSupportsLegacyOpenRouterEnvNames(t *testing.T) {
 	repoRoot := createTempRepoRoot(t)
 	withChdir(t, repoRoot)
@@ -2,7 +2,12 @@ package handlers
 
 import (
 	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
 	"net/http"
+	"strconv"
+	"strings"
 )
 
 func ExportProgress(w http.ResponseWriter, r *http.Request) {
@@ -10,39 +15,69 @@ func ExportProgress(w http.ResponseWriter, r *http.Request) {
 		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
 		return
 	}
-	jsonContent, err := srs.ExportProgressJSON()
+	if acceptsNDJSON(r) {
+		w.Header().Set("Content-Type", ndjsonContentType)
+		w.Header().Set("Content-Disposition", "attachment; filename=\"language_app_progress.ndjson\"")
+		w.WriteHeader(http.StatusOK)
+		// Rows are written as they are read, so a failure part-way can only
+		// end the response early; the truncated file fails to import.
+		_ = srs.ExportProgressNDJSON(w)
+		return
+	}
+	content, err := srs.ExportProgressJSON()
 	if err != nil {
 		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
 		return
 	}
 	w.Header().Set("Content-Type", "application/json")
 	w.Header().Set("Content-Disposition", "attachment; filename=\"language_app_progress.json\"")
+	w.Header().Set("Content-Length", strconv.Itoa(len(content)))
 	w.WriteHeader(http.StatusOK)
-	_, _ = w.Write([]byte(jsonContent))
+	_, _ = w.Write(content)
 }
 
+// maxProgressImportBytes caps an uploaded progress bundle.
+const maxProgressImportBytes = 1 << 20
+
+var progressImportTooLarge = fmt.Sprintf("File too large. Maximum size is %dKB.", maxProgressImportBytes>>10)
+
 func ImportProgress(w http.ResponseWriter, r *http.Request) {
 	if err := validateDependencies(); err != nil {
 		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
 		return
 	}
-	if err := r.ParseMultipartForm(1 << 20); err != nil {
+	// Cap the body before parsing, as ExtractText does, so an oversized
+	// bundle is rejected once the limit is crossed rather than buffered.
+	r.Body = http.MaxBytesReader(w, r.Body, maxProgressImportBytes+maxMultipartOverheadBytes)
+	if err := r.ParseMultipartForm(maxProgressImportBytes); err != nil {
+		var maxBytesErr *http.MaxBytesError
+		if errors.As(err, &maxBytesErr) {
+			WriteJSON(w, http.StatusRequestEntityTooLarge, map[string]string{"detail": progressImportTooLarge})
+			return
+		}
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid multipart payload"})
 		return
 	}
-	file, _, err := r.FormFile("file")
+	file, header, err := r.FormFile("file")
 	if err != nil {
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid file type. Please upload a .json file."})
 		return
 	}
 	defer file.Close()
-	buf := make([]byte, 1<<20+1)
-	n, _ := file.Read(buf)
-	if n > 1<<20 {
-		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "File too large. Maximum size is 1024KB."})
+	if header.Size > maxProgressImportBytes {
+		WriteJSON(w, http.StatusRequestEntityTooLarge, map[string]string{"detail": progressImportTooLarge})
 		return
 	}
-	counts, err := srs.ImportProgressJSON(string(buf[:n]))
+	input := make([]byte, header.Size)
+	if _, err := io.ReadFull(file, input); err != nil {
+		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid multipart payload"})
+		return
+	}
+	importBundle := srs.ImportProgressJSON
+	if strings.HasSuffix(header.Filename, ".ndjson") {
+		importBundle = srs.ImportProgressNDJSON
+	}
+	counts, err := importBundle(input)
 	if err != nil {
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": err.Error()})
 		return
@@ -69,12 +104,13 @@ func GetProfile(w http.ResponseWriter, r *http.Request) {
 			"updated_at": profile.UpdatedAt,
 		}
 	}
+	counts := srs.CountSegments()
 	WriteJSON(w, http.StatusOK, map[string]any{
 		"profile": profileObj,
 		"vocabStats": map[string]int{
-			"known":    srs.CountSegmentsByStatus("known"),
-			"learning": srs.CountSegmentsByStatus("learning"),
-			"total":    srs.CountTotalSegments(),
+			"known":    counts.Known,
+			"learning": counts.Learning,
+			"total":    counts.Total,
 		},
 	})
 }
@@ -19,6 +19,43 @@ type chatListResponse struct {
 	Messages []translation.ChatMessage `json:"messages"`
 }
 
+// Chat stream events are typed so each SSE frame encodes without building a
+// map per chunk.
+type chatStartEvent struct {
+	Type          string `json:"type"`
+	TranslationID string `json:"translation_id"`
+	ChatID        string `json:"chat_id"`
+	UserMessageID string `json:"user_message_id"`
+}
+
+type chatChunkEvent struct {
+	Type  string `json:"type"`
+	Delta string `json:"delta"`
+}
+
+type chatToolCallStartEvent struct {
+	Type     string `json:"type"`
+	ToolName string `json:"tool_name"`
+}
+
+type chatToolResult struct {
+	MessageID  string                     `json:"message_id"`
+	ReviewCard translation.ChatReviewCard `json:"review_card"`
+}
+
+type chatCompleteEvent struct {
+	Type      string `json:"type"`
+	MessageID string `json:"message_id"`
+	Content   string `json:"content"`
+}
+
+type chatToolCompleteEvent struct {
+	Type        string           `json:"type"`
+	MessageID   string           `json:"message_id"`
+	Content     string           `json:"content"`
+	ToolResults []chatToolResult `json:"tool_results"`
+}
+
 func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 	if err := validateDependencies(); err != nil {
 		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
@@ -72,19 +109,19 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 
 	flusher, ok := w.(http.Flusher)
 	if !ok {
-		emitSSE(w, map[string]any{"type": "error", "message": "Streaming is not supported"})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: "Streaming is not supported"})
 		return
 	}
 
-	emitSSE(w, map[string]any{
-		"type":            "start",
-		"translation_id":  translationID,
-		"chat_id":         thread.ID,
-		"user_message_id": userMsg.ID,
+	emitSSE(w, chatStartEvent{
+		Type:          "start",
+		TranslationID: translationID,
+		ChatID:        thread.ID,
+		UserMessageID: userMsg.ID,
 	})
 	flusher.Flush()
 
-	result, err := chatProvider.ChatWithTranslationContext(r.Context(), intelligence.ChatWithTranslationRequest{
+	result, err := chatProvider.ChatWithTranslationContext(intelligence.RejectWhenBusy(r.Context()), intelligence.ChatWithTranslationRequest{
 		TranslationText: item.InputText,
 		UserMessage:     req.Message,
 		History:         history,
@@ -93,21 +130,15 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 		if strings.TrimSpace(chunk) == "" {
 			return nil
 		}
-		emitSSE(w, map[string]any{
-			"type":  "chunk",
-			"delta": chunk,
-		})
+		emitSSE(w, chatChunkEvent{Type: "chunk", Delta: chunk})
 		flusher.Flush()
 		return nil
 	}, func(toolName string) {
-		emitSSE(w, map[string]any{
-			"type":      "tool_call_start",
-			"tool_name": toolName,
-		})
+		emitSSE(w, chatToolCallStartEvent{Type: "tool_call_start", ToolName: toolName})
 		flusher.Flush()
 	})
 	if err != nil {
-		emitSSE(w, map[string]any{"type": "error", "message": err.Error()})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: err.Error()})
 		flusher.Flush()
 		return
 	}
@@ -116,13 +147,13 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 		// One AI text message for the whole turn.
 		aiMsg, err := chats.AppendChatMessage(translationID, translation.ChatRoleAI, "Here's a practice card for you:", "")
 		if err != nil {
-			emitSSE(w, map[string]any{"type": "error", "message": err.Error()})
+			emitSSE(w, streamErrorEvent{Type: "error", Message: err.Error()})
 			flusher.Flush()
 			return
 		}
 
 		// One tool message per tool call — each owns its own review card.
-		toolResults := make([]map[string]any, 0, len(result.ToolCalls))
+		toolResults := make([]chatToolResult, 0, len(result.ToolCalls))
 		for _, tc := range result.ToolCalls {
 			if tc.Name != "create_review_card" {
 				continue
@@ -133,18 +164,18 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 
 			toolMsg, err := chats.AppendChatMessage(translationID, translation.ChatRoleTool, chineseText, "")
 			if err != nil {
-				emitSSE(w, map[string]any{"type": "error", "message": err.Error()})
+				emitSSE(w, streamErrorEvent{Type: "error", Message: err.Error()})
 				flusher.Flush()
 				return
 			}
 			if err := chats.SetReviewCard(toolMsg.ID, chineseText, pinyin, english); err != nil {
-				emitSSE(w, map[string]any{"type": "error", "message": err.Error()})
+				emitSSE(w, streamErrorEvent{Type: "error", Message: err.Error()})
 				flusher.Flush()
 				return
 			}
-			toolResults = append(toolResults, map[string]any{
-				"message_id": toolMsg.ID,
-				"review_card": translation.ChatReviewCard{
+			toolResults = append(toolResults, chatToolResult{
+				MessageID: toolMsg.ID,
+				ReviewCard: translation.ChatReviewCard{
 					ChineseText: chineseText,
 					Pinyin:      pinyin,
 					English:     english,
@@ -152,11 +183,11 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 				},
 			})
 		}
-		emitSSE(w, map[string]any{
-			"type":         "complete",
-			"message_id":   aiMsg.ID,
-			"content":      aiMsg.Content,
-			"tool_results": toolResults,
+		emitSSE(w, chatToolCompleteEvent{
+			Type:        "complete",
+			MessageID:   aiMsg.ID,
+			Content:     aiMsg.Content,
+			ToolResults: toolResults,
 		})
 		flusher.Flush()
 		return
@@ -164,15 +195,15 @@ func CreateChatMessage(w http.ResponseWriter, r *http.Request) {
 
 	aiMsg, err := chats.AppendChatMessage(translationID, translation.ChatRoleAI, result.Content, "")
 	if err != nil {
-		emitSSE(w, map[string]any{"type": "error", "message": err.Error()})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: err.Error()})
 		flusher.Flush()
 		return
 	}
 
-	emitSSE(w, map[string]any{
-		"type":       "complete",
-		"message_id": aiMsg.ID,
-		"content":    aiMsg.Content,
+	emitSSE(w, chatCompleteEvent{
+		Type:      "complete",
+		MessageID: aiMsg.ID,
+		Content:   aiMsg.Content,
 	})
 	flusher.Flush()
 }
@@ -2,6 +2,7 @@ package handlers
 
 import (
 	"errors"
+	"io"
 
 	"github.com/anath2/language-app/internal/intelligence"
 	"github.com/anath2/language-app/internal/queue"
@@ -34,14 +35,16 @@ type srsStore interface {
 	UpdateSegmentStatus(segmentID string, status string) error
 	UpdateCharacterStatus(characterID string, status string) error
 	RecordLookup(segmentID string) (translation.SegmentSRSInfo, bool)
+	RecordLookups(segmentIDs []string) ([]translation.SegmentSRSInfo, error)
 	GetSegmentSRSInfo(headwords []string) ([]translation.SegmentSRSInfo, error)
 	GetSegmentReviewQueue(limit int) ([]translation.SegmentReviewCard, error)
 	GetSegmentDueCount() int
 	RecordReviewAnswer(entityID string, entityType string, grade int) (translation.ReviewAnswerResult, bool, error)
-	CountSegmentsByStatus(status string) int
-	CountTotalSegments() int
-	ExportProgressJSON() (string, error)
-	ImportProgressJSON(input string) (map[string]int, error)
+	CountSegments() translation.SegmentCounts
+	ExportProgressJSON() ([]byte, error)
+	ImportProgressJSON(input []byte) (map[string]int, error)
+	ExportProgressNDJSON(w io.Writer) error
+	ImportProgressNDJSON(input []byte) (map[string]int, error)
 	ExtractAndLinkCharacters(segmentID string, segment string, segmentPinyin string, segmentEnglish string, charData []translation.CharTranslation) error
 	GetCharacterReviewQueue(limit int) ([]translation.CharacterReviewCard, error)
 	GetCharacterDueCount() int
@@ -60,6 +63,14 @@ var jobQueue *queue.Manager
 var transProvider intelligence.TranslationProvider
 var chatProvider intelligence.ChatProvider
 
+var errDependenciesNotConfigured = errors.New("application dependencies are not configured")
+
+// dependenciesErr is computed once by ConfigureDependencies so request
+// handlers only read a cached result instead of re-checking every dependency.
+var dependenciesErr = errDependenciesNotConfigured
+
+// ConfigureDependencies wires the handler dependencies once at startup and
+// reports whether any of them is missing.
 func ConfigureDependencies(
 	ts translationStore,
 	cs chatStore,
@@ -68,7 +79,7 @@ func ConfigureDependencies(
 	manager *queue.Manager,
 	tp intelligence.TranslationProvider,
 	cp intelligence.ChatProvider,
-) {
+) error {
 	translations = ts
 	chats = cs
 	srs = ss
@@ -76,11 +87,14 @@ func ConfigureDependencies(
 	jobQueue = manager
 	transProvider = tp
 	chatProvider = cp
-}
 
-func validateDependencies() error {
+	dependenciesErr = nil
 	if translations == nil || chats == nil || srs == nil || profiles == nil || jobQueue == nil || transProvider == nil || chatProvider == nil {
-		return errors.New("application dependencies are not configured")
+		dependenciesErr = errDependenciesNotConfigured
 	}
-	return nil
+	return dependenciesErr
+}
+
+func validateDependencies() error {
+	return dependenciesErr
 }
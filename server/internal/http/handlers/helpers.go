@@ -1,17 +1,85 @@
 package handlers
 
 import (
+	"bytes"
 	"encoding/json"
+	"hash/fnv"
 	"net/http"
 	"strconv"
+	"strings"
+	"sync"
 
 	"github.com/go-chi/chi/v5"
 )
 
+const ndjsonContentType = "application/x-ndjson"
+
+// maxPooledJSONBuffer caps the size of buffers returned to jsonBufferPool so a
+// single large export does not pin its memory for the life of the process.
+const maxPooledJSONBuffer = 1 << 20
+
+var jsonBufferPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
+// WriteJSON encodes payload into a pooled buffer before writing, so the
+// response carries a Content-Length and is sent in a single write.
 func WriteJSON(w http.ResponseWriter, status int, payload any) {
+	writeJSON(w, nil, status, payload)
+}
+
+// writeJSONWithETag is WriteJSON for cacheable GET responses: it tags the body
+// with a weak ETag and answers 304 Not Modified without a body when the
+// request's If-None-Match already names it.
+func writeJSONWithETag(w http.ResponseWriter, r *http.Request, status int, payload any) {
+	writeJSON(w, r, status, payload)
+}
+
+func writeJSON(w http.ResponseWriter, r *http.Request, status int, payload any) {
+	buf := jsonBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledJSONBuffer {
+			jsonBufferPool.Put(buf)
+		}
+	}()
+
 	w.Header().Set("Content-Type", "application/json")
+	if err := json.NewEncoder(buf).Encode(payload); err != nil {
+		w.WriteHeader(http.StatusInternalServerError)
+		_, _ = w.Write([]byte(`{"detail":"Failed to encode response"}` + "\n"))
+		return
+	}
+	if r != nil {
+		hash := fnv.New64a()
+		_, _ = hash.Write(buf.Bytes())
+		etag := `W/"` + strconv.FormatUint(hash.Sum64(), 16) + `"`
+		w.Header().Set("ETag", etag)
+		w.Header().Set("Cache-Control", "private, no-cache")
+		if etagMatches(r.Header.Get("If-None-Match"), etag) {
+			w.Header().Del("Content-Type")
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+	}
+	w.Header().Set("Content-Length", strconv.Itoa(buf.Len()))
 	w.WriteHeader(status)
-	_ = json.NewEncoder(w).Encode(payload)
+	_, _ = w.Write(buf.Bytes())
+}
+
+// etagMatches applies the weak comparison used for If-None-Match.
+func etagMatches(ifNoneMatch string, etag string) bool {
+	if ifNoneMatch == "" {
+		return false
+	}
+	want := strings.TrimPrefix(etag, "W/")
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimSpace(candidate)
+		if candidate == "*" || strings.TrimPrefix(candidate, "W/") == want {
+			return true
+		}
+	}
+	return false
 }
 
 func NotImplementedJSON(w http.ResponseWriter) {
@@ -44,3 +112,8 @@ func preview(text string, max int) string {
 	}
 	return string(runes[:max]) + "..."
 }
+
+// acceptsNDJSON reports whether the client asked for newline-delimited JSON.
+func acceptsNDJSON(r *http.Request) bool {
+	return strings.Contains(r.Header.Get("Accept"), ndjsonContentType)
+}
@@ -1,6 +1,14 @@
 package handlers
 
-import "testing"
+import (
+	"net/http"
+	"net/http/httptest"
+	"strconv"
+	"testing"
+
+	"github.com/anath2/language-app/internal/queue"
+	"github.com/anath2/language-app/internal/translation"
+)
 
 func TestPreview(t *testing.T) {
 	tests := []struct {
@@ -50,3 +58,138 @@ func TestPreview(t *testing.T) {
 		})
 	}
 }
+
+func TestAcceptsNDJSON(t *testing.T) {
+	tests := []struct {
+		name   string
+		accept string
+		want   bool
+	}{
+		{name: "missing header", accept: "", want: false},
+		{name: "json only", accept: "application/json", want: false},
+		{name: "ndjson", accept: "application/x-ndjson", want: true},
+		{name: "ndjson in list", accept: "application/json, application/x-ndjson", want: true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest(http.MethodPost, "/", nil)
+			if tt.accept != "" {
+				req.Header.Set("Accept", tt.accept)
+			}
+			if got := acceptsNDJSON(req); got != tt.want {
+				t.Fatalf("acceptsNDJSON(%q) = %v, want %v", tt.accept, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestWriteJSONSetsContentLength(t *testing.T) {
+	res := httptest.NewRecorder()
+	WriteJSON(res, http.StatusCreated, map[string]string{"status": "ok"})
+
+	if res.Code != http.StatusCreated {
+		t.Fatalf("expected status %d, got %d", http.StatusCreated, res.Code)
+	}
+	body := res.Body.String()
+	if body != "{\"status\":\"ok\"}\n" {
+		t.Fatalf("unexpected body: %q", body)
+	}
+	if got := res.Header().Get("Content-Length"); got != strconv.Itoa(len(body)) {
+		t.Fatalf("expected Content-Length %d, got %q", len(body), got)
+	}
+}
+
+func TestWriteJSONEncodeFailure(t *testing.T) {
+	res := httptest.NewRecorder()
+	WriteJSON(res, http.StatusOK, map[string]any{"bad": make(chan int)})
+
+	if res.Code != http.StatusInternalServerError {
+		t.Fatalf("expected status %d, got %d", http.StatusInternalServerError, res.Code)
+	}
+}
+
+func TestEmitSSEFramesSingleEvent(t *testing.T) {
+	res := httptest.NewRecorder()
+	emitSSE(res, streamProgressEvent{
+		Type:    "progress",
+		Current: 1,
+		Total:   2,
+		Result:  queue.SegmentProgress{Segment: "你好", Pinyin: "nǐ hǎo", English: "hello"},
+	})
+
+	want := `data: {"type":"progress","current":1,"total":2,"result":{"segment":"你好","pinyin":"nǐ hǎo","english":"hello","index":0,"sentence_index":0}}` + "\n\n"
+	if got := res.Body.String(); got != want {
+		t.Fatalf("unexpected SSE frame:\n got %q\nwant %q", got, want)
+	}
+
+	res = httptest.NewRecorder()
+	emitSSE(res, map[string]any{"bad": make(chan int)})
+	if got := res.Body.String(); got != sseEncodeFailure {
+		t.Fatalf("expected encode failure event, got %q", got)
+	}
+}
+
+func TestStreamStartEventKeepsWireFormat(t *testing.T) {
+	res := httptest.NewRecorder()
+	emitSSE(res, streamStartEvent{
+		Type:          "start",
+		TranslationID: "t1",
+		Total:         2,
+		Sentences: sentenceInfo([]translation.SentenceResult{
+			{Translations: []translation.SegmentResult{{Segment: "你"}, {Segment: "好"}}, Indent: "  ", Separator: "\n"},
+		}),
+	})
+
+	want := `data: {"type":"start","translation_id":"t1","total":2,"sentences":[{"segment_count":2,"indent":"  ","separator":"\n"}],"fullTranslation":null}` + "\n\n"
+	if got := res.Body.String(); got != want {
+		t.Fatalf("unexpected SSE frame:\n got %q\nwant %q", got, want)
+	}
+}
+
+func TestWriteJSONWithETagReturnsNotModified(t *testing.T) {
+	payload := map[string]int{"due_count": 3}
+
+	first := httptest.NewRecorder()
+	writeJSONWithETag(first, httptest.NewRequest(http.MethodGet, "/", nil), http.StatusOK, payload)
+	etag := first.Header().Get("ETag")
+	if first.Code != http.StatusOK || etag == "" {
+		t.Fatalf("expected 200 with ETag, got %d etag=%q", first.Code, etag)
+	}
+
+	req := httptest.NewRequest(http.MethodGet, "/", nil)
+	req.Header.Set("If-None-Match", etag)
+	second := httptest.NewRecorder()
+	writeJSONWithETag(second, req, http.StatusOK, payload)
+	if second.Code != http.StatusNotModified {
+		t.Fatalf("expected 304, got %d", second.Code)
+	}
+	if second.Body.Len() != 0 {
+		t.Fatalf("expected empty 304 body, got %q", second.Body.String())
+	}
+
+	changed := httptest.NewRecorder()
+	writeJSONWithETag(changed, req, http.StatusOK, map[string]int{"due_count": 2})
+	if changed.Code != http.StatusOK {
+		t.Fatalf("expected 200 for changed payload, got %d", changed.Code)
+	}
+}
+
+func TestETagMatches(t *testing.T) {
+	tests := []struct {
+		header string
+		want   bool
+	}{
+		{header: "", want: false},
+		{header: `W/"abc"`, want: true},
+		{header: `"abc"`, want: true},
+		{header: `"xyz", W/"abc"`, want: true},
+		{header: `"xyz"`, want: false},
+		{header: "*", want: true},
+	}
+	for _, tt := range tests {
+		if got := etagMatches(tt.header, `W/"abc"`); got != tt.want {
+			t.Fatalf("etagMatches(%q) = %v, want %v", tt.header, got, tt.want)
+		}
+	}
+}
@@ -1,6 +1,15 @@
 package handlers
 
-import "net/http"
+import (
+	"errors"
+	"net/http"
+)
+
+const maxImageUploadBytes = 10 << 20
+
+// maxMultipartOverheadBytes leaves room for boundaries and part headers on
+// top of the image itself when capping the raw request body.
+const maxMultipartOverheadBytes = 64 << 10
 
 func ExtractText(w http.ResponseWriter, r *http.Request) {
 	if err := validateDependencies(); err != nil {
@@ -8,16 +17,28 @@ func ExtractText(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	if err := r.ParseMultipartForm(10 << 20); err != nil {
+	// Cap the body before parsing so an oversized upload is rejected as soon
+	// as the limit is crossed instead of being buffered or spooled to disk.
+	r.Body = http.MaxBytesReader(w, r.Body, maxImageUploadBytes+maxMultipartOverheadBytes)
+	if err := r.ParseMultipartForm(maxImageUploadBytes); err != nil {
+		var maxBytesErr *http.MaxBytesError
+		if errors.As(err, &maxBytesErr) {
+			WriteJSON(w, http.StatusRequestEntityTooLarge, map[string]string{"detail": "Image file too large"})
+			return
+		}
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid multipart payload"})
 		return
 	}
-	file, _, err := r.FormFile("image")
+	file, header, err := r.FormFile("image")
 	if err != nil {
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Image file is required"})
 		return
 	}
 	_ = file.Close()
+	if header.Size > maxImageUploadBytes {
+		WriteJSON(w, http.StatusRequestEntityTooLarge, map[string]string{"detail": "Image file too large"})
+		return
+	}
 
 	// Intelligence layer deferred: return stable contract-compatible placeholder.
 	WriteJSON(w, http.StatusOK, map[string]string{"text": ""})
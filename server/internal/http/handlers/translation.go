@@ -1,14 +1,17 @@
 package handlers
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"errors"
-	"fmt"
+	"io"
 	"net/http"
 	"strings"
 	"time"
 
+	"github.com/anath2/language-app/internal/intelligence"
+	"github.com/anath2/language-app/internal/queue"
 	"github.com/anath2/language-app/internal/translation"
 )
 
@@ -65,11 +68,9 @@ type translateSentenceSegmentsRequest struct {
 	SentenceIdx   *int     `json:"sentence_idx"`
 }
 
-type translationResult struct {
-	Segment string `json:"segment"`
-	Pinyin  string `json:"pinyin"`
-	English string `json:"english"`
-}
+// translationResult is the store's SegmentResult, which already has the
+// response's JSON shape, so provider results are written out without copying.
+type translationResult = translation.SegmentResult
 
 type translateSentenceSegmentsResponse struct {
 	Translations []translationResult `json:"translations"`
@@ -85,30 +86,27 @@ func TranslateSentenceSegments(w http.ResponseWriter, r *http.Request) {
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid JSON payload"})
 		return
 	}
-	results := make([]translationResult, 0, len(req.Segments))
 	sentenceText := strings.Join(req.Segments, "")
-	segmentResults, err := transProvider.TranslateSentenceSegments(r.Context(), req.Segments, sentenceText, derefOr(req.FullText, ""))
+	ctx := intelligence.RejectWhenBusy(r.Context())
+	segmentResults, err := transProvider.TranslateSentenceSegments(ctx, req.Segments, sentenceText, derefOr(req.FullText, ""))
+	if errors.Is(err, intelligence.ErrUpstreamBusy) {
+		WriteJSON(w, http.StatusTooManyRequests, map[string]string{"detail": err.Error()})
+		return
+	}
 	if err != nil {
 		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": err.Error()})
 		return
 	}
-	storeSegments := make([]translation.SegmentResult, 0, len(segmentResults))
-	for _, translated := range segmentResults {
-		item := translationResult{
-			Segment: translated.Segment,
-			Pinyin:  translated.Pinyin,
-			English: translated.English,
-		}
-		results = append(results, item)
-		storeSegments = append(storeSegments, translated)
-	}
 	if req.TranslationID != nil && req.SentenceIdx != nil {
-		if err := translations.UpdateTranslationSegments(*req.TranslationID, *req.SentenceIdx, storeSegments); err != nil {
+		if err := translations.UpdateTranslationSegments(*req.TranslationID, *req.SentenceIdx, segmentResults); err != nil {
 			WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": err.Error()})
 			return
 		}
 	}
-	WriteJSON(w, http.StatusOK, translateSentenceSegmentsResponse{Translations: results})
+	if segmentResults == nil {
+		segmentResults = []translationResult{}
+	}
+	WriteJSON(w, http.StatusOK, translateSentenceSegmentsResponse{Translations: segmentResults})
 }
 
 func CreateTranslation(w http.ResponseWriter, r *http.Request) {
@@ -188,7 +186,7 @@ func GetTranslation(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	WriteJSON(w, http.StatusOK, translationDetailResponse{
+	writeJSONWithETag(w, r, http.StatusOK, translationDetailResponse{
 		ID:              item.ID,
 		CreatedAt:       item.CreatedAt,
 		Status:          item.Status,
@@ -323,20 +321,20 @@ func TranslationStream(w http.ResponseWriter, r *http.Request) {
 
 	flusher, ok := w.(http.Flusher)
 	if !ok {
-		emitSSE(w, map[string]any{"type": "error", "message": "Streaming is not supported"})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: "Streaming is not supported"})
 		return
 	}
 
 	translationID := pathParam(r, "translation_id")
 	item, exists := translations.Get(translationID)
 	if !exists {
-		emitSSE(w, map[string]any{"type": "error", "message": "Translation not found"})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: "Translation not found"})
 		flusher.Flush()
 		return
 	}
 
 	if item.Status == "failed" {
-		emitSSE(w, map[string]any{"type": "error", "message": derefOr(item.ErrorMessage, "Translation failed")})
+		emitSSE(w, streamErrorEvent{Type: "error", Message: derefOr(item.ErrorMessage, "Translation failed")})
 		flusher.Flush()
 		return
 	}
@@ -355,6 +353,7 @@ func streamLiveProgress(ctx context.Context, w http.ResponseWriter, flusher http
 	defer ticker.Stop()
 
 	startSent := false
+	fullTranslationSent := false
 	lastProgress := 0
 
 	for {
@@ -364,58 +363,63 @@ func streamLiveProgress(ctx context.Context, w http.ResponseWriter, flusher http
 		case <-ticker.C:
 			item, exists := translations.Get(translationID)
 			if !exists {
-				emitSSE(w, map[string]any{"type": "error", "message": "Translation not found"})
+				emitSSE(w, streamErrorEvent{Type: "error", Message: "Translation not found"})
 				flusher.Flush()
 				return
 			}
 
 			if item.Status == "failed" {
-				emitSSE(w, map[string]any{"type": "error", "message": derefOr(item.ErrorMessage, "Translation failed")})
+				emitSSE(w, streamErrorEvent{Type: "error", Message: derefOr(item.ErrorMessage, "Translation failed")})
 				flusher.Flush()
 				return
 			}
 
-			progress, ok := jobQueue.GetProgress(translationID)
+			progress, ok := jobQueue.GetProgressSince(translationID, lastProgress)
 			if !ok {
 				continue
 			}
 
 			if !startSent && progress.Total > 0 {
-				emitSSE(w, map[string]any{
-					"type":            "start",
-					"translation_id":  translationID,
-					"total":           progress.Total,
-					"sentences":       sentenceInfo(item.Sentences),
-					"fullTranslation": item.FullTranslation,
+				emitSSE(w, streamStartEvent{
+					Type:            "start",
+					TranslationID:   translationID,
+					Total:           progress.Total,
+					Sentences:       sentenceInfo(item.Sentences),
+					FullTranslation: item.FullTranslation,
 				})
 				flusher.Flush()
 				startSent = true
+				fullTranslationSent = item.FullTranslation != nil
 			}
 
-			for i := lastProgress; i < len(progress.Results); i++ {
-				result := progress.Results[i]
-				emitSSE(w, map[string]any{
-					"type":    "progress",
-					"current": i + 1,
-					"total":   progress.Total,
-					"result": map[string]any{
-						"segment":        result.Segment,
-						"pinyin":         result.Pinyin,
-						"english":        result.English,
-						"index":          result.Index,
-						"sentence_index": result.SentenceIndex,
-					},
+			// The full translation is produced alongside segment translation,
+			// so it may land after start; forward it as soon as it exists.
+			if startSent && !fullTranslationSent && item.FullTranslation != nil {
+				emitSSE(w, streamFullTranslationEvent{
+					Type:            "full_translation",
+					FullTranslation: item.FullTranslation,
+				})
+				flusher.Flush()
+				fullTranslationSent = true
+			}
+
+			for _, result := range progress.Results {
+				lastProgress++
+				emitSSE(w, streamProgressEvent{
+					Type:    "progress",
+					Current: lastProgress,
+					Total:   progress.Total,
+					Result:  result,
 				})
 				flusher.Flush()
 			}
-			lastProgress = len(progress.Results)
 
 			if progress.Status == "completed" || item.Status == "completed" {
 				fresh, _ := translations.Get(translationID)
-				emitSSE(w, map[string]any{
-					"type":            "complete",
-					"sentences":       fresh.Sentences,
-					"fullTranslation": fresh.FullTranslation,
+				emitSSE(w, streamCompleteEvent{
+					Type:            "complete",
+					Sentences:       fresh.Sentences,
+					FullTranslation: fresh.FullTranslation,
 				})
 				flusher.Flush()
 				return
@@ -425,12 +429,12 @@ func streamLiveProgress(ctx context.Context, w http.ResponseWriter, flusher http
 }
 
 func replayCompletedStream(w http.ResponseWriter, flusher http.Flusher, item translation.Translation) {
-	emitSSE(w, map[string]any{
-		"type":            "start",
-		"translation_id":  item.ID,
-		"total":           item.Total,
-		"sentences":       sentenceInfo(item.Sentences),
-		"fullTranslation": item.FullTranslation,
+	emitSSE(w, streamStartEvent{
+		Type:            "start",
+		TranslationID:   item.ID,
+		Total:           item.Total,
+		Sentences:       sentenceInfo(item.Sentences),
+		FullTranslation: item.FullTranslation,
 	})
 	flusher.Flush()
 
@@ -438,46 +442,102 @@ func replayCompletedStream(w http.ResponseWriter, flusher http.Flusher, item tra
 	for sentenceIdx, sent := range item.Sentences {
 		for _, seg := range sent.Translations {
 			current++
-			emitSSE(w, map[string]any{
-				"type":    "progress",
-				"current": current,
-				"total":   item.Total,
-				"result": map[string]any{
-					"segment":        seg.Segment,
-					"pinyin":         seg.Pinyin,
-					"english":        seg.English,
-					"index":          current - 1,
-					"sentence_index": sentenceIdx,
+			emitSSE(w, streamProgressEvent{
+				Type:    "progress",
+				Current: current,
+				Total:   item.Total,
+				Result: queue.SegmentProgress{
+					Segment:       seg.Segment,
+					Pinyin:        seg.Pinyin,
+					English:       seg.English,
+					Index:         current - 1,
+					SentenceIndex: sentenceIdx,
 				},
 			})
 			flusher.Flush()
 		}
 	}
 
-	emitSSE(w, map[string]any{
-		"type":            "complete",
-		"sentences":       item.Sentences,
-		"fullTranslation": item.FullTranslation,
+	emitSSE(w, streamCompleteEvent{
+		Type:            "complete",
+		Sentences:       item.Sentences,
+		FullTranslation: item.FullTranslation,
 	})
 	flusher.Flush()
 }
 
+// streamProgressEvent is the per-segment SSE event. It is a struct rather
+// than a map because it is sent once per segment: encoding/json caches the
+// struct's field encoders and skips sorting map keys.
+type streamProgressEvent struct {
+	Type    string                `json:"type"`
+	Current int                   `json:"current"`
+	Total   int                   `json:"total"`
+	Result  queue.SegmentProgress `json:"result"`
+}
+
+// The remaining translation stream events are typed for the same reason; each
+// stream sends them once, but they carry a per-sentence entry for the whole text.
+type streamStartEvent struct {
+	Type            string               `json:"type"`
+	TranslationID   string               `json:"translation_id"`
+	Total           int                  `json:"total"`
+	Sentences       []streamSentenceInfo `json:"sentences"`
+	FullTranslation *string              `json:"fullTranslation"`
+}
+
+type streamSentenceInfo struct {
+	SegmentCount int    `json:"segment_count"`
+	Indent       string `json:"indent"`
+	Separator    string `json:"separator"`
+}
+
+type streamFullTranslationEvent struct {
+	Type            string  `json:"type"`
+	FullTranslation *string `json:"fullTranslation"`
+}
+
+type streamCompleteEvent struct {
+	Type            string                       `json:"type"`
+	Sentences       []translation.SentenceResult `json:"sentences"`
+	FullTranslation *string                      `json:"fullTranslation"`
+}
+
+type streamErrorEvent struct {
+	Type    string `json:"type"`
+	Message string `json:"message"`
+}
+
+const sseEncodeFailure = "data: {\"type\":\"error\",\"message\":\"Failed to encode SSE payload\"}\n\n"
+
+// emitSSE frames payload as a single SSE data event, encoding into a pooled
+// buffer and handing it to the writer in one call.
 func emitSSE(w http.ResponseWriter, payload any) {
-	data, err := json.Marshal(payload)
-	if err != nil {
-		_, _ = fmt.Fprint(w, "data: {\"type\":\"error\",\"message\":\"Failed to encode SSE payload\"}\n\n")
+	buf := jsonBufferPool.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer func() {
+		if buf.Cap() <= maxPooledJSONBuffer {
+			jsonBufferPool.Put(buf)
+		}
+	}()
+
+	buf.WriteString("data: ")
+	// Encode terminates the JSON with a newline; one more ends the event.
+	if err := json.NewEncoder(buf).Encode(payload); err != nil {
+		_, _ = io.WriteString(w, sseEncodeFailure)
 		return
 	}
-	_, _ = fmt.Fprintf(w, "data: %s\n\n", data)
+	buf.WriteByte('\n')
+	_, _ = w.Write(buf.Bytes())
 }
 
-func sentenceInfo(sentences []translation.SentenceResult) []map[string]any {
-	out := make([]map[string]any, 0, len(sentences))
+func sentenceInfo(sentences []translation.SentenceResult) []streamSentenceInfo {
+	out := make([]streamSentenceInfo, 0, len(sentences))
 	for _, sentence := range sentences {
-		out = append(out, map[string]any{
-			"segment_count": len(sentence.Translations),
-			"indent":        sentence.Indent,
-			"separator":     sentence.Separator,
+		out = append(out, streamSentenceInfo{
+			SegmentCount: len(sentence.Translations),
+			Indent:       sentence.Indent,
+			Separator:    sentence.Separator,
 		})
 	}
 	return out
@@ -41,6 +41,17 @@ type recordLookupResponse struct {
 	IsStruggling bool    `json:"is_struggling"`
 }
 
+type recordLookupsRequest struct {
+	SegmentIDs []string `json:"segment_ids"`
+}
+
+type recordLookupsResponse struct {
+	Items []recordLookupResponse `json:"items"`
+}
+
+// maxLookupBatchSize bounds how many lookups one batch request may record.
+const maxLookupBatchSize = 500
+
 type vocabSRSInfoResponse struct {
 	SegmentID    string  `json:"segment_id"`
 	Headword     string  `json:"headword"`
@@ -177,6 +188,40 @@ func RecordLookup(w http.ResponseWriter, r *http.Request) {
 	})
 }
 
+// RecordLookups records many lookups in one request and one transaction, so
+// clients can buffer lookups and flush them together.
+func RecordLookups(w http.ResponseWriter, r *http.Request) {
+	if err := validateDependencies(); err != nil {
+		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
+		return
+	}
+
+	var req recordLookupsRequest
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Invalid JSON payload"})
+		return
+	}
+	if len(req.SegmentIDs) > maxLookupBatchSize {
+		WriteJSON(w, http.StatusBadRequest, map[string]string{"detail": "Too many segment_ids in one batch"})
+		return
+	}
+
+	infos, err := srs.RecordLookups(req.SegmentIDs)
+	if err != nil {
+		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
+		return
+	}
+	items := make([]recordLookupResponse, 0, len(infos))
+	for _, info := range infos {
+		items = append(items, recordLookupResponse{
+			SegmentID:    info.SegmentID,
+			Opacity:      info.Opacity,
+			IsStruggling: info.IsStruggling,
+		})
+	}
+	WriteJSON(w, http.StatusOK, recordLookupsResponse{Items: items})
+}
+
 func GetVocabSRSInfo(w http.ResponseWriter, r *http.Request) {
 	if err := validateDependencies(); err != nil {
 		WriteJSON(w, http.StatusInternalServerError, map[string]string{"detail": err.Error()})
@@ -231,7 +276,7 @@ func GetReviewQueue(w http.ResponseWriter, r *http.Request) {
 			Snippets:  c.Snippets,
 		})
 	}
-	WriteJSON(w, http.StatusOK, reviewQueueResponse{
+	writeJSONWithETag(w, r, http.StatusOK, reviewQueueResponse{
 		Cards:    respCards,
 		DueCount: srs.GetSegmentDueCount(),
 	})
@@ -313,7 +358,7 @@ func GetCharacterReviewQueue(w http.ResponseWriter, r *http.Request) {
 			ExampleSegments: examples,
 		})
 	}
-	WriteJSON(w, http.StatusOK, characterReviewQueueResponse{
+	writeJSONWithETag(w, r, http.StatusOK, characterReviewQueueResponse{
 		Cards:    respCards,
 		DueCount: srs.GetCharacterDueCount(),
 	})
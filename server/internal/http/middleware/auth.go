@@ -6,9 +6,12 @@ import (
 	"crypto/subtle"
 	"encoding/base64"
 	"encoding/json"
+	"hash"
+	"io"
 	"net"
 	"net/http"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/anath2/language-app/internal/config"
@@ -16,6 +19,19 @@ import (
 
 const sessionCookieName = "session"
 
+// Verified session tokens are remembered for up to verifiedSessionTTL (never
+// past the session's own expiry) so the middleware skips the HMAC and payload
+// decode on repeat requests. Entries are keyed by the token's signature part,
+// which already identifies the session, and store the payload it was verified
+// against so a hit still requires the whole token to match.
+const verifiedSessionTTL = 30 * time.Second
+const maxVerifiedSessions = 10000
+
+type verifiedSession struct {
+	payload   string
+	expiresAt time.Time
+}
+
 type sessionPayload struct {
 	Authenticated bool  `json:"authenticated"`
 	CreatedAtUnix int64 `json:"created_at_unix"`
@@ -25,14 +41,25 @@ type SessionManager struct {
 	secretKey            []byte
 	sessionMaxAgeSeconds int
 	secureCookies        bool
+	// macs holds keyed HMAC-SHA256 states so verifying a cookie on every
+	// request does not rebuild the inner and outer key pads each time.
+	macs sync.Pool
+
+	verifiedMu sync.RWMutex
+	verified   map[string]verifiedSession // encoded signature -> verified session
 }
 
 func NewSessionManager(cfg config.Config) *SessionManager {
-	return &SessionManager{
+	sm := &SessionManager{
 		secretKey:            []byte(cfg.AppSecretKey),
 		sessionMaxAgeSeconds: cfg.SessionMaxAgeSeconds,
 		secureCookies:        cfg.SecureCookies,
+		verified:             make(map[string]verifiedSession),
+	}
+	sm.macs.New = func() any {
+		return hmac.New(sha256.New, sm.secretKey)
 	}
+	return sm
 }
 
 func (sm *SessionManager) VerifyPassword(input string, expected string) bool {
@@ -63,6 +90,9 @@ func (sm *SessionManager) SetSessionCookie(w http.ResponseWriter, r *http.Reques
 }
 
 func (sm *SessionManager) ClearSessionCookie(w http.ResponseWriter, r *http.Request) {
+	if cookie, err := r.Cookie(sessionCookieName); err == nil && cookie.Value != "" {
+		sm.forgetVerified(cookie.Value)
+	}
 	http.SetCookie(w, &http.Cookie{
 		Name:     sessionCookieName,
 		Value:    "",
@@ -79,7 +109,59 @@ func (sm *SessionManager) VerifySessionFromRequest(r *http.Request) bool {
 	if err != nil || cookie.Value == "" {
 		return false
 	}
-	return sm.verifyToken(cookie.Value)
+	return sm.verifyTokenCached(cookie.Value)
+}
+
+func (sm *SessionManager) verifyTokenCached(token string) bool {
+	payloadEncoded, signatureEncoded, ok := strings.Cut(token, ".")
+	if !ok {
+		return false
+	}
+	now := time.Now()
+
+	sm.verifiedMu.RLock()
+	entry, ok := sm.verified[signatureEncoded]
+	sm.verifiedMu.RUnlock()
+	if ok && entry.payload == payloadEncoded && now.Before(entry.expiresAt) {
+		return true
+	}
+
+	sessionExpiresAt, valid := sm.verifyTokenExpiry(token)
+	if !valid {
+		return false
+	}
+	expiresAt := now.Add(verifiedSessionTTL)
+	if sessionExpiresAt.Before(expiresAt) {
+		expiresAt = sessionExpiresAt
+	}
+
+	sm.verifiedMu.Lock()
+	if len(sm.verified) >= maxVerifiedSessions {
+		for sig, e := range sm.verified {
+			if now.After(e.expiresAt) {
+				delete(sm.verified, sig)
+			}
+		}
+		if len(sm.verified) >= maxVerifiedSessions {
+			clear(sm.verified)
+		}
+	}
+	sm.verified[strings.Clone(signatureEncoded)] = verifiedSession{
+		payload:   strings.Clone(payloadEncoded),
+		expiresAt: expiresAt,
+	}
+	sm.verifiedMu.Unlock()
+	return true
+}
+
+func (sm *SessionManager) forgetVerified(token string) {
+	_, signatureEncoded, ok := strings.Cut(token, ".")
+	if !ok {
+		return
+	}
+	sm.verifiedMu.Lock()
+	delete(sm.verified, signatureEncoded)
+	sm.verifiedMu.Unlock()
 }
 
 func (sm *SessionManager) signPayload(payload sessionPayload) (string, error) {
@@ -88,50 +170,59 @@ func (sm *SessionManager) signPayload(payload sessionPayload) (string, error) {
 		return "", err
 	}
 	payloadEncoded := base64.RawURLEncoding.EncodeToString(payloadBytes)
-	signature := sm.signature(payloadEncoded)
-	signatureEncoded := base64.RawURLEncoding.EncodeToString(signature)
+	var sigBuf [sha256.Size]byte
+	signatureEncoded := base64.RawURLEncoding.EncodeToString(sm.signature(sigBuf[:0], payloadEncoded))
 	return payloadEncoded + "." + signatureEncoded, nil
 }
 
-func (sm *SessionManager) verifyToken(token string) bool {
-	parts := strings.Split(token, ".")
-	if len(parts) != 2 {
-		return false
+// verifyTokenExpiry checks the token's signature and payload and reports when
+// the session expires. The signature check works in fixed-size stack buffers
+// and only a correctly signed payload is decoded.
+func (sm *SessionManager) verifyTokenExpiry(token string) (time.Time, bool) {
+	payloadEncoded, signatureEncoded, ok := strings.Cut(token, ".")
+	if !ok || strings.Contains(signatureEncoded, ".") {
+		return time.Time{}, false
 	}
-
-	payloadEncoded := parts[0]
-	expectedSignature := sm.signature(payloadEncoded)
-
-	providedSignature, err := base64.RawURLEncoding.DecodeString(parts[1])
-	if err != nil {
-		return false
+	if base64.RawURLEncoding.DecodedLen(len(signatureEncoded)) != sha256.Size {
+		return time.Time{}, false
 	}
 
-	if subtle.ConstantTimeCompare(providedSignature, expectedSignature) != 1 {
-		return false
+	var provided, expected [sha256.Size]byte
+	if _, err := base64.RawURLEncoding.Decode(provided[:], []byte(signatureEncoded)); err != nil {
+		return time.Time{}, false
+	}
+	if subtle.ConstantTimeCompare(provided[:], sm.signature(expected[:0], payloadEncoded)) != 1 {
+		return time.Time{}, false
 	}
 
 	payloadBytes, err := base64.RawURLEncoding.DecodeString(payloadEncoded)
 	if err != nil {
-		return false
+		return time.Time{}, false
 	}
 
 	var payload sessionPayload
 	if err := json.Unmarshal(payloadBytes, &payload); err != nil {
-		return false
+		return time.Time{}, false
 	}
 	if !payload.Authenticated {
-		return false
+		return time.Time{}, false
 	}
 
 	age := time.Now().UTC().Unix() - payload.CreatedAtUnix
-	return age >= 0 && age <= int64(sm.sessionMaxAgeSeconds)
+	if age < 0 || age > int64(sm.sessionMaxAgeSeconds) {
+		return time.Time{}, false
+	}
+	return time.Unix(payload.CreatedAtUnix+int64(sm.sessionMaxAgeSeconds), 0), true
 }
 
-func (sm *SessionManager) signature(payloadEncoded string) []byte {
-	mac := hmac.New(sha256.New, sm.secretKey)
-	mac.Write([]byte(payloadEncoded))
-	return mac.Sum(nil)
+// signature appends the HMAC of payloadEncoded to dst.
+func (sm *SessionManager) signature(dst []byte, payloadEncoded string) []byte {
+	mac := sm.macs.Get().(hash.Hash)
+	mac.Reset()
+	_, _ = io.WriteString(mac, payloadEncoded)
+	dst = mac.Sum(dst)
+	sm.macs.Put(mac)
+	return dst
 }
 
 func (sm *SessionManager) cookieShouldBeSecure(r *http.Request) bool {
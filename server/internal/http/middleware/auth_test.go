@@ -0,0 +1,136 @@
+package middleware
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/anath2/language-app/internal/config"
+)
+
+func newTestSessionManager() *SessionManager {
+	return NewSessionManager(config.Config{AppSecretKey: "secret", SessionMaxAgeSeconds: 3600})
+}
+
+func TestVerifyTokenAcceptsSignedSession(t *testing.T) {
+	sm := newTestSessionManager()
+	token, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	for i := 0; i < 3; i++ { // pooled MAC state must reset between uses
+		if _, ok := sm.verifyTokenExpiry(token); !ok {
+			t.Fatalf("verify %d: expected signed token to verify", i)
+		}
+	}
+}
+
+func TestVerifyTokenRejectsInvalidTokens(t *testing.T) {
+	sm := newTestSessionManager()
+	valid, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	expired, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Add(-2 * time.Hour).Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	unauthenticated, err := sm.signPayload(sessionPayload{CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	otherKey, err := NewSessionManager(config.Config{AppSecretKey: "other", SessionMaxAgeSeconds: 3600}).
+		signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	payload, signature, _ := strings.Cut(valid, ".")
+
+	for name, token := range map[string]string{
+		"empty":             "",
+		"no signature":      payload,
+		"extra part":        valid + ".x",
+		"short signature":   payload + "." + signature[:10],
+		"bad base64":        payload + "." + strings.Repeat("*", len(signature)),
+		"tampered payload":  "e30." + signature,
+		"expired":           expired,
+		"not authenticated": unauthenticated,
+		"wrong key":         otherKey,
+	} {
+		if _, ok := sm.verifyTokenExpiry(token); ok {
+			t.Errorf("%s: expected token to be rejected", name)
+		}
+	}
+}
+
+func TestVerifySessionFromRequestCachesUntilCleared(t *testing.T) {
+	sm := newTestSessionManager()
+	token, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	req := httptest.NewRequest(http.MethodGet, "/api/translations", nil)
+	req.AddCookie(&http.Cookie{Name: sessionCookieName, Value: token})
+
+	if !sm.VerifySessionFromRequest(req) {
+		t.Fatal("expected signed session to verify")
+	}
+	if len(sm.verified) != 1 {
+		t.Fatalf("expected verified session to be cached, got %d entries", len(sm.verified))
+	}
+	if !sm.VerifySessionFromRequest(req) {
+		t.Fatal("expected cached session to verify")
+	}
+
+	sm.ClearSessionCookie(httptest.NewRecorder(), req)
+	if len(sm.verified) != 0 {
+		t.Fatalf("expected logout to drop cached session, got %d entries", len(sm.verified))
+	}
+}
+
+func TestVerifyTokenCachedRejectsCachedSignatureWithOtherPayload(t *testing.T) {
+	sm := newTestSessionManager()
+	token, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		t.Fatalf("sign payload: %v", err)
+	}
+	if !sm.verifyTokenCached(token) {
+		t.Fatal("expected signed token to verify")
+	}
+	_, signature, _ := strings.Cut(token, ".")
+	if sm.verifyTokenCached("e30." + signature) {
+		t.Fatal("expected a cached signature paired with another payload to be rejected")
+	}
+}
+
+func benchmarkSessionToken(b *testing.B) (*SessionManager, string) {
+	b.Helper()
+	sm := newTestSessionManager()
+	token, err := sm.signPayload(sessionPayload{Authenticated: true, CreatedAtUnix: time.Now().UTC().Unix()})
+	if err != nil {
+		b.Fatalf("sign payload: %v", err)
+	}
+	return sm, token
+}
+
+func BenchmarkVerifyTokenExpiry(b *testing.B) {
+	sm, token := benchmarkSessionToken(b)
+	b.ReportAllocs()
+	b.RunParallel(func(pb *testing.PB) {
+		for pb.Next() {
+			sm.verifyTokenExpiry(token)
+		}
+	})
+}
+
+func BenchmarkVerifyTokenCached(b *testing.B) {
+	sm, token := benchmarkSessionToken(b)
+	b.ReportAllocs()
+	b.RunParallel(func(pb *testing.PB) {
+		for pb.Next() {
+			sm.verifyTokenCached(token)
+		}
+	})
+}
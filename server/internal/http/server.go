@@ -11,6 +11,7 @@ import (
 	"github.com/anath2/language-app/internal/http/handlers"
 	"github.com/anath2/language-app/internal/http/middleware"
 	"github.com/anath2/language-app/internal/http/routes"
+	"github.com/anath2/language-app/internal/intelligence"
 	ilchat "github.com/anath2/language-app/internal/intelligence/chat"
 	iltrans "github.com/anath2/language-app/internal/intelligence/translation"
 	"github.com/anath2/language-app/internal/migrations"
@@ -62,14 +63,17 @@ func initDependencies(cfg config.Config) error {
 	srsStore := translation.NewSRSStore(db)
 	profileStore := translation.NewProfileStore(db)
 
-	translationProv, err := iltrans.NewProvider(cfg)
+	upstreamLimiter := intelligence.NewLimiter(cfg.LLMConcurrency)
+	translationProv, err := iltrans.NewProvider(cfg, upstreamLimiter)
 	if err != nil {
 		return fmt.Errorf("initialize translation provider: %w", err)
 	}
-	chatProv := ilchat.New(cfg)
+	chatProv := ilchat.New(cfg, upstreamLimiter)
 
-	manager := queue.NewManager(translationStore, translationProv)
-	handlers.ConfigureDependencies(translationStore, chatStore, srsStore, profileStore, manager, translationProv, chatProv)
+	manager := queue.NewManager(translationStore, translationProv, cfg.JobConcurrency)
+	if err := handlers.ConfigureDependencies(translationStore, chatStore, srsStore, profileStore, manager, translationProv, chatProv); err != nil {
+		return fmt.Errorf("configure handlers: %w", err)
+	}
 	manager.ResumeRestartableJobs()
 	manager.StartBackgroundScanner(context.Background())
 
@@ -111,6 +115,49 @@ func initializationErrorHandler(err error) stdhttp.Handler {
 	})
 }
 
-func ListenAndServe(addr string, cfg config.Config) error {
-	return stdhttp.ListenAndServe(addr, NewRouter(cfg))
+// Server timeouts. There is deliberately no WriteTimeout: SSE streams stay open
+// for as long as a translation or chat reply is running, and non-stream
+// handlers are already bounded by TimeoutUnlessStream.
+const (
+	readHeaderTimeout = 10 * time.Second
+	readTimeout       = 60 * time.Second
+	idleTimeout       = 120 * time.Second
+	shutdownTimeout   = 15 * time.Second
+)
+
+// NewServer returns the production HTTP server. Requests are served on their
+// own goroutines across all GOMAXPROCS, so a single process uses every core;
+// keep-alive connections are reused until idleTimeout.
+func NewServer(addr string, cfg config.Config) *stdhttp.Server {
+	return &stdhttp.Server{
+		Addr:              addr,
+		Handler:           NewRouter(cfg),
+		ReadHeaderTimeout: readHeaderTimeout,
+		ReadTimeout:       readTimeout,
+		IdleTimeout:       idleTimeout,
+	}
+}
+
+// ListenAndServe serves until ctx is cancelled, then drains in-flight requests
+// for up to shutdownTimeout before returning.
+func ListenAndServe(ctx context.Context, addr string, cfg config.Config) error {
+	srv := NewServer(addr, cfg)
+
+	errc := make(chan error, 1)
+	go func() {
+		errc <- srv.ListenAndServe()
+	}()
+
+	select {
+	case err := <-errc:
+		return err
+	case <-ctx.Done():
+	}
+
+	shutdownCtx, cancel := context.WithTimeout(context.Background(), shutdownTimeout)
+	defer cancel()
+	if err := srv.Shutdown(shutdownCtx); err != nil {
+		return fmt.Errorf("shutdown: %w", err)
+	}
+	return nil
 }
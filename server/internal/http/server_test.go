@@ -104,6 +104,7 @@ func TestRouteContractWithAuthenticatedSession(t *testing.T) {
 		{name: "save vocab", method: http.MethodPost, path: "/api/vocab/save", status: http.StatusBadRequest},
 		{name: "update vocab status", method: http.MethodPost, path: "/api/vocab/status", status: http.StatusBadRequest},
 		{name: "lookup vocab", method: http.MethodPost, path: "/api/vocab/lookup", status: http.StatusBadRequest},
+		{name: "lookup vocab batch", method: http.MethodPost, path: "/api/vocab/lookup/batch", status: http.StatusBadRequest},
 		{name: "vocab srs info", method: http.MethodGet, path: "/api/vocab/srs-info", status: http.StatusOK},
 		{name: "review queue", method: http.MethodGet, path: "/api/review/words/queue", status: http.StatusOK},
 		{name: "review answer", method: http.MethodPost, path: "/api/review/answer", status: http.StatusBadRequest},
@@ -415,6 +416,40 @@ func TestAdminAndOCRContracts(t *testing.T) {
 		t.Fatalf("expected export progress status 200, got %d", exportRes.Code)
 	}
 
+	var importBody bytes.Buffer
+	importWriter := multipart.NewWriter(&importBody)
+	importPart, err := importWriter.CreateFormFile("file", "language_app_progress.json")
+	if err != nil {
+		t.Fatalf("create form file: %v", err)
+	}
+	_, _ = importPart.Write(exportRes.Body.Bytes())
+	_ = importWriter.Close()
+	importReq := httptest.NewRequest(http.MethodPost, "/api/admin/progress/import", &importBody)
+	importReq.Header.Set("Cookie", sessionCookie)
+	importReq.Header.Set("Content-Type", importWriter.FormDataContentType())
+	importRes := httptest.NewRecorder()
+	router.ServeHTTP(importRes, importReq)
+	if importRes.Code != http.StatusOK {
+		t.Fatalf("expected import progress status 200, got %d: %s", importRes.Code, importRes.Body.String())
+	}
+
+	var oversizedImport bytes.Buffer
+	oversizedImportWriter := multipart.NewWriter(&oversizedImport)
+	oversizedImportPart, err := oversizedImportWriter.CreateFormFile("file", "huge.json")
+	if err != nil {
+		t.Fatalf("create form file: %v", err)
+	}
+	_, _ = oversizedImportPart.Write(bytes.Repeat([]byte(" "), 2<<20))
+	_ = oversizedImportWriter.Close()
+	oversizedImportReq := httptest.NewRequest(http.MethodPost, "/api/admin/progress/import", &oversizedImport)
+	oversizedImportReq.Header.Set("Cookie", sessionCookie)
+	oversizedImportReq.Header.Set("Content-Type", oversizedImportWriter.FormDataContentType())
+	oversizedImportRes := httptest.NewRecorder()
+	router.ServeHTTP(oversizedImportRes, oversizedImportReq)
+	if oversizedImportRes.Code != http.StatusRequestEntityTooLarge {
+		t.Fatalf("expected oversized progress import status 413, got %d", oversizedImportRes.Code)
+	}
+
 	// OCR contract: multipart image accepted and returns text payload.
 	var body bytes.Buffer
 	writer := multipart.NewWriter(&body)
@@ -433,6 +468,24 @@ func TestAdminAndOCRContracts(t *testing.T) {
 	if ocrRes.Code != http.StatusOK {
 		t.Fatalf("expected ocr extract-text status 200, got %d", ocrRes.Code)
 	}
+
+	var oversized bytes.Buffer
+	oversizedWriter := multipart.NewWriter(&oversized)
+	oversizedPart, err := oversizedWriter.CreateFormFile("image", "huge.png")
+	if err != nil {
+		t.Fatalf("create form file: %v", err)
+	}
+	_, _ = oversizedPart.Write(bytes.Repeat([]byte{0xff}, 11<<20))
+	_ = oversizedWriter.Close()
+
+	oversizedReq := httptest.NewRequest(http.MethodPost, "/api/ocr/extract-text", &oversized)
+	oversizedReq.Header.Set("Cookie", sessionCookie)
+	oversizedReq.Header.Set("Content-Type", oversizedWriter.FormDataContentType())
+	oversizedRes := httptest.NewRecorder()
+	router.ServeHTTP(oversizedRes, oversizedReq)
+	if oversizedRes.Code != http.StatusRequestEntityTooLarge {
+		t.Fatalf("expected oversized ocr upload status 413, got %d", oversizedRes.Code)
+	}
 }
 
 func TestTranslationSSENotFound(t *testing.T) {
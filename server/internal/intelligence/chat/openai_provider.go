@@ -22,15 +22,18 @@ const chatHTTPTimeout = 10 * time.Minute
 // Provider implements intelligence.ChatProvider using raw OpenAI SSE streaming.
 type Provider struct {
 	httpClient *http.Client
+	limiter    *intelligence.Limiter
 	baseURL    string
 	model      string
 	apiKey     string
 }
 
-// New creates a chat Provider from config.
-func New(cfg config.Config) *Provider {
+// New creates a chat Provider from config. Streams hold a limiter slot until
+// the reply has been fully read.
+func New(cfg config.Config, limiter *intelligence.Limiter) *Provider {
 	return &Provider{
-		httpClient: &http.Client{Timeout: chatHTTPTimeout},
+		httpClient: &http.Client{Timeout: chatHTTPTimeout, Transport: intelligence.UpstreamTransport},
+		limiter:    limiter,
 		baseURL:    cfg.OpenAIBaseURL,
 		model:      cfg.OpenAIChatModel,
 		apiKey:     cfg.OpenAIAPIKey,
@@ -139,6 +142,12 @@ When the user asks to:
 	httpReq.Header.Set("Authorization", "Bearer "+p.apiKey)
 	httpReq.Header.Set("Accept", "text/event-stream")
 
+	release, err := p.limiter.Acquire(ctx)
+	if err != nil {
+		return intelligence.ChatResult{}, err
+	}
+	defer release()
+
 	resp, err := p.httpClient.Do(httpReq)
 	if err != nil {
 		return intelligence.ChatResult{}, fmt.Errorf("chat request: %w", err)
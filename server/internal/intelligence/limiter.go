@@ -0,0 +1,61 @@
+package intelligence
+
+import (
+	"context"
+	"errors"
+	"sync/atomic"
+)
+
+// ErrUpstreamBusy is returned by Limiter.Acquire for interactive callers when
+// the upstream is saturated and the wait queue is already full.
+var ErrUpstreamBusy = errors.New("upstream busy, try again shortly")
+
+// Limiter caps the number of upstream LLM calls in flight across every
+// provider and job. Background work waits for a slot; callers marked with
+// RejectWhenBusy fail fast with ErrUpstreamBusy once as many callers are
+// already queued as there are slots. A nil *Limiter imposes no limit.
+type Limiter struct {
+	slots   chan struct{}
+	waiting atomic.Int64
+}
+
+func NewLimiter(concurrency int) *Limiter {
+	return &Limiter{slots: make(chan struct{}, concurrency)}
+}
+
+type rejectWhenBusyKey struct{}
+
+// RejectWhenBusy marks ctx as belonging to an interactive request that should
+// get clean backpressure instead of queueing behind background jobs.
+func RejectWhenBusy(ctx context.Context) context.Context {
+	return context.WithValue(ctx, rejectWhenBusyKey{}, true)
+}
+
+// Acquire blocks until a slot is free or ctx is done. The returned release
+// func must be called exactly once when the upstream call has finished.
+func (l *Limiter) Acquire(ctx context.Context) (func(), error) {
+	if l == nil {
+		return func() {}, nil
+	}
+	select {
+	case l.slots <- struct{}{}:
+		return l.release, nil
+	default:
+	}
+
+	if reject, _ := ctx.Value(rejectWhenBusyKey{}).(bool); reject && l.waiting.Load() >= int64(cap(l.slots)) {
+		return nil, ErrUpstreamBusy
+	}
+	l.waiting.Add(1)
+	defer l.waiting.Add(-1)
+	select {
+	case l.slots <- struct{}{}:
+		return l.release, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+}
+
+func (l *Limiter) release() {
+	<-l.slots
+}
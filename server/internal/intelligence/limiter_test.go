@@ -0,0 +1,77 @@
+package intelligence
+
+import (
+	"context"
+	"errors"
+	"testing"
+	"time"
+)
+
+func TestLimiterCapsConcurrentHolders(t *testing.T) {
+	l := NewLimiter(1)
+	release, err := l.Acquire(context.Background())
+	if err != nil {
+		t.Fatalf("first acquire: %v", err)
+	}
+
+	acquired := make(chan struct{})
+	go func() {
+		next, err := l.Acquire(context.Background())
+		if err != nil {
+			t.Errorf("queued acquire: %v", err)
+			return
+		}
+		next()
+		close(acquired)
+	}()
+
+	select {
+	case <-acquired:
+		t.Fatal("second caller acquired while the only slot was held")
+	case <-time.After(20 * time.Millisecond):
+	}
+	release()
+	select {
+	case <-acquired:
+	case <-time.After(time.Second):
+		t.Fatal("queued caller never acquired the released slot")
+	}
+}
+
+func TestLimiterRejectsInteractiveCallersWhenQueueIsFull(t *testing.T) {
+	l := NewLimiter(1)
+	release, err := l.Acquire(context.Background())
+	if err != nil {
+		t.Fatalf("first acquire: %v", err)
+	}
+	defer release()
+
+	waitCtx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	queued := make(chan error, 1)
+	go func() {
+		_, err := l.Acquire(waitCtx)
+		queued <- err
+	}()
+	for l.waiting.Load() == 0 {
+		time.Sleep(time.Millisecond)
+	}
+
+	if _, err := l.Acquire(RejectWhenBusy(context.Background())); !errors.Is(err, ErrUpstreamBusy) {
+		t.Fatalf("expected ErrUpstreamBusy, got %v", err)
+	}
+
+	cancel()
+	if err := <-queued; !errors.Is(err, context.Canceled) {
+		t.Fatalf("expected queued background caller to stop on cancel, got %v", err)
+	}
+}
+
+func TestNilLimiterDoesNotLimit(t *testing.T) {
+	var l *Limiter
+	release, err := l.Acquire(context.Background())
+	if err != nil {
+		t.Fatalf("acquire: %v", err)
+	}
+	release()
+}
@@ -0,0 +1,158 @@
+package translation
+
+import (
+	"container/list"
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"errors"
+	"strings"
+	"sync"
+
+	"github.com/anath2/language-app/internal/intelligence"
+)
+
+const sentenceCacheSize = 4096
+const fullTranslationCacheSize = 256
+const contextPrefixRunes = 200
+
+// resultCache is a bounded LRU of successful model results with single-flight
+// deduplication: concurrent lookups for the same key share one upstream call.
+// Errors are never cached. A nil *resultCache disables caching.
+type resultCache[V any] struct {
+	mu       sync.Mutex
+	capacity int
+	order    *list.List // front = most recently used
+	entries  map[string]*list.Element
+	inflight map[string]*inflightCall[V]
+}
+
+type cacheEntry[V any] struct {
+	key   string
+	value V
+}
+
+type inflightCall[V any] struct {
+	done  chan struct{}
+	value V
+	err   error
+}
+
+func newResultCache[V any](capacity int) *resultCache[V] {
+	return &resultCache[V]{
+		capacity: capacity,
+		order:    list.New(),
+		entries:  make(map[string]*list.Element, capacity),
+		inflight: make(map[string]*inflightCall[V]),
+	}
+}
+
+// errLeaderAborted marks an in-flight call whose fn panicked before
+// returning, so joined callers retry rather than wait on a result that will
+// never arrive.
+var errLeaderAborted = errors.New("in-flight call aborted")
+
+// Do returns the cached value for key, joining an in-flight call for the same
+// key if there is one, and otherwise runs fn and caches its result on success.
+// fn runs under the ctx of whichever caller started it, so a joined caller
+// that gets back an error scoped to that caller (cancellation, deadline,
+// ErrUpstreamBusy) retries with its own fn instead of inheriting it. A joined
+// caller whose own ctx ends stops waiting and returns ctx.Err().
+func (c *resultCache[V]) Do(ctx context.Context, key string, fn func() (V, error)) (V, error) {
+	if c == nil {
+		return fn()
+	}
+
+	for {
+		c.mu.Lock()
+		if el, ok := c.entries[key]; ok {
+			c.order.MoveToFront(el)
+			value := el.Value.(*cacheEntry[V]).value
+			c.mu.Unlock()
+			return value, nil
+		}
+		if call, ok := c.inflight[key]; ok {
+			c.mu.Unlock()
+			select {
+			case <-call.done:
+			case <-ctx.Done():
+				var zero V
+				return zero, ctx.Err()
+			}
+			if isCallerScoped(call.err) {
+				continue
+			}
+			return call.value, call.err
+		}
+		call := &inflightCall[V]{done: make(chan struct{})}
+		c.inflight[key] = call
+		c.mu.Unlock()
+
+		c.run(key, call, fn)
+		return call.value, call.err
+	}
+}
+
+// run executes fn for call and always publishes the outcome, even if fn
+// panics, so joined callers are never left waiting on call.done.
+func (c *resultCache[V]) run(key string, call *inflightCall[V], fn func() (V, error)) {
+	call.err = errLeaderAborted
+	defer func() {
+		c.mu.Lock()
+		delete(c.inflight, key)
+		if call.err == nil {
+			c.add(key, call.value)
+		}
+		c.mu.Unlock()
+		close(call.done)
+	}()
+	call.value, call.err = fn()
+}
+
+// isCallerScoped reports whether err stems from the calling request rather
+// than from the model, and so must not be shared with joined callers.
+func isCallerScoped(err error) bool {
+	return errors.Is(err, context.Canceled) ||
+		errors.Is(err, context.DeadlineExceeded) ||
+		errors.Is(err, intelligence.ErrUpstreamBusy) ||
+		errors.Is(err, errLeaderAborted)
+}
+
+// add must be called with c.mu held.
+func (c *resultCache[V]) add(key string, value V) {
+	if el, ok := c.entries[key]; ok {
+		el.Value.(*cacheEntry[V]).value = value
+		c.order.MoveToFront(el)
+		return
+	}
+	c.entries[key] = c.order.PushFront(&cacheEntry[V]{key: key, value: value})
+	for c.order.Len() > c.capacity {
+		oldest := c.order.Back()
+		c.order.Remove(oldest)
+		delete(c.entries, oldest.Value.(*cacheEntry[V]).key)
+	}
+}
+
+// textDigest keeps cache keys small when they depend on arbitrarily long input.
+func textDigest(text string) string {
+	sum := sha256.Sum256([]byte(text))
+	return hex.EncodeToString(sum[:])
+}
+
+// sentenceCacheKey only takes the opening contextPrefixRunes of the full text
+// into account. The segments and sentence dominate the model's answer, and
+// keying on the whole document would make every edit elsewhere in it, or the
+// same sentence pasted into another text, a cache miss.
+func sentenceCacheKey(segments []string, sentence string, fullText string) string {
+	return strings.Join(segments, "\x1f") + "\x00" + sentence + "\x00" + textDigest(runePrefix(fullText, contextPrefixRunes))[:16]
+}
+
+func runePrefix(s string, n int) string {
+	for i := range s {
+		if n == 0 {
+			return s[:i]
+		}
+		n--
+	}
+	return s
+}
@@ -0,0 +1,218 @@
+package translation
+
+import (
+	"context"
+	"errors"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+)
+
+func TestResultCache_EvictsLeastRecentlyUsed(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[int](2)
+	calls := 0
+	load := func(v int) func() (int, error) {
+		return func() (int, error) {
+			calls++
+			return v, nil
+		}
+	}
+
+	_, _ = c.Do(context.Background(), "a", load(1))
+	_, _ = c.Do(context.Background(), "b", load(2))
+	_, _ = c.Do(context.Background(), "a", load(1)) // a becomes most recent
+	_, _ = c.Do(context.Background(), "c", load(3)) // evicts b
+	if calls != 3 {
+		t.Fatalf("expected 3 loads, got %d", calls)
+	}
+	if got, _ := c.Do(context.Background(), "a", load(-1)); got != 1 {
+		t.Fatalf("expected cached a=1, got %d", got)
+	}
+	if got, _ := c.Do(context.Background(), "b", load(20)); got != 20 {
+		t.Fatalf("expected b to be reloaded, got %d", got)
+	}
+}
+
+func TestResultCache_DoesNotCacheErrors(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[string](4)
+	if _, err := c.Do(context.Background(), "k", func() (string, error) { return "", errors.New("boom") }); err == nil {
+		t.Fatal("expected error")
+	}
+	got, err := c.Do(context.Background(), "k", func() (string, error) { return "ok", nil })
+	if err != nil || got != "ok" {
+		t.Fatalf("expected retry to succeed, got %q, %v", got, err)
+	}
+}
+
+func TestResultCache_SharesInflightCall(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[string](4)
+	started := make(chan struct{})
+	release := make(chan struct{})
+	var calls atomic.Int32
+
+	var wg sync.WaitGroup
+	results := make([]string, 8)
+	for i := range results {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			results[i], _ = c.Do(context.Background(), "k", func() (string, error) {
+				if calls.Add(1) == 1 {
+					close(started)
+				}
+				<-release
+				return "v", nil
+			})
+		}(i)
+	}
+	<-started
+	close(release)
+	wg.Wait()
+
+	if got := calls.Load(); got != 1 {
+		t.Fatalf("expected a single upstream call, got %d", got)
+	}
+	for i, r := range results {
+		if r != "v" {
+			t.Fatalf("results[%d] = %q, want v", i, r)
+		}
+	}
+}
+
+func TestResultCache_FollowerRetriesWhenLeaderCancelled(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[string](4)
+	leaderCtx, cancelLeader := context.WithCancel(context.Background())
+	started := make(chan struct{})
+
+	leaderErr := make(chan error, 1)
+	go func() {
+		_, err := c.Do(leaderCtx, "k", func() (string, error) {
+			close(started)
+			<-leaderCtx.Done()
+			return "", leaderCtx.Err()
+		})
+		leaderErr <- err
+	}()
+	<-started
+
+	type result struct {
+		value string
+		err   error
+	}
+	follower := make(chan result, 1)
+	go func() {
+		v, err := c.Do(context.Background(), "k", func() (string, error) { return "follower", nil })
+		follower <- result{v, err}
+	}()
+	time.Sleep(20 * time.Millisecond) // let the follower join the in-flight call
+	cancelLeader()
+
+	if err := <-leaderErr; !errors.Is(err, context.Canceled) {
+		t.Fatalf("leader err = %v, want context.Canceled", err)
+	}
+	got := <-follower
+	if got.err != nil || got.value != "follower" {
+		t.Fatalf("follower got %q, %v; want its own result", got.value, got.err)
+	}
+}
+
+func TestResultCache_FollowerStopsWaitingOnOwnCancel(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[string](4)
+	started := make(chan struct{})
+	release := make(chan struct{})
+	defer close(release)
+	go func() {
+		_, _ = c.Do(context.Background(), "k", func() (string, error) {
+			close(started)
+			<-release
+			return "v", nil
+		})
+	}()
+	<-started
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	if _, err := c.Do(ctx, "k", func() (string, error) { return "unused", nil }); !errors.Is(err, context.Canceled) {
+		t.Fatalf("expected context.Canceled, got %v", err)
+	}
+}
+
+func TestResultCache_LeaderPanicReleasesFollowers(t *testing.T) {
+	t.Parallel()
+	c := newResultCache[string](4)
+	started := make(chan struct{})
+	release := make(chan struct{})
+	go func() {
+		defer func() { _ = recover() }()
+		_, _ = c.Do(context.Background(), "k", func() (string, error) {
+			close(started)
+			<-release
+			panic("boom")
+		})
+	}()
+	<-started
+
+	done := make(chan string, 1)
+	go func() {
+		v, _ := c.Do(context.Background(), "k", func() (string, error) { return "follower", nil })
+		done <- v
+	}()
+	time.Sleep(20 * time.Millisecond) // let the follower join the in-flight call
+	close(release)
+
+	select {
+	case v := <-done:
+		if v != "follower" {
+			t.Fatalf("follower got %q, want its own result", v)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("follower still blocked after leader panicked")
+	}
+}
+
+func TestResultCache_NilDisablesCaching(t *testing.T) {
+	t.Parallel()
+	var c *resultCache[int]
+	calls := 0
+	for i := 0; i < 2; i++ {
+		_, _ = c.Do(context.Background(), "k", func() (int, error) { calls++; return 1, nil })
+	}
+	if calls != 2 {
+		t.Fatalf("expected nil cache to call through, got %d calls", calls)
+	}
+}
+
+func TestSentenceCacheKey_IgnoresContextBeyondPrefix(t *testing.T) {
+	t.Parallel()
+	prefix := strings.Repeat("文", contextPrefixRunes)
+	segments := []string{"你好"}
+
+	a := sentenceCacheKey(segments, "你好。", prefix+"第一版")
+	b := sentenceCacheKey(segments, "你好。", prefix+"第二版")
+	if a != b {
+		t.Fatal("expected edits past the context prefix to share a cache key")
+	}
+	if c := sentenceCacheKey(segments, "你好。", "另"+prefix); c == a {
+		t.Fatal("expected a different context prefix to change the cache key")
+	}
+	if d := sentenceCacheKey([]string{"你", "好"}, "你好。", prefix); d == a {
+		t.Fatal("expected different segments to change the cache key")
+	}
+}
+
+func TestRunePrefix(t *testing.T) {
+	t.Parallel()
+	if got := runePrefix("你好世界", 2); got != "你好" {
+		t.Fatalf("runePrefix = %q, want 你好", got)
+	}
+	if got := runePrefix("你好", 5); got != "你好" {
+		t.Fatalf("runePrefix = %q, want 你好", got)
+	}
+}
@@ -1,44 +1,60 @@
 package translation
 
 import (
-	"strings"
-	"unicode"
-)
+	"unicode/utf8"
 
-const chinesePunctuation = `，。！？；：、（）【】《》〈〉「」『』""''—…·`
+	store "github.com/anath2/language-app/internal/translation"
+)
 
-func isCJKIdeograph(r rune) bool {
-	return (r >= 0x4E00 && r <= 0x9FFF) || // Main CJK block
-		(r >= 0x3400 && r <= 0x4DBF) || // Extension A
-		(r >= 0x20000 && r <= 0x2A6DF) || // Extension B
-		(r >= 0x2A700 && r <= 0x2CEAF) || // Extensions C-E
-		(r >= 0x2CEB0 && r <= 0x2EBEF) || // Extensions F-I
-		(r >= 0x30000 && r <= 0x323AF) // Extensions G-H
-}
+// minCJKLeadByte is the first UTF-8 byte of U+3400, the lowest ideograph
+// store.IsCJKIdeograph accepts. Every byte below it is ASCII, a continuation
+// byte, or the lead of a sequence that decodes to something below U+3400, so
+// none of them can start an ideograph.
+const minCJKLeadByte = 0xE3
 
+// shouldSkipSegment reports whether a segment has nothing for the model to
+// translate, i.e. it contains no CJK ideograph. Whitespace, punctuation,
+// digits and symbols all count as skippable, so the first ideograph decides.
+// It scans bytes and only decodes a rune at lead bytes that could start one.
 func shouldSkipSegment(segment string) bool {
-	if strings.TrimSpace(segment) == "" {
-		return true
-	}
-
-	hasCJK := false
-	for _, r := range segment {
-		if isCJKIdeograph(r) {
-			hasCJK = true
-			continue
-		}
-		if unicode.IsSpace(r) {
-			continue
+	for i := 0; i < len(segment); i++ {
+		// Skip eight bytes at a time while none of them can be a lead byte.
+		for i+8 <= len(segment) && !hasPossibleCJKLead(loadUint64(segment[i:])) {
+			i += 8
 		}
-		if r <= unicode.MaxASCII && !unicode.IsLetter(r) {
-			continue
+		if i >= len(segment) {
+			break
 		}
-		if strings.ContainsRune(chinesePunctuation, r) {
+		if segment[i] < minCJKLeadByte {
 			continue
 		}
-		if unicode.In(r, unicode.Nd, unicode.No, unicode.Po, unicode.Ps, unicode.Pe, unicode.Pd, unicode.Pc, unicode.Sk, unicode.Sm, unicode.So) {
-			continue
+		r, size := utf8.DecodeRuneInString(segment[i:])
+		if store.IsCJKIdeograph(r) {
+			return false
 		}
+		i += size - 1
 	}
-	return !hasCJK
+	return true
+}
+
+const (
+	swarHighBits = 0x8080808080808080
+	swarLowBits  = 0x7F7F7F7F7F7F7F7F
+	// Adding 0x1D to a byte's low seven bits carries into bit 7 exactly when
+	// those bits are at least 0x63, i.e. when the byte is >= 0xE3 given that
+	// its own high bit is set.
+	swarLeadOffset = 0x1D1D1D1D1D1D1D1D
+)
+
+// hasPossibleCJKLead reports whether any of the eight bytes packed in x is
+// >= minCJKLeadByte. Per-byte sums never exceed 0xFF, so lanes cannot carry
+// into each other.
+func hasPossibleCJKLead(x uint64) bool {
+	return x&((x&swarLowBits)+swarLeadOffset)&swarHighBits != 0
+}
+
+func loadUint64(s string) uint64 {
+	_ = s[7]
+	return uint64(s[0]) | uint64(s[1])<<8 | uint64(s[2])<<16 | uint64(s[3])<<24 |
+		uint64(s[4])<<32 | uint64(s[5])<<40 | uint64(s[6])<<48 | uint64(s[7])<<56
 }
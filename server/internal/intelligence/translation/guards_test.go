@@ -0,0 +1,68 @@
+package translation
+
+import (
+	"strings"
+	"testing"
+
+	store "github.com/anath2/language-app/internal/translation"
+)
+
+func TestShouldSkipSegment(t *testing.T) {
+	t.Parallel()
+	cases := []struct {
+		segment string
+		want    bool
+	}{
+		{"", true},
+		{"   ", true},
+		{"，", true},
+		{"。！？", true},
+		{"123", true},
+		{"abc", true},
+		{"《》", true},
+		{"→", true},
+		{"你好", false},
+		{"，你", false},
+		{"3个", false},
+		{"\U00020000", false}, // Extension B
+	}
+	for _, tc := range cases {
+		if got := shouldSkipSegment(tc.segment); got != tc.want {
+			t.Errorf("shouldSkipSegment(%q) = %v, want %v", tc.segment, got, tc.want)
+		}
+	}
+}
+
+func TestShouldSkipSegmentMatchesRuneScan(t *testing.T) {
+	t.Parallel()
+	runeScan := func(segment string) bool {
+		for _, r := range segment {
+			if store.IsCJKIdeograph(r) {
+				return false
+			}
+		}
+		return true
+	}
+	for _, segment := range []string{
+		"héllo wörld", "ㄅㄆㄇ", "\u33ff", "\u3400", "\u4dbf", "\u9fff", "\ua000", "\uff0c\uff01",
+		"\xe4\xbd", "\xe4\xbd\xa0", "\xff\xfe", "abc\xe3", "\U0002ebef", "\U0001f600",
+		strings.Repeat("plain ascii text, ", 8) + "你", strings.Repeat("é", 20) + "\u9fff",
+		"abcdefg\u4e00", strings.Repeat("x", 64),
+	} {
+		if got, want := shouldSkipSegment(segment), runeScan(segment); got != want {
+			t.Errorf("shouldSkipSegment(%q) = %v, want %v", segment, got, want)
+		}
+	}
+}
+
+func TestHasPossibleCJKLead(t *testing.T) {
+	t.Parallel()
+	for b := 0; b < 256; b++ {
+		for lane := 0; lane < 8; lane++ {
+			x := uint64(0x4141414141414141)&^(uint64(0xFF)<<(lane*8)) | uint64(b)<<(lane*8)
+			if got, want := hasPossibleCJKLead(x), b >= minCJKLeadByte; got != want {
+				t.Fatalf("byte %#x in lane %d: got %v, want %v", b, lane, got, want)
+			}
+		}
+	}
+}
@@ -7,18 +7,28 @@ import (
 	"fmt"
 	"io"
 	"log"
+	"math/rand"
 	"net/http"
 	"net/url"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"time"
+	"unicode/utf8"
 
 	"github.com/anath2/language-app/internal/config"
+	"github.com/anath2/language-app/internal/intelligence"
 	store "github.com/anath2/language-app/internal/translation"
 )
 
 const llmTimeout = 10 * time.Minute
+
+// Transient upstream failures (transport errors, 429, 5xx) are retried up to
+// maxUpstreamAttempts times in total with full-jitter exponential backoff.
+const maxUpstreamAttempts = 3
+const upstreamRetryBaseDelay = 500 * time.Millisecond
+const upstreamRetryMaxDelay = 10 * time.Second
 const defaultSegmentationInstruction = "Split the Chinese text into meaningful segments of words and return segments as an ordered JSON array."
 
 // Provider calls an OpenAI-compatible /chat/completions endpoint directly
@@ -26,28 +36,44 @@ const defaultSegmentationInstruction = "Split the Chinese text into meaningful s
 // It implements intelligence.TranslationProvider.
 type Provider struct {
 	client      *http.Client
+	limiter     *intelligence.Limiter
 	baseURL     string
 	apiKey      string
 	model       string
 	instruction string
+	// retryBaseDelay scales the backoff between attempts; zero retries
+	// immediately.
+	retryBaseDelay time.Duration
+
+	segmentCache  *resultCache[[]string]
+	sentenceCache *resultCache[[]store.SegmentResult]
+	fullCache     *resultCache[string]
 }
 
-func NewProvider(cfg config.Config) (*Provider, error) {
+// NewProvider builds a Provider whose upstream calls all go through limiter.
+func NewProvider(cfg config.Config, limiter *intelligence.Limiter) (*Provider, error) {
 	baseURL, _, err := normalizeOpenAIEndpoint(cfg.OpenAIBaseURL)
 	if err != nil {
 		return nil, fmt.Errorf("invalid OPENAI_BASE_URL %q: %w", cfg.OpenAIBaseURL, err)
 	}
-	var transport http.RoundTripper = http.DefaultTransport
+	transport := intelligence.UpstreamTransport
 	if cfg.OpenAIDebugLog {
 		transport = &openAIDebugRoundTripper{base: transport}
 		log.Printf("openai-compatible debug enabled: base_url=%s model=%s", baseURL, cfg.OpenAITranslationModel)
 	}
 	return &Provider{
 		client:      &http.Client{Timeout: llmTimeout, Transport: transport},
+		limiter:     limiter,
 		baseURL:     baseURL,
 		apiKey:      cfg.OpenAIAPIKey,
 		model:       strings.TrimSpace(cfg.OpenAITranslationModel),
 		instruction: loadCompiledSegmentationInstruction(cfg),
+
+		retryBaseDelay: upstreamRetryBaseDelay,
+
+		segmentCache:  newResultCache[[]string](sentenceCacheSize),
+		sentenceCache: newResultCache[[]store.SegmentResult](sentenceCacheSize),
+		fullCache:     newResultCache[string](fullTranslationCacheSize),
 	}, nil
 }
 
@@ -96,25 +122,50 @@ var fullTranslationSchema = map[string]any{
 
 // ---- TranslationProvider implementation ----
 
+// Segment splits a sentence into words. Text without any CJK ideograph, or a
+// single rune, is returned whole without a model call since there is nothing
+// to split; other results are cached per sentence.
 func (p *Provider) Segment(ctx context.Context, text string) ([]string, error) {
 	text = strings.TrimSpace(text)
 	if text == "" {
 		return []string{}, nil
 	}
-	content, err := p.complete(ctx, p.instruction, text, segmentationSchema, "segmentation_result")
-	if err != nil {
-		log.Printf("segment failed: err=%v text_preview=%q", err, preview(text, 40))
-		return nil, fmt.Errorf("segment text: %w", err)
+	if shouldSkipSegment(text) || utf8.RuneCountInString(text) == 1 {
+		return []string{text}, nil
 	}
-	segments, err := parseSegmentsResult(content)
+	segments, err := p.segmentCache.Do(ctx, text, func() ([]string, error) {
+		content, err := p.complete(ctx, p.instruction, text, segmentationSchema, "segmentation_result")
+		if err != nil {
+			log.Printf("segment failed: err=%v text_preview=%q", err, preview(text, 40))
+			return nil, fmt.Errorf("segment text: %w", err)
+		}
+		segments, err := parseSegmentsResult(content)
+		if err != nil {
+			log.Printf("segment parse failed: err=%v text_preview=%q content=%q", err, preview(text, 40), content)
+			return nil, fmt.Errorf("segment text: %w", err)
+		}
+		return segments, nil
+	})
 	if err != nil {
-		log.Printf("segment parse failed: err=%v text_preview=%q content=%q", err, preview(text, 40), content)
-		return nil, fmt.Errorf("segment text: %w", err)
+		return nil, err
 	}
-	return segments, nil
+	return append([]string(nil), segments...), nil
 }
 
+// TranslateSentenceSegments results are cached per (segments, sentence,
+// context prefix; see sentenceCacheKey), so resubmitted, reprocessed or
+// overlapping texts skip the model for sentences it has already translated.
 func (p *Provider) TranslateSentenceSegments(ctx context.Context, segments []string, sentence string, fullText string) ([]store.SegmentResult, error) {
+	cached, err := p.sentenceCache.Do(ctx, sentenceCacheKey(segments, sentence, fullText), func() ([]store.SegmentResult, error) {
+		return p.translateSentenceSegments(ctx, segments, sentence, fullText)
+	})
+	if err != nil {
+		return nil, err
+	}
+	return append([]store.SegmentResult(nil), cached...), nil
+}
+
+func (p *Provider) translateSentenceSegments(ctx context.Context, segments []string, sentence string, fullText string) ([]store.SegmentResult, error) {
 	type indexedSegment struct {
 		originalIdx int
 		segment     string
@@ -138,7 +189,35 @@ func (p *Provider) TranslateSentenceSegments(ctx context.Context, segments []str
 	for i, cs := range cjkSegments {
 		segStrings[i] = cs.segment
 	}
-	segJSON, err := json.Marshal(segStrings)
+	translations, err := p.translateSegmentBatch(ctx, segStrings, sentence, fullText)
+	if err != nil {
+		return nil, fmt.Errorf("translate sentence segments: %w", err)
+	}
+	if len(translations) != len(segStrings) {
+		// A short or padded array can't be aligned to the input reliably, so
+		// redo the sentence one segment per call rather than guess.
+		log.Printf("batch translation length mismatch, falling back to per-segment: want=%d got=%d sentence_preview=%q",
+			len(segStrings), len(translations), preview(sentence, 40))
+		translations, err = p.translateSegmentsIndividually(ctx, segStrings, sentence, fullText)
+		if err != nil {
+			return nil, fmt.Errorf("translate sentence segments: %w", err)
+		}
+	}
+
+	for i, cs := range cjkSegments {
+		out[cs.originalIdx] = store.SegmentResult{
+			Segment: cs.segment,
+			Pinyin:  normalizeModelField(translations[i].Pinyin),
+			English: normalizeModelField(translations[i].English),
+		}
+	}
+	return out, nil
+}
+
+// translateSegmentBatch asks the model for pinyin and English for every
+// segment in a single call.
+func (p *Provider) translateSegmentBatch(ctx context.Context, segments []string, sentence string, fullText string) ([]batchTranslation, error) {
+	segJSON, err := json.Marshal(segments)
 	if err != nil {
 		return nil, fmt.Errorf("marshal segments: %w", err)
 	}
@@ -154,20 +233,26 @@ func (p *Provider) TranslateSentenceSegments(ctx context.Context, segments []str
 	const systemPrompt = "Given an array of Chinese word segments from a sentence, produce the pinyin (with tone marks) and a concise English translation for each segment. Use the sentence and full text for context to select the correct reading and meaning. Return a JSON object with a \"translations\" array of objects with \"pinyin\" and \"english\" fields, in the same order as the input segments."
 	content, err := p.complete(ctx, systemPrompt, string(userMsg), sentenceSegmentsTranslationSchema, "sentence_segments_translation_result")
 	if err != nil {
-		return nil, fmt.Errorf("translate sentence segments: %w", err)
-	}
-	translations, err := parseBatchTranslationsResult(content)
-	if err != nil {
-		return nil, fmt.Errorf("translate sentence segments: %w", err)
+		return nil, err
 	}
+	return parseBatchTranslationsResult(content)
+}
 
-	for i, cs := range cjkSegments {
-		result := store.SegmentResult{Segment: cs.segment}
-		if i < len(translations) {
-			result.Pinyin = normalizeModelField(translations[i].Pinyin)
-			result.English = normalizeModelField(translations[i].English)
+// translateSegmentsIndividually is the fallback for a misaligned batch
+// response. Each call carries exactly one segment and must come back with
+// exactly one translation; anything else is an error rather than an empty or
+// guessed result.
+func (p *Provider) translateSegmentsIndividually(ctx context.Context, segments []string, sentence string, fullText string) ([]batchTranslation, error) {
+	out := make([]batchTranslation, len(segments))
+	for i, seg := range segments {
+		translations, err := p.translateSegmentBatch(ctx, []string{seg}, sentence, fullText)
+		if err != nil {
+			return nil, err
+		}
+		if len(translations) != 1 {
+			return nil, fmt.Errorf("translate segment %q: want 1 translation, got %d", seg, len(translations))
 		}
-		out[cs.originalIdx] = result
+		out[i] = translations[0]
 	}
 	return out, nil
 }
@@ -177,12 +262,14 @@ func (p *Provider) TranslateFull(ctx context.Context, text string) (string, erro
 	if text == "" {
 		return "", nil
 	}
-	const systemPrompt = "Return concise translation data for the full text as a JSON object with a \"translation\" field."
-	content, err := p.complete(ctx, systemPrompt, text, fullTranslationSchema, "full_translation_result")
-	if err != nil {
-		return "", fmt.Errorf("translate full text: %w", err)
-	}
-	return parseFullTranslationResult(content)
+	return p.fullCache.Do(ctx, textDigest(text), func() (string, error) {
+		const systemPrompt = "Return concise translation data for the full text as a JSON object with a \"translation\" field."
+		content, err := p.complete(ctx, systemPrompt, text, fullTranslationSchema, "full_translation_result")
+		if err != nil {
+			return "", fmt.Errorf("translate full text: %w", err)
+		}
+		return parseFullTranslationResult(content)
+	})
 }
 
 // ---- HTTP helper ----
@@ -230,45 +317,105 @@ func (p *Provider) complete(ctx context.Context, systemPrompt, userPrompt string
 		return "", fmt.Errorf("marshal request: %w", err)
 	}
 
+	var respBody []byte
+	for attempt := 1; ; attempt++ {
+		var retryAfter time.Duration
+		var retryable bool
+		respBody, retryAfter, retryable, err = p.post(ctx, body)
+		if err == nil || !retryable || attempt == maxUpstreamAttempts {
+			break
+		}
+		delay := p.retryDelay(attempt, retryAfter)
+		log.Printf("upstream attempt %d/%d failed, retrying in %s: %v", attempt, maxUpstreamAttempts, delay, err)
+		timer := time.NewTimer(delay)
+		select {
+		case <-timer.C:
+		case <-ctx.Done():
+			timer.Stop()
+			return "", fmt.Errorf("%w (last upstream error: %v)", ctx.Err(), err)
+		}
+	}
+	if err != nil {
+		return "", err
+	}
+
+	var chatResp struct {
+		Choices []struct {
+			Message struct {
+				Content string `json:"content"`
+			} `json:"message"`
+		} `json:"choices"`
+	}
+	if err := json.Unmarshal(respBody, &chatResp); err != nil {
+		return "", fmt.Errorf("parse upstream response: %w", err)
+	}
+	if len(chatResp.Choices) == 0 {
+		return "", fmt.Errorf("no choices in upstream response")
+	}
+	return chatResp.Choices[0].Message.Content, nil
+}
+
+// post sends one completion request and returns the response body.
+// retryable reports whether a failure is worth another attempt: a transport
+// error while ctx is still live, 429 or a 5xx. retryAfter is the server's
+// Retry-After hint, if it sent one.
+func (p *Provider) post(ctx context.Context, body []byte) (respBody []byte, retryAfter time.Duration, retryable bool, err error) {
 	httpReq, err := http.NewRequestWithContext(ctx, http.MethodPost, p.baseURL+"/chat/completions", bytes.NewReader(body))
 	if err != nil {
-		return "", fmt.Errorf("build request: %w", err)
+		return nil, 0, false, fmt.Errorf("build request: %w", err)
 	}
 	httpReq.Header.Set("Content-Type", "application/json")
 	httpReq.Header.Set("Authorization", "Bearer "+p.apiKey)
 
+	release, err := p.limiter.Acquire(ctx)
+	if err != nil {
+		return nil, 0, false, err
+	}
+	defer release()
+
 	resp, err := p.client.Do(httpReq)
 	if err != nil {
-		return "", fmt.Errorf("upstream request: %w", err)
+		return nil, 0, ctx.Err() == nil, fmt.Errorf("upstream request: %w", err)
 	}
 	defer resp.Body.Close()
 
-	respBody, err := io.ReadAll(resp.Body)
+	respBody, err = io.ReadAll(resp.Body)
 	if err != nil {
-		return "", fmt.Errorf("read upstream response: %w", err)
+		return nil, 0, ctx.Err() == nil, fmt.Errorf("read upstream response: %w", err)
 	}
 	if resp.StatusCode != http.StatusOK {
 		snippet := strings.TrimSpace(string(respBody))
 		if len(snippet) > 300 {
 			snippet = snippet[:300] + "..."
 		}
-		return "", fmt.Errorf("upstream returned status %d: %s", resp.StatusCode, snippet)
+		retryable = resp.StatusCode == http.StatusTooManyRequests || resp.StatusCode >= 500
+		return nil, parseRetryAfter(resp.Header.Get("Retry-After")), retryable, fmt.Errorf("upstream returned status %d: %s", resp.StatusCode, snippet)
 	}
+	return respBody, 0, false, nil
+}
 
-	var chatResp struct {
-		Choices []struct {
-			Message struct {
-				Content string `json:"content"`
-			} `json:"message"`
-		} `json:"choices"`
+// retryDelay honours the server's Retry-After hint when there is one and
+// otherwise draws full-jitter exponential backoff; either way it is capped at
+// upstreamRetryMaxDelay.
+func (p *Provider) retryDelay(attempt int, retryAfter time.Duration) time.Duration {
+	if retryAfter > 0 {
+		return min(retryAfter, upstreamRetryMaxDelay)
 	}
-	if err := json.Unmarshal(respBody, &chatResp); err != nil {
-		return "", fmt.Errorf("parse upstream response: %w", err)
+	if p.retryBaseDelay <= 0 {
+		return 0
 	}
-	if len(chatResp.Choices) == 0 {
-		return "", fmt.Errorf("no choices in upstream response")
+	ceiling := min(p.retryBaseDelay<<(attempt-1), upstreamRetryMaxDelay)
+	return time.Duration(rand.Int63n(int64(ceiling) + 1))
+}
+
+// parseRetryAfter reads the delay-seconds form of Retry-After; the HTTP-date
+// form is ignored in favour of backoff.
+func parseRetryAfter(value string) time.Duration {
+	seconds, err := strconv.Atoi(strings.TrimSpace(value))
+	if err != nil || seconds <= 0 {
+		return 0
 	}
-	return chatResp.Choices[0].Message.Content, nil
+	return time.Duration(seconds) * time.Second
 }
 
 // ---- Startup helpers ----
@@ -303,7 +450,7 @@ type openAIDebugRoundTripper struct {
 func (rt *openAIDebugRoundTripper) RoundTrip(req *http.Request) (*http.Response, error) {
 	base := rt.base
 	if base == nil {
-		base = http.DefaultTransport
+		base = intelligence.UpstreamTransport
 	}
 	start := time.Now()
 	resp, err := base.RoundTrip(req)
@@ -3,11 +3,14 @@ package translation
 import (
 	"context"
 	"encoding/json"
+	"errors"
 	"net/http"
 	"net/http/httptest"
 	"os"
 	"path/filepath"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/anath2/language-app/internal/config"
 )
@@ -62,6 +65,20 @@ func TestProvider_Segment_EmptyInput(t *testing.T) {
 	}
 }
 
+func TestProvider_Segment_SkipsModelWhenNothingToSplit(t *testing.T) {
+	t.Parallel()
+	p := &Provider{client: &http.Client{}, baseURL: "http://unused", model: "m", instruction: "i"}
+	for _, text := range []string{"Chapter 1.", "——", "好"} {
+		segments, err := p.Segment(context.Background(), text)
+		if err != nil {
+			t.Fatalf("Segment(%q): unexpected error: %v", text, err)
+		}
+		if len(segments) != 1 || segments[0] != text {
+			t.Fatalf("Segment(%q) = %v, want the text unchanged", text, segments)
+		}
+	}
+}
+
 func TestProvider_Segment_UpstreamError(t *testing.T) {
 	t.Parallel()
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -77,6 +94,84 @@ func TestProvider_Segment_UpstreamError(t *testing.T) {
 	}
 }
 
+func TestProvider_Segment_RetriesTransientUpstreamError(t *testing.T) {
+	t.Parallel()
+	var calls atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if calls.Add(1) == 1 {
+			w.WriteHeader(http.StatusServiceUnavailable)
+			return
+		}
+		w.Header().Set("Content-Type", "application/json")
+		_ = json.NewEncoder(w).Encode(map[string]any{
+			"choices": []map[string]any{{"message": map[string]any{"content": `{"segments":["你好"]}`}}},
+		})
+	}))
+	defer srv.Close()
+
+	p := newTestProvider(t, srv)
+	segments, err := p.Segment(context.Background(), "你好")
+	if err != nil {
+		t.Fatalf("Segment() error = %v", err)
+	}
+	if len(segments) != 1 || segments[0] != "你好" {
+		t.Fatalf("unexpected segments: %v", segments)
+	}
+	if got := calls.Load(); got != 2 {
+		t.Fatalf("expected 2 upstream calls, got %d", got)
+	}
+}
+
+func TestProvider_Segment_CancelDuringBackoffIsCallerScoped(t *testing.T) {
+	t.Parallel()
+	var calls atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if calls.Add(1) == 1 {
+			w.Header().Set("Retry-After", "5")
+			w.WriteHeader(http.StatusServiceUnavailable)
+			return
+		}
+		w.Header().Set("Content-Type", "application/json")
+		_ = json.NewEncoder(w).Encode(map[string]any{
+			"choices": []map[string]any{{"message": map[string]any{"content": `{"segments":["你","好"]}`}}},
+		})
+	}))
+	defer srv.Close()
+
+	p := newTestProvider(t, srv)
+	p.segmentCache = newResultCache[[]string](4)
+
+	leaderCtx, cancelLeader := context.WithCancel(context.Background())
+	leaderErr := make(chan error, 1)
+	go func() {
+		_, err := p.Segment(leaderCtx, "你好")
+		leaderErr <- err
+	}()
+	for calls.Load() == 0 {
+		time.Sleep(time.Millisecond)
+	}
+
+	type result struct {
+		segments []string
+		err      error
+	}
+	follower := make(chan result, 1)
+	go func() {
+		segments, err := p.Segment(context.Background(), "你好")
+		follower <- result{segments, err}
+	}()
+	time.Sleep(50 * time.Millisecond) // leader is in its Retry-After backoff
+	cancelLeader()
+
+	if err := <-leaderErr; !errors.Is(err, context.Canceled) {
+		t.Fatalf("leader err = %v, want context.Canceled", err)
+	}
+	got := <-follower
+	if got.err != nil || len(got.segments) != 2 {
+		t.Fatalf("follower got %v, %v; want its own result", got.segments, got.err)
+	}
+}
+
 func TestProvider_Segment_NoChoices(t *testing.T) {
 	t.Parallel()
 	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -124,6 +219,56 @@ func TestProvider_TranslateSentenceSegments_HappyPath(t *testing.T) {
 	}
 }
 
+func TestProvider_TranslateSentenceSegments_LengthMismatchFallsBackPerSegment(t *testing.T) {
+	t.Parallel()
+	var calls atomic.Int32
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		var req chatCompletionRequest
+		if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+			t.Errorf("decode request: %v", err)
+		}
+		var userMsg struct {
+			Segments string `json:"segments"`
+		}
+		_ = json.Unmarshal([]byte(req.Messages[1].Content), &userMsg)
+		var segments []string
+		_ = json.Unmarshal([]byte(userMsg.Segments), &segments)
+
+		content := `{"translations":[{"pinyin":"x","english":"misaligned"}]}`
+		if calls.Add(1) > 1 {
+			content = `{"translations":[{"pinyin":"p","english":"` + segments[0] + `"}]}`
+		}
+		w.Header().Set("Content-Type", "application/json")
+		_ = json.NewEncoder(w).Encode(map[string]any{
+			"choices": []map[string]any{{"message": map[string]any{"content": content}}},
+		})
+	}))
+	defer srv.Close()
+
+	p := newTestProvider(t, srv)
+	results, err := p.TranslateSentenceSegments(context.Background(), []string{"你好", "，", "世界"}, "你好，世界", "你好，世界")
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got := calls.Load(); got != 3 {
+		t.Fatalf("expected 1 batch call + 2 per-segment calls, got %d", got)
+	}
+	if results[0].English != "你好" || results[1].English != "" || results[2].English != "世界" {
+		t.Fatalf("unexpected results: %+v", results)
+	}
+}
+
+func TestProvider_TranslateSentenceSegments_EmptyPerSegmentReplyIsError(t *testing.T) {
+	t.Parallel()
+	srv := mockCompletionServer(t, `{"translations":[]}`)
+	defer srv.Close()
+
+	p := newTestProvider(t, srv)
+	if _, err := p.TranslateSentenceSegments(context.Background(), []string{"你好"}, "你好", "你好"); err == nil {
+		t.Fatal("expected an error when the model returns no translation for a segment")
+	}
+}
+
 func TestProvider_TranslateFull(t *testing.T) {
 	t.Parallel()
 	srv := mockCompletionServer(t, `{"translation":"Hello, world!"}`)
@@ -0,0 +1,21 @@
+package intelligence
+
+import (
+	"net/http"
+	"time"
+)
+
+// UpstreamTransport is the connection pool shared by every provider that talks
+// to the OpenAI-compatible endpoint. The default transport keeps only two idle
+// connections per host, so a job with several calls in flight would close and
+// re-dial (TCP + TLS) most of its connections after each request.
+var UpstreamTransport http.RoundTripper = newUpstreamTransport()
+
+func newUpstreamTransport() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.ForceAttemptHTTP2 = true
+	t.MaxIdleConns = 100
+	t.MaxIdleConnsPerHost = 50
+	t.IdleConnTimeout = 90 * time.Second
+	return t
+}
@@ -58,6 +58,10 @@ func open(dbPath string) (*sql.DB, error) {
 	if err != nil {
 		return nil, fmt.Errorf("open sqlite db: %w", err)
 	}
+	// Migrations run one at a time, so a single connection is reused for the
+	// whole run. That also guarantees the pragmas below, which only apply to
+	// the connection that executes them, are in effect for every migration.
+	db.SetMaxOpenConns(1)
 	if _, err := db.Exec(`PRAGMA foreign_keys = ON;`); err != nil {
 		_ = db.Close()
 		return nil, fmt.Errorf("enable foreign keys: %w", err)
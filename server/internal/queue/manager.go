@@ -2,11 +2,12 @@ package queue
 
 import (
 	"context"
+	"errors"
+	"fmt"
 	"log"
 	"strings"
 	"sync"
 	"time"
-	"unicode/utf8"
 
 	"github.com/anath2/language-app/internal/intelligence"
 	"github.com/anath2/language-app/internal/translation"
@@ -29,10 +30,11 @@ type Progress struct {
 }
 
 type Manager struct {
-	store    translationStore
-	provider intelligence.TranslationProvider
-	mu       sync.RWMutex
-	running  map[string]struct{}
+	store       translationStore
+	provider    intelligence.TranslationProvider
+	concurrency int // in-flight Segment/TranslateSentenceSegments calls per job
+	mu          sync.RWMutex
+	running     map[string]struct{}
 }
 
 type translationStore interface {
@@ -45,9 +47,9 @@ type translationStore interface {
 	SetProcessing(id string, total int, sentences []translation.SentenceInit) error
 	SetReprocessing(id string, total int) error
 	Complete(id string) error
-	GetProgressSnapshot(id string) (translation.ProgressSnapshot, bool)
-	AddProgressSegment(id string, result translation.SegmentResult, sentenceIndex int) (int, int, error)
-	AddReprocessedSegment(id string, result translation.SegmentResult, sentenceIdx int, segIdx int) error
+	GetProgressSnapshot(id string, fromResult int) (translation.ProgressSnapshot, bool)
+	AddProgressSegments(id string, results []translation.SegmentResult, sentenceIndex int) (int, int, error)
+	AddReprocessedSegments(id string, results []translation.SegmentResult, sentenceIdx int) error
 }
 
 type queuedSegment struct {
@@ -56,21 +58,32 @@ type queuedSegment struct {
 	Segment       string
 }
 
-type sentenceInfo struct {
-	Text      string
-	Indent    string
-	Separator string
+type sentenceBatch struct {
+	sentenceIdx  int
+	sentenceText string
+	segments     []string
 }
 
+type batchResult struct {
+	translated []translation.SegmentResult
+	err        error
+}
+
+var errTranslateBatch = errors.New("translate sentence batch")
+
 const jobLeaseDuration = 5 * time.Minute
 const leaseRenewalInterval = 100 * time.Second    // renew at ~1/3 of jobLeaseDuration
 const expiredLeaseScanInterval = 30 * time.Second // how often the scanner polls for expired leases
 
-func NewManager(store translationStore, provider intelligence.TranslationProvider) *Manager {
+// NewManager returns a manager that keeps up to concurrency upstream calls in
+// flight per job. The shared intelligence.Limiter still caps the total
+// across jobs.
+func NewManager(store translationStore, provider intelligence.TranslationProvider, concurrency int) *Manager {
 	return &Manager{
-		store:    store,
-		provider: provider,
-		running:  make(map[string]struct{}),
+		store:       store,
+		provider:    provider,
+		concurrency: max(concurrency, 1),
+		running:     make(map[string]struct{}),
 	}
 }
 
@@ -191,17 +204,17 @@ func (m *Manager) StartReprocessing(translationID string, sentencesToProcess map
 			return
 		}
 
-		// Reuse existing full translation if set; only generate if absent.
+		// Reuse existing full translation if set; only generate if absent,
+		// alongside the re-segmentation as in runJob.
+		ctx, cancelJob := context.WithCancel(ctx)
+		defer cancelJob()
+		var fullTranslationFailure <-chan string
 		if item.FullTranslation == nil || *item.FullTranslation == "" {
-			fullTranslation, err := m.provider.TranslateFull(ctx, item.InputText)
-			if err != nil {
-				_ = m.store.Fail(translationID, "Failed to generate full translation: "+err.Error())
-				return
-			}
-			if err := m.store.SetFullTranslation(translationID, fullTranslation); err != nil {
-				_ = m.store.Fail(translationID, "Failed to store full translation: "+err.Error())
-				return
-			}
+			fullTranslationFailure = m.startFullTranslation(ctx, cancelJob, translationID, item.InputText)
+		} else {
+			ready := make(chan string, 1)
+			ready <- ""
+			fullTranslationFailure = ready
 		}
 
 		// Pre-segment all changed sentences to get the total count.
@@ -225,14 +238,18 @@ func (m *Manager) StartReprocessing(translationID string, sentencesToProcess map
 			}
 		}
 
-		for _, sentenceIdx := range orderedIdxs {
-			sentence := sentencesToProcess[sentenceIdx]
-			segments, err := m.provider.Segment(ctx, sentence)
-			if err != nil {
-				_ = m.store.Fail(translationID, "Failed to segment during reprocessing: "+err.Error())
-				return
-			}
-			for _, seg := range segments {
+		texts := make([]string, len(orderedIdxs))
+		for i, sentenceIdx := range orderedIdxs {
+			texts[i] = sentencesToProcess[sentenceIdx]
+		}
+		segmented, err := m.segmentSentences(ctx, texts)
+		if err != nil {
+			m.failJob(translationID, fullTranslationFailure, "Failed to segment during reprocessing: "+err.Error())
+			return
+		}
+		for i, sentenceIdx := range orderedIdxs {
+			sentence := texts[i]
+			for _, seg := range segmented[i] {
 				seg = strings.TrimSpace(seg)
 				if seg == "" {
 					continue
@@ -250,47 +267,46 @@ func (m *Manager) StartReprocessing(translationID string, sentencesToProcess map
 		}
 
 		// Group by sentence for batched translation.
-		type reprocessBatch struct {
-			sentenceIdx  int
-			sentenceText string
-			segments     []string
-		}
-		batchMap := make(map[int]*reprocessBatch)
+		batchMap := make(map[int]*sentenceBatch)
 		for _, work := range allWork {
 			b, ok := batchMap[work.sentenceIdx]
 			if !ok {
-				b = &reprocessBatch{sentenceIdx: work.sentenceIdx, sentenceText: work.sentenceText}
+				b = &sentenceBatch{sentenceIdx: work.sentenceIdx, sentenceText: work.sentenceText}
 				batchMap[work.sentenceIdx] = b
 			}
 			b.segments = append(b.segments, work.segment)
 		}
-
+		batches := make([]sentenceBatch, 0, len(batchMap))
 		for _, sentenceIdx := range orderedIdxs {
-			b, ok := batchMap[sentenceIdx]
-			if !ok {
-				continue
-			}
-			translated, err := m.provider.TranslateSentenceSegments(ctx, b.segments, b.sentenceText, item.InputText)
-			if err != nil || len(translated) == 0 {
-				_ = m.store.Fail(translationID, "Failed to translate segment during reprocessing")
-				return
-			}
-			for segIdx, result := range translated {
-				if err := m.store.AddReprocessedSegment(translationID, result, sentenceIdx, segIdx); err != nil {
-					_ = m.store.Fail(translationID, "Failed to store reprocessed segment")
-					return
-				}
+			if b, ok := batchMap[sentenceIdx]; ok {
+				batches = append(batches, *b)
 			}
 		}
 
-		if err := m.store.Complete(translationID); err != nil {
-			_ = m.store.Fail(translationID, "Failed to complete reprocessed translation")
+		err = m.translateBatches(ctx, batches, item.InputText, func(batch sentenceBatch, translated []translation.SegmentResult) error {
+			return m.store.AddReprocessedSegments(translationID, translated, batch.sentenceIdx)
+		})
+		if errors.Is(err, errTranslateBatch) {
+			m.failJob(translationID, fullTranslationFailure, "Failed to translate segment during reprocessing")
+			return
 		}
+		if err != nil {
+			m.failJob(translationID, fullTranslationFailure, "Failed to store reprocessed segment")
+			return
+		}
+
+		m.completeJob(translationID, fullTranslationFailure, "Failed to complete reprocessed translation")
 	}()
 }
 
 func (m *Manager) GetProgress(translationID string) (Progress, bool) {
-	snapshot, ok := m.store.GetProgressSnapshot(translationID)
+	return m.GetProgressSince(translationID, 0)
+}
+
+// GetProgressSince is GetProgress with Results limited to those after the
+// first fromResult, for callers that have already seen the earlier ones.
+func (m *Manager) GetProgressSince(translationID string, fromResult int) (Progress, bool) {
+	snapshot, ok := m.store.GetProgressSnapshot(translationID, fromResult)
 	if !ok {
 		return Progress{}, false
 	}
@@ -343,20 +359,24 @@ func (m *Manager) runJob(ctx context.Context, translationID string, item transla
 		}
 	}()
 
-	sentences := splitInputSentences(item.InputText)
+	sentences := translation.SplitSentences(item.InputText)
 	if len(sentences) == 0 {
 		_ = m.store.Fail(translationID, "No sentences found for segmentation")
 		return
 	}
 
-	fullTranslation, err := m.provider.TranslateFull(ctx, item.InputText)
-	if err != nil {
-		_ = m.store.Fail(translationID, "Failed to generate full translation: "+err.Error())
-		return
+	// The full translation runs alongside segmentation and segment
+	// translation instead of gating them, so the stream's start event and
+	// first progress events are not held back by it. It is awaited before the
+	// job completes; if it fails, the rest of the job is cancelled.
+	ctx, cancelJob := context.WithCancel(ctx)
+	defer cancelJob()
+	fullTranslationFailure := m.startFullTranslation(ctx, cancelJob, translationID, item.InputText)
+	fail := func(message string) {
+		m.failJob(translationID, fullTranslationFailure, message)
 	}
-	if err := m.store.SetFullTranslation(translationID, fullTranslation); err != nil {
-		_ = m.store.Fail(translationID, "Failed to store full translation: "+err.Error())
-		return
+	complete := func() {
+		m.completeJob(translationID, fullTranslationFailure, "Failed to complete translation")
 	}
 
 	queued, err := m.segmentInputBySentence(ctx, sentences)
@@ -365,12 +385,12 @@ func (m *Manager) runJob(ctx context.Context, translationID string, item transla
 		if len(msg) > 200 {
 			msg = msg[:200] + "..."
 		}
-		_ = m.store.Fail(translationID, "Failed to segment: "+msg)
+		fail("Failed to segment: " + msg)
 		return
 	}
 	total := len(queued)
 	if total == 0 {
-		_ = m.store.Fail(translationID, "No translatable segments found")
+		fail("No translatable segments found")
 		return
 	}
 
@@ -382,25 +402,17 @@ func (m *Manager) runJob(ctx context.Context, translationID string, item transla
 			sentenceInits[i] = translation.SentenceInit{Indent: s.Indent, Separator: s.Separator}
 		}
 		if err := m.store.SetProcessing(translationID, total, sentenceInits); err != nil {
-			_ = m.store.Fail(translationID, "Failed to initialise processing state: "+err.Error())
+			fail("Failed to initialise processing state: " + err.Error())
 			return
 		}
 	}
 
 	if startIndex >= len(queued) {
-		if err := m.store.Complete(translationID); err != nil {
-			_ = m.store.Fail(translationID, "Failed to complete translation")
-		}
+		complete()
 		return
 	}
 
 	// Group queued segments by sentence index for batched translation.
-	type sentenceBatch struct {
-		sentenceIdx  int
-		sentenceText string
-		segments     []string
-	}
-
 	var batches []sentenceBatch
 	var currentBatch *sentenceBatch
 	for idx := startIndex; idx < len(queued); idx++ {
@@ -420,33 +432,135 @@ func (m *Manager) runJob(ctx context.Context, translationID string, item transla
 		batches = append(batches, *currentBatch)
 	}
 
-	for _, batch := range batches {
-		translated, err := m.provider.TranslateSentenceSegments(ctx, batch.segments, batch.sentenceText, item.InputText)
-		if err != nil || len(translated) == 0 {
-			_ = m.store.Fail(translationID, "Failed to translate sentence segments")
-			return
+	err = m.translateBatches(ctx, batches, item.InputText, func(batch sentenceBatch, translated []translation.SegmentResult) error {
+		_, _, err := m.store.AddProgressSegments(translationID, translated, batch.sentenceIdx)
+		return err
+	})
+	if errors.Is(err, errTranslateBatch) {
+		fail("Failed to translate sentence segments")
+		return
+	}
+	if err != nil {
+		fail("Failed to update translation progress")
+		return
+	}
+
+	complete()
+}
+
+// startFullTranslation generates and stores the full translation in the
+// background. The returned channel yields the failure message, or "" on
+// success. A failure also calls cancel so the rest of the job stops early.
+func (m *Manager) startFullTranslation(ctx context.Context, cancel context.CancelFunc, translationID string, inputText string) <-chan string {
+	done := make(chan string, 1)
+	go func() {
+		failure := ""
+		fullTranslation, err := m.provider.TranslateFull(ctx, inputText)
+		if err != nil {
+			failure = "Failed to generate full translation: " + err.Error()
+		} else if err := m.store.SetFullTranslation(translationID, fullTranslation); err != nil {
+			failure = "Failed to store full translation: " + err.Error()
 		}
-		for _, segmentResult := range translated {
-			if _, _, err := m.store.AddProgressSegment(translationID, segmentResult, batch.sentenceIdx); err != nil {
-				_ = m.store.Fail(translationID, "Failed to update translation progress")
+		done <- failure
+		if failure != "" {
+			cancel()
+		}
+	}()
+	return done
+}
+
+// failJob fails the job with message, preferring the full-translation
+// failure when it is the reason the remaining work was cancelled.
+func (m *Manager) failJob(translationID string, fullTranslationFailure <-chan string, message string) {
+	select {
+	case failure := <-fullTranslationFailure:
+		if failure != "" {
+			message = failure
+		}
+	default:
+	}
+	_ = m.store.Fail(translationID, message)
+}
+
+// completeJob waits for the full translation and completes the job, or fails
+// it if the full translation could not be produced.
+func (m *Manager) completeJob(translationID string, fullTranslationFailure <-chan string, completeFailure string) {
+	if failure := <-fullTranslationFailure; failure != "" {
+		_ = m.store.Fail(translationID, failure)
+		return
+	}
+	if err := m.store.Complete(translationID); err != nil {
+		_ = m.store.Fail(translationID, completeFailure)
+	}
+}
+
+// translateBatches overlaps the per-sentence LLM round-trips, keeping up to
+// m.concurrency calls in flight, and hands each result to persist
+// strictly in batch order so stored progress stays sequential. Translation
+// failures are wrapped in errTranslateBatch; persist errors are returned as-is.
+// Outstanding calls are cancelled as soon as either kind of error occurs.
+func (m *Manager) translateBatches(ctx context.Context, batches []sentenceBatch, fullText string, persist func(sentenceBatch, []translation.SegmentResult) error) error {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	results := make([]chan batchResult, len(batches))
+	for i := range results {
+		results[i] = make(chan batchResult, 1)
+	}
+
+	// Feed batch indices in order so earlier sentences are translated first
+	// and the persist loop below rarely waits behind a later batch.
+	next := make(chan int)
+	go func() {
+		defer close(next)
+		for i := range batches {
+			select {
+			case next <- i:
+			case <-ctx.Done():
 				return
 			}
 		}
+	}()
+
+	workers := min(m.concurrency, len(batches))
+	for w := 0; w < workers; w++ {
+		go func() {
+			for i := range next {
+				batch := batches[i]
+				translated, err := m.provider.TranslateSentenceSegments(ctx, batch.segments, batch.sentenceText, fullText)
+				results[i] <- batchResult{translated: translated, err: err}
+			}
+		}()
 	}
 
-	if err := m.store.Complete(translationID); err != nil {
-		_ = m.store.Fail(translationID, "Failed to complete translation")
+	for i, batch := range batches {
+		res := <-results[i]
+		if res.err != nil {
+			return fmt.Errorf("%w %d: %v", errTranslateBatch, batch.sentenceIdx, res.err)
+		}
+		if len(res.translated) == 0 {
+			return fmt.Errorf("%w %d: empty result", errTranslateBatch, batch.sentenceIdx)
+		}
+		if err := persist(batch, res.translated); err != nil {
+			return err
+		}
 	}
+	return nil
 }
 
-func (m *Manager) segmentInputBySentence(ctx context.Context, sentences []sentenceInfo) ([]queuedSegment, error) {
+func (m *Manager) segmentInputBySentence(ctx context.Context, sentences []translation.SentenceSplit) ([]queuedSegment, error) {
+	texts := make([]string, len(sentences))
+	for i, sent := range sentences {
+		texts[i] = sent.Text
+	}
+	segmented, err := m.segmentSentences(ctx, texts)
+	if err != nil {
+		return nil, err
+	}
+
 	queued := make([]queuedSegment, 0, len(sentences)*4)
 	for sentenceIdx, sent := range sentences {
-		segments, err := m.provider.Segment(ctx, sent.Text)
-		if err != nil {
-			return nil, err
-		}
-		for _, seg := range segments {
+		for _, seg := range segmented[sentenceIdx] {
 			seg = strings.TrimSpace(seg)
 			if seg == "" {
 				continue
@@ -461,82 +575,55 @@ func (m *Manager) segmentInputBySentence(ctx context.Context, sentences []senten
 	return queued, nil
 }
 
-func splitInputSentences(text string) []sentenceInfo {
-	var out []sentenceInfo
-	var sentence strings.Builder
-	var lineIndent strings.Builder
-	atLineStart := true
+// segmentSentences runs Segment for every sentence with up to
+// m.concurrency calls in flight and returns the segments in input
+// order. The first error cancels the remaining calls.
+func (m *Manager) segmentSentences(ctx context.Context, texts []string) ([][]string, error) {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
 
-	addSeparatorChar := func(r rune) {
-		if len(out) > 0 {
-			out[len(out)-1].Separator += string(r)
-		}
-	}
-
-	for len(text) > 0 {
-		r, size := utf8.DecodeRuneInString(text)
-		text = text[size:]
-
-		if atLineStart {
-			if r == ' ' || r == '\t' {
-				lineIndent.WriteRune(r)
-				continue
-			}
-			if r == '\n' || r == '\r' {
-				addSeparatorChar(r)
-				lineIndent.Reset()
-				// atLineStart stays true
-				continue
-			}
-			atLineStart = false
-		}
-
-		if r == '\n' || r == '\r' {
-			s := strings.TrimSpace(sentence.String())
-			if s != "" {
-				out = append(out, sentenceInfo{
-					Text:   s,
-					Indent: lineIndent.String(),
-				})
+	out := make([][]string, len(texts))
+	next := make(chan int)
+	go func() {
+		defer close(next)
+		for i := range texts {
+			select {
+			case next <- i:
+			case <-ctx.Done():
+				return
 			}
-			addSeparatorChar(r)
-			sentence.Reset()
-			lineIndent.Reset()
-			atLineStart = true
-			continue
 		}
+	}()
 
-		sentence.WriteRune(r)
-		if isSentenceDelimiter(r) {
-			s := strings.TrimSpace(sentence.String())
-			if s != "" {
-				out = append(out, sentenceInfo{
-					Text:   s,
-					Indent: lineIndent.String(),
-				})
-				sentence.Reset()
-				lineIndent.Reset()
+	var (
+		wg       sync.WaitGroup
+		errOnce  sync.Once
+		firstErr error
+	)
+	workers := min(m.concurrency, len(texts))
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				segments, err := m.provider.Segment(ctx, texts[i])
+				if err != nil {
+					errOnce.Do(func() {
+						firstErr = err
+						cancel()
+					})
+					continue
+				}
+				out[i] = segments
 			}
-		}
-	}
-
-	if s := strings.TrimSpace(sentence.String()); s != "" {
-		out = append(out, sentenceInfo{
-			Text:   s,
-			Indent: lineIndent.String(),
-		})
+		}()
 	}
+	wg.Wait()
 
-	return out
-}
-
-func isSentenceDelimiter(r rune) bool {
-	switch r {
-	case '。', '！', '？', '!', '?', ';', '；':
-		return true
-	default:
-		return false
+	if firstErr != nil {
+		return nil, firstErr
 	}
+	return out, nil
 }
 
 func (m *Manager) removeRunning(translationID string) {
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 	"time"
 
@@ -78,7 +79,7 @@ func TestQueueProgressLifecycle(t *testing.T) {
 		t.Fatalf("run migrations: %v", err)
 	}
 	store := newTranslationStoreForTest(t, dbPath)
-	manager := NewManager(store, &mockProvider{})
+	manager := NewManager(store, &mockProvider{}, 4)
 
 	item, err := store.Create("你好世界", "text")
 	if err != nil {
@@ -120,6 +121,17 @@ func TestQueueProgressLifecycle(t *testing.T) {
 		t.Fatal("expected full translation to be set")
 	}
 
+	all, _ := manager.GetProgress(item.ID)
+	rest, ok := manager.GetProgressSince(item.ID, 1)
+	if !ok {
+		t.Fatal("expected progress since first result")
+	}
+	if len(rest.Results) != len(all.Results)-1 {
+		t.Fatalf("expected %d results after the first, got %d", len(all.Results)-1, len(rest.Results))
+	}
+	if len(rest.Results) > 0 && rest.Results[0] != all.Results[1] {
+		t.Fatalf("expected results to resume at the second one, got %+v", rest.Results[0])
+	}
 }
 
 func TestQueueProgressSurvivesManagerRestart(t *testing.T) {
@@ -129,7 +141,7 @@ func TestQueueProgressSurvivesManagerRestart(t *testing.T) {
 		t.Fatalf("run migrations: %v", err)
 	}
 	store := newTranslationStoreForTest(t, dbPath)
-	manager := NewManager(store, &mockProvider{})
+	manager := NewManager(store, &mockProvider{}, 4)
 
 	item, err := store.Create("你好", "text")
 	if err != nil {
@@ -151,7 +163,7 @@ func TestQueueProgressSurvivesManagerRestart(t *testing.T) {
 	}
 
 	// Simulate process restart by creating a new manager over same DB-backed store.
-	managerAfterRestart := NewManager(store, &mockProvider{})
+	managerAfterRestart := NewManager(store, &mockProvider{}, 4)
 	progress, ok := managerAfterRestart.GetProgress(item.ID)
 	if !ok {
 		t.Fatal("expected progress to be recoverable from DB after restart")
@@ -181,7 +193,7 @@ func TestResumeRestartableJobsCompletesPendingTranslation(t *testing.T) {
 	}
 
 	// Simulate startup: new manager should discover and process pending jobs.
-	manager := NewManager(store, &mockProvider{})
+	manager := NewManager(store, &mockProvider{}, 4)
 	manager.ResumeRestartableJobs()
 
 	deadline := time.Now().Add(2 * time.Second)
@@ -213,7 +225,7 @@ func TestTranslateFullFailureFails(t *testing.T) {
 	}
 	store := newTranslationStoreForTest(t, dbPath)
 	provider := &mockProvider{translateFullErr: fmt.Errorf("upstream unavailable")}
-	manager := NewManager(store, provider)
+	manager := NewManager(store, provider, 4)
 
 	item, err := store.Create("你好世界", "text")
 	if err != nil {
@@ -252,7 +264,7 @@ func TestReprocessingPreservesFullTranslation(t *testing.T) {
 	}
 	store := newTranslationStoreForTest(t, dbPath)
 	provider := &mockProvider{}
-	manager := NewManager(store, provider)
+	manager := NewManager(store, provider, 4)
 
 	item, err := store.Create("你好世界", "text")
 	if err != nil {
@@ -312,7 +324,7 @@ func TestReprocessingGeneratesFullTranslationWhenAbsent(t *testing.T) {
 	}
 	store := newTranslationStoreForTest(t, dbPath)
 	provider := &mockProvider{}
-	manager := NewManager(store, provider)
+	manager := NewManager(store, provider, 4)
 
 	// Create a translation that has never been processed (full_translation is NULL).
 	item, err := store.Create("你好世界", "text")
@@ -365,7 +377,7 @@ func TestScannerRecoversStaleLeasedJob(t *testing.T) {
 	}
 	time.Sleep(5 * time.Millisecond) // ensure lease has expired
 
-	manager := NewManager(store, &mockProvider{})
+	manager := NewManager(store, &mockProvider{}, 4)
 	manager.ResumeRestartableJobs()
 
 	deadline := time.Now().Add(2 * time.Second)
@@ -389,7 +401,7 @@ func TestScannerDoesNotDoubleProcessActiveJob(t *testing.T) {
 		t.Fatalf("run migrations: %v", err)
 	}
 	store := newTranslationStoreForTest(t, dbPath)
-	manager := NewManager(store, &mockProvider{})
+	manager := NewManager(store, &mockProvider{}, 4)
 
 	item, err := store.Create("你好世界", "text")
 	if err != nil {
@@ -424,3 +436,197 @@ func TestScannerDoesNotDoubleProcessActiveJob(t *testing.T) {
 		time.Sleep(20 * time.Millisecond)
 	}
 }
+
+type concurrentMockProvider struct {
+	mockProvider
+	mu          sync.Mutex
+	inFlight    int
+	maxInFlight int
+}
+
+func (m *concurrentMockProvider) TranslateSentenceSegments(ctx context.Context, segments []string, sentence string, fullText string) ([]translation.SegmentResult, error) {
+	m.mu.Lock()
+	m.inFlight++
+	if m.inFlight > m.maxInFlight {
+		m.maxInFlight = m.inFlight
+	}
+	m.mu.Unlock()
+	defer func() {
+		m.mu.Lock()
+		m.inFlight--
+		m.mu.Unlock()
+	}()
+
+	time.Sleep(20 * time.Millisecond)
+	return m.mockProvider.TranslateSentenceSegments(ctx, segments, sentence, fullText)
+}
+
+func TestTranslateBatchesOverlapsCallsAndPersistsInOrder(t *testing.T) {
+	provider := &concurrentMockProvider{}
+	manager := NewManager(nil, provider, 4)
+
+	batches := make([]sentenceBatch, 8)
+	for i := range batches {
+		batches[i] = sentenceBatch{sentenceIdx: i, sentenceText: fmt.Sprintf("句%d", i), segments: []string{fmt.Sprintf("句%d", i)}}
+	}
+
+	var persisted []int
+	err := manager.translateBatches(context.Background(), batches, "full", func(batch sentenceBatch, translated []translation.SegmentResult) error {
+		if len(translated) != 1 || translated[0].Segment != batch.segments[0] {
+			t.Fatalf("unexpected results for batch %d: %+v", batch.sentenceIdx, translated)
+		}
+		persisted = append(persisted, batch.sentenceIdx)
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("translate batches: %v", err)
+	}
+	for i, idx := range persisted {
+		if idx != i {
+			t.Fatalf("expected in-order persistence, got %v", persisted)
+		}
+	}
+	if len(persisted) != len(batches) {
+		t.Fatalf("expected %d persisted batches, got %d", len(batches), len(persisted))
+	}
+	if provider.maxInFlight < 2 || provider.maxInFlight > manager.concurrency {
+		t.Fatalf("expected between 2 and %d concurrent calls, got %d", manager.concurrency, provider.maxInFlight)
+	}
+}
+
+func TestTranslateBatchesStopsOnPersistError(t *testing.T) {
+	manager := NewManager(nil, &mockProvider{}, 4)
+	batches := []sentenceBatch{
+		{sentenceIdx: 0, sentenceText: "你", segments: []string{"你"}},
+		{sentenceIdx: 1, sentenceText: "好", segments: []string{"好"}},
+	}
+
+	persistErr := fmt.Errorf("disk full")
+	calls := 0
+	err := manager.translateBatches(context.Background(), batches, "你好", func(sentenceBatch, []translation.SegmentResult) error {
+		calls++
+		return persistErr
+	})
+	if err != persistErr {
+		t.Fatalf("expected persist error, got %v", err)
+	}
+	if calls != 1 {
+		t.Fatalf("expected persist to stop after first failure, got %d calls", calls)
+	}
+}
+
+type slowSegmentProvider struct {
+	mockProvider
+	mu          sync.Mutex
+	inFlight    int
+	maxInFlight int
+	failOn      string
+}
+
+func (m *slowSegmentProvider) Segment(ctx context.Context, text string) ([]string, error) {
+	m.mu.Lock()
+	m.inFlight++
+	m.maxInFlight = max(m.maxInFlight, m.inFlight)
+	m.mu.Unlock()
+	defer func() {
+		m.mu.Lock()
+		m.inFlight--
+		m.mu.Unlock()
+	}()
+
+	time.Sleep(20 * time.Millisecond)
+	if text == m.failOn {
+		return nil, fmt.Errorf("segment %q failed", text)
+	}
+	return m.mockProvider.Segment(ctx, text)
+}
+
+func TestSegmentSentencesRunsConcurrentlyInOrder(t *testing.T) {
+	provider := &slowSegmentProvider{}
+	manager := NewManager(nil, provider, 4)
+
+	texts := []string{"你好", "世界", "早上", "晚安", "再见", "谢谢"}
+	segmented, err := manager.segmentSentences(context.Background(), texts)
+	if err != nil {
+		t.Fatalf("segment sentences: %v", err)
+	}
+	for i, text := range texts {
+		if strings.Join(segmented[i], "") != text {
+			t.Fatalf("sentence %d: expected segments of %q, got %v", i, text, segmented[i])
+		}
+	}
+	if provider.maxInFlight < 2 {
+		t.Fatalf("expected overlapping Segment calls, max in flight was %d", provider.maxInFlight)
+	}
+}
+
+func TestSegmentSentencesReturnsFirstError(t *testing.T) {
+	manager := NewManager(nil, &slowSegmentProvider{failOn: "世界"}, 4)
+	if _, err := manager.segmentSentences(context.Background(), []string{"你好", "世界", "再见"}); err == nil {
+		t.Fatal("expected segmentation error")
+	}
+}
+
+type blockingFullProvider struct {
+	mockProvider
+	release chan struct{}
+}
+
+func (m *blockingFullProvider) TranslateFull(ctx context.Context, text string) (string, error) {
+	select {
+	case <-m.release:
+	case <-ctx.Done():
+		return "", ctx.Err()
+	}
+	return "mock translation of: " + text, nil
+}
+
+func TestSegmentProgressDoesNotWaitForFullTranslation(t *testing.T) {
+	tmp := t.TempDir()
+	dbPath := filepath.Join(tmp, "translations.db")
+	if err := migrations.RunUp(dbPath, filepath.Join("..", "..", "migrations")); err != nil {
+		t.Fatalf("run migrations: %v", err)
+	}
+	store := newTranslationStoreForTest(t, dbPath)
+	provider := &blockingFullProvider{release: make(chan struct{})}
+	manager := NewManager(store, provider, 4)
+
+	item, err := store.Create("你好世界", "text")
+	if err != nil {
+		t.Fatalf("create translation: %v", err)
+	}
+
+	manager.StartProcessing(item.ID)
+
+	deadline := time.Now().Add(2 * time.Second)
+	for {
+		progress, ok := manager.GetProgress(item.ID)
+		if ok && progress.Total > 0 && progress.Current == progress.Total {
+			if progress.Status == "completed" {
+				t.Fatal("expected completion to wait for the full translation")
+			}
+			break
+		}
+		if time.Now().After(deadline) {
+			t.Fatal("timed out waiting for segment progress while full translation was pending")
+		}
+		time.Sleep(20 * time.Millisecond)
+	}
+
+	close(provider.release)
+
+	deadline = time.Now().Add(2 * time.Second)
+	for {
+		tr, ok := store.Get(item.ID)
+		if ok && tr.Status == "completed" {
+			if tr.FullTranslation == nil || *tr.FullTranslation == "" {
+				t.Fatal("expected full translation to be stored before completion")
+			}
+			return
+		}
+		if time.Now().After(deadline) {
+			t.Fatal("timed out waiting for completion")
+		}
+		time.Sleep(20 * time.Millisecond)
+	}
+}
@@ -3,40 +3,70 @@ package translation
 import (
 	"database/sql"
 	"fmt"
+	"net/url"
 	"strings"
 	"time"
 
 	_ "modernc.org/sqlite"
 )
 
+// connectionPragmas are passed to the sqlite driver through the DSN so they
+// are applied to every pooled connection, not only the first one
+// database/sql happens to hand out. WAL with synchronous=NORMAL lets readers
+// proceed alongside the single writer and only fsyncs at checkpoints.
+// cache_size is per connection, so it is kept to 16 MiB rather than 64 MiB:
+// reads are mostly served from the shared mmap, and a full pool would
+// otherwise pin up to 640 MiB of private page cache.
+var connectionPragmas = []string{
+	"foreign_keys(1)",
+	"busy_timeout(5000)",
+	"journal_mode(WAL)",
+	"synchronous(NORMAL)",
+	"temp_store(MEMORY)",
+	"mmap_size(268435456)",
+	"cache_size(-16384)",
+}
+
+// maxOpenConns bounds the pool. WAL allows any number of concurrent readers,
+// but SQLite still serialises writers, so a larger pool only adds lock
+// contention. Idle connections are kept at the same size so a burst of
+// requests does not close and reopen connections, which would re-run the
+// pragmas and drop every statement prepared on them.
+const maxOpenConns = 10
+
 func NewDB(dbPath string) (*DB, error) {
 	if dbPath == "" {
 		return nil, fmt.Errorf("translation db path is required")
 	}
 
-	conn, err := sql.Open("sqlite", dbPath)
+	conn, err := sql.Open("sqlite", sqliteDSN(dbPath, connectionPragmas))
 	if err != nil {
 		return nil, fmt.Errorf("open sqlite db: %w", err)
 	}
-
-	if _, err := conn.Exec(`PRAGMA foreign_keys = ON;`); err != nil {
-		_ = conn.Close()
-		return nil, fmt.Errorf("enable foreign keys: %w", err)
-	}
-	if _, err := conn.Exec(`PRAGMA journal_mode = WAL;`); err != nil {
-		_ = conn.Close()
-		return nil, fmt.Errorf("set wal mode: %w", err)
-	}
-	if _, err := conn.Exec(`PRAGMA busy_timeout = 3000;`); err != nil {
-		_ = conn.Close()
-		return nil, fmt.Errorf("set busy timeout: %w", err)
-	}
+	conn.SetMaxOpenConns(maxOpenConns)
+	conn.SetMaxIdleConns(maxOpenConns)
+	conn.SetConnMaxIdleTime(0)
 	if err := verifySchema(conn); err != nil {
 		_ = conn.Close()
 		return nil, err
 	}
 
-	return &DB{Conn: conn}, nil
+	return &DB{Conn: conn, stmts: newStmtCache(conn)}, nil
+}
+
+func sqliteDSN(dbPath string, pragmas []string) string {
+	if len(pragmas) == 0 {
+		return dbPath
+	}
+	values := url.Values{}
+	for _, pragma := range pragmas {
+		values.Add("_pragma", pragma)
+	}
+	sep := "?"
+	if strings.Contains(dbPath, "?") {
+		sep = "&"
+	}
+	return dbPath + sep + values.Encode()
 }
 
 func verifySchema(db *sql.DB) error {
@@ -1,6 +1,7 @@
 package translation
 
 import (
+	"context"
 	"path/filepath"
 	"strings"
 	"testing"
@@ -44,3 +45,72 @@ func TestRunUpIsIdempotentAndCreatesUsableSchema(t *testing.T) {
 		t.Fatal("expected translation id")
 	}
 }
+
+func TestNewDBAppliesPragmasToEveryConnection(t *testing.T) {
+	dbPath := filepath.Join(t.TempDir(), "translations.db")
+	if err := migrations.RunUp(dbPath, filepath.Join("..", "..", "migrations")); err != nil {
+		t.Fatalf("run migrations: %v", err)
+	}
+	db, err := NewDB(dbPath)
+	if err != nil {
+		t.Fatalf("new db: %v", err)
+	}
+	defer db.Conn.Close()
+	if got := db.Conn.Stats().MaxOpenConnections; got != maxOpenConns {
+		t.Fatalf("expected pool size %d, got %d", maxOpenConns, got)
+	}
+
+	ctx := context.Background()
+	for i := 0; i < 2; i++ {
+		conn, err := db.Conn.Conn(ctx)
+		if err != nil {
+			t.Fatalf("acquire connection %d: %v", i, err)
+		}
+		defer conn.Close()
+
+		var journalMode string
+		if err := conn.QueryRowContext(ctx, `PRAGMA journal_mode`).Scan(&journalMode); err != nil {
+			t.Fatalf("read journal_mode: %v", err)
+		}
+		if !strings.EqualFold(journalMode, "wal") {
+			t.Fatalf("connection %d: expected wal journal mode, got %q", i, journalMode)
+		}
+		var synchronous, foreignKeys int
+		if err := conn.QueryRowContext(ctx, `PRAGMA synchronous`).Scan(&synchronous); err != nil {
+			t.Fatalf("read synchronous: %v", err)
+		}
+		if synchronous != 1 {
+			t.Fatalf("connection %d: expected synchronous=NORMAL (1), got %d", i, synchronous)
+		}
+		if err := conn.QueryRowContext(ctx, `PRAGMA foreign_keys`).Scan(&foreignKeys); err != nil {
+			t.Fatalf("read foreign_keys: %v", err)
+		}
+		if foreignKeys != 1 {
+			t.Fatalf("connection %d: expected foreign keys enabled, got %d", i, foreignKeys)
+		}
+		var cacheSize, busyTimeout int
+		if err := conn.QueryRowContext(ctx, `PRAGMA cache_size`).Scan(&cacheSize); err != nil {
+			t.Fatalf("read cache_size: %v", err)
+		}
+		if cacheSize != -16384 {
+			t.Fatalf("connection %d: expected cache_size=-16384, got %d", i, cacheSize)
+		}
+		if err := conn.QueryRowContext(ctx, `PRAGMA busy_timeout`).Scan(&busyTimeout); err != nil {
+			t.Fatalf("read busy_timeout: %v", err)
+		}
+		if busyTimeout != 5000 {
+			t.Fatalf("connection %d: expected busy_timeout=5000, got %d", i, busyTimeout)
+		}
+	}
+}
+
+func TestSQLiteDSN(t *testing.T) {
+	got := sqliteDSN("/tmp/app.db", []string{"foreign_keys(1)", "busy_timeout(3000)"})
+	want := "/tmp/app.db?_pragma=foreign_keys%281%29&_pragma=busy_timeout%283000%29"
+	if got != want {
+		t.Fatalf("sqliteDSN() = %q, want %q", got, want)
+	}
+	if got := sqliteDSN("file:app.db?mode=rwc", []string{"foreign_keys(1)"}); got != "file:app.db?mode=rwc&_pragma=foreign_keys%281%29" {
+		t.Fatalf("unexpected DSN for path with query: %q", got)
+	}
+}
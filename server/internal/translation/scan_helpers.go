@@ -1,40 +1,10 @@
 package translation
 
 import (
-	"database/sql"
 	"fmt"
 	"strconv"
 )
 
-func rowsToMaps(rows *sql.Rows) ([]map[string]any, error) {
-	columns, err := rows.Columns()
-	if err != nil {
-		return nil, err
-	}
-	out := make([]map[string]any, 0)
-	for rows.Next() {
-		values := make([]any, len(columns))
-		ptrs := make([]any, len(columns))
-		for i := range values {
-			ptrs[i] = &values[i]
-		}
-		if err := rows.Scan(ptrs...); err != nil {
-			return nil, err
-		}
-		obj := make(map[string]any, len(columns))
-		for i, col := range columns {
-			switch v := values[i].(type) {
-			case []byte:
-				obj[col] = string(v)
-			default:
-				obj[col] = v
-			}
-		}
-		out = append(out, obj)
-	}
-	return out, rows.Err()
-}
-
 func toString(v any) string {
 	switch x := v.(type) {
 	case string:
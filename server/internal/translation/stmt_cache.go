@@ -0,0 +1,63 @@
+package translation
+
+import (
+	"database/sql"
+	"sync"
+)
+
+// stmtCache prepares hot, fixed-text queries once and reuses the prepared
+// statements across calls. database/sql re-prepares a cached statement on
+// each pooled connection the first time it is used there. The set of queries
+// is small and fixed after warm-up, which is the case sync.Map serves without
+// any locking on the hit path.
+type stmtCache struct {
+	db    *sql.DB
+	stmts sync.Map // query string -> *sql.Stmt
+}
+
+func newStmtCache(db *sql.DB) *stmtCache {
+	return &stmtCache{db: db}
+}
+
+func (c *stmtCache) prepare(query string) (*sql.Stmt, error) {
+	if stmt, ok := c.stmts.Load(query); ok {
+		return stmt.(*sql.Stmt), nil
+	}
+	stmt, err := c.db.Prepare(query)
+	if err != nil {
+		return nil, err
+	}
+	// Two goroutines can miss on the same query at once; keep whichever
+	// statement was stored first and release the other.
+	if existing, loaded := c.stmts.LoadOrStore(query, stmt); loaded {
+		_ = stmt.Close()
+		return existing.(*sql.Stmt), nil
+	}
+	return stmt, nil
+}
+
+func (c *stmtCache) exec(query string, args ...any) (sql.Result, error) {
+	stmt, err := c.prepare(query)
+	if err != nil {
+		return nil, err
+	}
+	return stmt.Exec(args...)
+}
+
+func (c *stmtCache) query(query string, args ...any) (*sql.Rows, error) {
+	stmt, err := c.prepare(query)
+	if err != nil {
+		return nil, err
+	}
+	return stmt.Query(args...)
+}
+
+// queryRow falls back to an unprepared query when preparation fails so the
+// error surfaces from Scan, matching *sql.DB.QueryRow.
+func (c *stmtCache) queryRow(query string, args ...any) *sql.Row {
+	stmt, err := c.prepare(query)
+	if err != nil {
+		return c.db.QueryRow(query, args...)
+	}
+	return stmt.QueryRow(args...)
+}
@@ -0,0 +1,37 @@
+package translation
+
+import "testing"
+
+func TestStmtCacheReusesPreparedStatement(t *testing.T) {
+	store := newTranslationStoreWithMigrations(t)
+
+	const query = `SELECT COUNT(*) FROM translations WHERE status = ?`
+	first, err := store.stmts.prepare(query)
+	if err != nil {
+		t.Fatalf("prepare: %v", err)
+	}
+	second, err := store.stmts.prepare(query)
+	if err != nil {
+		t.Fatalf("prepare again: %v", err)
+	}
+	if first != second {
+		t.Fatal("expected cached statement to be reused")
+	}
+
+	var count int
+	if err := store.stmts.queryRow(query, "pending").Scan(&count); err != nil {
+		t.Fatalf("query cached statement: %v", err)
+	}
+	if count != 0 {
+		t.Fatalf("expected no pending translations, got %d", count)
+	}
+}
+
+func TestStmtCacheQueryRowSurfacesPrepareError(t *testing.T) {
+	store := newTranslationStoreWithMigrations(t)
+
+	var count int
+	if err := store.stmts.queryRow(`SELECT COUNT(*) FROM missing_table`).Scan(&count); err == nil {
+		t.Fatal("expected error for invalid query")
+	}
+}
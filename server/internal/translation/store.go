@@ -156,11 +156,13 @@ type UserProfile struct {
 }
 
 type DB struct {
-	Conn *sql.DB
+	Conn  *sql.DB
+	stmts *stmtCache
 }
 
 type TranslationStore struct {
-	db *sql.DB
+	db    *sql.DB
+	stmts *stmtCache
 }
 
 type ChatStore struct {
@@ -168,7 +170,8 @@ type ChatStore struct {
 }
 
 type SRSStore struct {
-	db *sql.DB
+	db    *sql.DB
+	stmts *stmtCache
 }
 
 type ProfileStore struct {
@@ -176,7 +179,7 @@ type ProfileStore struct {
 }
 
 func NewTranslationStore(db *DB) *TranslationStore {
-	return &TranslationStore{db: db.Conn}
+	return &TranslationStore{db: db.Conn, stmts: db.stmts}
 }
 
 func NewChatStore(db *DB) *ChatStore {
@@ -184,7 +187,7 @@ func NewChatStore(db *DB) *ChatStore {
 }
 
 func NewSRSStore(db *DB) *SRSStore {
-	return &SRSStore{db: db.Conn}
+	return &SRSStore{db: db.Conn, stmts: db.stmts}
 }
 
 func NewProfileStore(db *DB) *ProfileStore {
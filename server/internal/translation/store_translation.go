@@ -181,7 +181,11 @@ func (s *TranslationStore) SetProcessing(id string, total int, sentences []Sente
 	return nil
 }
 
-func (s *TranslationStore) AddProgressSegment(id string, result SegmentResult, sentenceIndex int) (int, int, error) {
+// AddProgressSegments appends a sentence's translated segments and advances
+// the progress counter by len(results) in a single transaction, so a sentence
+// costs one commit rather than one per segment. It returns the new progress
+// and total.
+func (s *TranslationStore) AddProgressSegments(id string, results []SegmentResult, sentenceIndex int) (int, int, error) {
 	tx, err := s.db.Begin()
 	if err != nil {
 		return 0, 0, fmt.Errorf("begin add progress tx: %w", err)
@@ -198,7 +202,6 @@ func (s *TranslationStore) AddProgressSegment(id string, result SegmentResult, s
 		return 0, 0, fmt.Errorf("load progress state: %w", err)
 	}
 
-	segIdx := progress
 	if _, err := tx.Exec(
 		`INSERT INTO translation_sentences (id, translation_id, sentence_idx, indent, separator)
 		 VALUES (?, ?, ?, '', '')
@@ -209,22 +212,26 @@ func (s *TranslationStore) AddProgressSegment(id string, result SegmentResult, s
 	); err != nil {
 		return 0, 0, fmt.Errorf("ensure sentence row: %w", err)
 	}
-	if _, err := tx.Exec(
-		`INSERT INTO translation_segments (id, translation_id, sentence_idx, seg_idx, segment_text, pinyin, english, created_at)
-		 VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
-		fmt.Sprintf("%s:%d:%d", id, sentenceIndex, segIdx),
-		id,
-		sentenceIndex,
-		segIdx,
-		result.Segment,
-		result.Pinyin,
-		result.English,
-		time.Now().UTC().Format(time.RFC3339Nano),
-	); err != nil {
-		return 0, 0, fmt.Errorf("insert translation segment: %w", err)
+	createdAt := time.Now().UTC().Format(time.RFC3339Nano)
+	for _, result := range results {
+		segIdx := progress
+		if _, err := tx.Exec(
+			`INSERT INTO translation_segments (id, translation_id, sentence_idx, seg_idx, segment_text, pinyin, english, created_at)
+			 VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
+			fmt.Sprintf("%s:%d:%d", id, sentenceIndex, segIdx),
+			id,
+			sentenceIndex,
+			segIdx,
+			result.Segment,
+			result.Pinyin,
+			result.English,
+			createdAt,
+		); err != nil {
+			return 0, 0, fmt.Errorf("insert translation segment: %w", err)
+		}
+		progress++
 	}
 
-	progress++
 	if total == 0 {
 		total = progress
 	}
@@ -341,19 +348,25 @@ func (s *TranslationStore) Fail(id string, message string) error {
 	return nil
 }
 
-func (s *TranslationStore) GetProgressSnapshot(id string) (ProgressSnapshot, bool) {
-	row := s.db.QueryRow(`SELECT status, progress, total, COALESCE(error_message, '') FROM translations WHERE id = ?`, id)
+// GetProgressSnapshot returns the job's status and counters together with its
+// segment results from position fromResult on, in (sentence_idx, seg_idx)
+// order. A live stream passes the number of results it has already sent, so
+// each poll reads only the new rows rather than the whole job.
+func (s *TranslationStore) GetProgressSnapshot(id string, fromResult int) (ProgressSnapshot, bool) {
+	row := s.stmts.queryRow(`SELECT status, progress, total, COALESCE(error_message, '') FROM translations WHERE id = ?`, id)
 	var snapshot ProgressSnapshot
 	if err := row.Scan(&snapshot.Status, &snapshot.Current, &snapshot.Total, &snapshot.Error); err != nil {
 		return ProgressSnapshot{}, false
 	}
 
-	rows, err := s.db.Query(
+	rows, err := s.stmts.query(
 		`SELECT segment_text, pinyin, english, seg_idx, sentence_idx
 		 FROM translation_segments
 		 WHERE translation_id = ?
-		 ORDER BY sentence_idx ASC, seg_idx ASC`,
+		 ORDER BY sentence_idx ASC, seg_idx ASC
+		 LIMIT -1 OFFSET ?`,
 		id,
+		max(fromResult, 0),
 	)
 	if err != nil {
 		return ProgressSnapshot{}, false
@@ -376,7 +389,7 @@ func (s *TranslationStore) GetProgressSnapshot(id string) (ProgressSnapshot, boo
 }
 
 func (s *TranslationStore) getOnce(id string) (Translation, error) {
-	row := s.db.QueryRow(
+	row := s.stmts.queryRow(
 		`SELECT id, created_at, status, source_type, input_text, title, full_translation, error_message, progress, total
 		 FROM translations WHERE id = ?`,
 		id,
@@ -508,7 +521,7 @@ func (s *TranslationStore) UpdateTranslationSegments(translationID string, sente
 // the map of sentenceIdx → sentence for only changed/new sentences.
 // Returns an empty map (no error) when the new text produces no changes.
 func (s *TranslationStore) UpdateInputTextForReprocessing(id string, newText string) (map[int]string, error) {
-	sentences := splitStoreSentences(newText)
+	sentences := SplitSentences(newText)
 
 	// Compute hashes for the new sentences.
 	newHashes := make([]string, len(sentences))
@@ -652,9 +665,9 @@ func (s *TranslationStore) SetReprocessing(id string, total int) error {
 	return nil
 }
 
-// AddReprocessedSegment inserts a segment at an explicit (sentenceIdx, segIdx) position and
-// increments the global progress counter.
-func (s *TranslationStore) AddReprocessedSegment(id string, result SegmentResult, sentenceIdx int, segIdx int) error {
+// AddReprocessedSegments inserts a sentence's segments at seg_idx 0..n-1 and
+// advances the global progress counter by len(results), in one transaction.
+func (s *TranslationStore) AddReprocessedSegments(id string, results []SegmentResult, sentenceIdx int) error {
 	tx, err := s.db.Begin()
 	if err != nil {
 		return fmt.Errorf("begin add reprocessed segment tx: %w", err)
@@ -669,22 +682,25 @@ func (s *TranslationStore) AddReprocessedSegment(id string, result SegmentResult
 		return fmt.Errorf("load progress: %w", err)
 	}
 
-	if _, err := tx.Exec(
-		`INSERT INTO translation_segments (id, translation_id, sentence_idx, seg_idx, segment_text, pinyin, english, created_at)
-		 VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
-		fmt.Sprintf("%s:%d:%d", id, sentenceIdx, segIdx),
-		id,
-		sentenceIdx,
-		segIdx,
-		result.Segment,
-		result.Pinyin,
-		result.English,
-		time.Now().UTC().Format(time.RFC3339Nano),
-	); err != nil {
-		return fmt.Errorf("insert reprocessed segment: %w", err)
+	createdAt := time.Now().UTC().Format(time.RFC3339Nano)
+	for segIdx, result := range results {
+		if _, err := tx.Exec(
+			`INSERT INTO translation_segments (id, translation_id, sentence_idx, seg_idx, segment_text, pinyin, english, created_at)
+			 VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
+			fmt.Sprintf("%s:%d:%d", id, sentenceIdx, segIdx),
+			id,
+			sentenceIdx,
+			segIdx,
+			result.Segment,
+			result.Pinyin,
+			result.English,
+			createdAt,
+		); err != nil {
+			return fmt.Errorf("insert reprocessed segment: %w", err)
+		}
 	}
 
-	progress++
+	progress += len(results)
 	if _, err := tx.Exec(`UPDATE translations SET progress = ? WHERE id = ?`, progress, id); err != nil {
 		return fmt.Errorf("update progress: %w", err)
 	}
@@ -707,84 +723,93 @@ func (s *TranslationStore) UpdateTitle(id string, title string) error {
 	return nil
 }
 
-type storeSentenceInfo struct {
+// SentenceSplit is one sentence of input text together with the leading
+// indent of its line and the line breaks that follow it.
+type SentenceSplit struct {
 	Text      string
 	Indent    string
 	Separator string
 }
 
-// splitStoreSentences is a copy of the queue package's splitInputSentences logic,
-// kept here so the store package stays decoupled from queue.
-// It now also captures indent and separator for each sentence.
-func splitStoreSentences(text string) []storeSentenceInfo {
-	var out []storeSentenceInfo
-	var sentence strings.Builder
-	var lineIndent strings.Builder
-	atLineStart := true
-
-	addSeparatorChar := func(r rune) {
+// SplitSentences breaks input text into sentences on sentence-ending
+// punctuation and line breaks. The queue segments exactly these sentences and
+// UpdateInputText diffs against them, so both must share this one splitter.
+func SplitSentences(text string) []SentenceSplit {
+	var out []SentenceSplit
+	// Line breaks belong to the most recent sentence. They are collected here
+	// and attached once the next sentence starts (or at the end) rather than
+	// by growing its Separator a rune at a time, which was quadratic in the
+	// length of a run of blank lines.
+	var separator strings.Builder
+	addSeparator := func(r rune) {
 		if len(out) > 0 {
-			out[len(out)-1].Separator += string(r)
+			separator.WriteRune(r)
 		}
 	}
+	flushSeparator := func() {
+		if len(out) > 0 && separator.Len() > 0 {
+			out[len(out)-1].Separator = separator.String()
+			separator.Reset()
+		}
+	}
+	addSentence := func(s string, indent string) {
+		flushSeparator()
+		out = append(out, SentenceSplit{Text: s, Indent: indent})
+	}
 
-	for len(text) > 0 {
-		r, size := utf8.DecodeRuneInString(text)
-		text = text[size:]
-
+	// Sentences and indents are sliced straight out of text by byte offset.
+	atLineStart := true
+	indentStart, indentEnd := 0, 0
+	sentenceStart := 0
+	for i, r := range text {
 		if atLineStart {
 			if r == ' ' || r == '\t' {
-				lineIndent.WriteRune(r)
+				indentEnd = i + 1
 				continue
 			}
 			if r == '\n' || r == '\r' {
-				addSeparatorChar(r)
-				lineIndent.Reset()
+				addSeparator(r)
+				indentStart, indentEnd = i+1, i+1
 				continue
 			}
 			atLineStart = false
+			sentenceStart = i
 		}
 
 		if r == '\n' || r == '\r' {
-			s := strings.TrimSpace(sentence.String())
-			if s != "" {
-				out = append(out, storeSentenceInfo{
-					Text:   s,
-					Indent: lineIndent.String(),
-				})
+			if s := strings.TrimSpace(text[sentenceStart:i]); s != "" {
+				addSentence(s, text[indentStart:indentEnd])
 			}
-			addSeparatorChar(r)
-			sentence.Reset()
-			lineIndent.Reset()
+			addSeparator(r)
 			atLineStart = true
+			indentStart, indentEnd = i+1, i+1
 			continue
 		}
 
-		sentence.WriteRune(r)
-		if isStoreSentenceDelimiter(r) {
-			s := strings.TrimSpace(sentence.String())
-			if s != "" {
-				out = append(out, storeSentenceInfo{
-					Text:   s,
-					Indent: lineIndent.String(),
-				})
-				sentence.Reset()
-				lineIndent.Reset()
+		if IsSentenceDelimiter(r) {
+			end := i + utf8.RuneLen(r)
+			if s := strings.TrimSpace(text[sentenceStart:end]); s != "" {
+				addSentence(s, text[indentStart:indentEnd])
+				sentenceStart = end
+				indentStart, indentEnd = end, end
 			}
 		}
 	}
 
-	if s := strings.TrimSpace(sentence.String()); s != "" {
-		out = append(out, storeSentenceInfo{
-			Text:   s,
-			Indent: lineIndent.String(),
-		})
+	if !atLineStart {
+		if s := strings.TrimSpace(text[sentenceStart:]); s != "" {
+			addSentence(s, text[indentStart:indentEnd])
+		}
 	}
+	flushSeparator()
 
 	return out
 }
 
-func isStoreSentenceDelimiter(r rune) bool {
+// IsSentenceDelimiter reports whether r ends a sentence. It is the single
+// definition of sentence-ending punctuation shared by the store and the queue
+// so both split input text identically.
+func IsSentenceDelimiter(r rune) bool {
 	switch r {
 	case '。', '！', '？', '!', '?', ';', '；':
 		return true
@@ -793,8 +818,31 @@ func isStoreSentenceDelimiter(r rune) bool {
 	}
 }
 
+// IsCJKIdeograph reports whether r is a CJK unified ideograph. It is the single
+// definition shared by the store and the translation guards. Ranges are checked
+// in ascending order so that the common cases exit early: anything below
+// Extension A (ASCII, Latin, CJK punctuation, kana) costs one compare, and the
+// main block is settled by the next two.
+func IsCJKIdeograph(r rune) bool {
+	switch {
+	case r < 0x3400:
+		return false
+	case r <= 0x4DBF: // Extension A
+		return true
+	case r < 0x4E00:
+		return false
+	case r <= 0x9FFF: // Main CJK block
+		return true
+	case r < 0x20000:
+		return false
+	}
+	return r <= 0x2A6DF || // Extension B
+		(r >= 0x2A700 && r <= 0x2EBEF) || // Extensions C-I
+		(r >= 0x30000 && r <= 0x323AF) // Extensions G-H
+}
+
 func (s *TranslationStore) loadSentences(translationID string) []SentenceResult {
-	rows, err := s.db.Query(
+	rows, err := s.stmts.query(
 		`SELECT sentence_idx, indent, separator
 		 FROM translation_sentences
 		 WHERE translation_id = ?
@@ -827,7 +875,7 @@ func (s *TranslationStore) loadSentences(translationID string) []SentenceResult
 	}
 
 	for i, sentenceIdx := range indices {
-		segRows, err := s.db.Query(
+		segRows, err := s.stmts.query(
 			`SELECT segment_text, pinyin, english
 			 FROM translation_segments
 			 WHERE translation_id = ? AND sentence_idx = ?
@@ -2,6 +2,7 @@ package translation
 
 import (
 	"path/filepath"
+	"strings"
 	"testing"
 
 	"github.com/anath2/language-app/internal/migrations"
@@ -20,3 +21,50 @@ func newTranslationStoreWithMigrations(t *testing.T) *TranslationStore {
 	}
 	return NewTranslationStore(db)
 }
+
+func TestSplitSentences(t *testing.T) {
+	got := SplitSentences("  你好。世界！\n\n\t再见")
+	want := []SentenceSplit{
+		{Text: "你好。", Indent: "  "},
+		{Text: "世界！", Separator: "\n\n"},
+		{Text: "再见", Indent: "\t"},
+	}
+	if len(got) != len(want) {
+		t.Fatalf("expected %d sentences, got %d: %+v", len(want), len(got), got)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Fatalf("sentence %d: got %+v, want %+v", i, got[i], want[i])
+		}
+	}
+}
+
+func TestSplitSentencesCollectsBlankLineRuns(t *testing.T) {
+	blank := strings.Repeat("  \n", 1000)
+	got := SplitSentences("\n你好。" + blank + "再见")
+	if len(got) != 2 {
+		t.Fatalf("expected 2 sentences, got %d: %+v", len(got), got)
+	}
+	if got[0].Separator != strings.Repeat("\n", 1000) {
+		t.Fatalf("expected 1000 line breaks after first sentence, got %d bytes", len(got[0].Separator))
+	}
+	if got[1].Separator != "" || got[1].Text != "再见" {
+		t.Fatalf("unexpected final sentence: %+v", got[1])
+	}
+}
+
+func TestIsCJKIdeographBoundaries(t *testing.T) {
+	cases := map[rune]bool{
+		0x33FF: false, 0x3400: true, 0x4DBF: true, 0x4DC0: false,
+		0x4DFF: false, 0x4E00: true, 0x9FFF: true, 0xA000: false,
+		0x1FFFF: false, 0x20000: true, 0x2A6DF: true, 0x2A6E0: false,
+		0x2A6FF: false, 0x2A700: true, 0x2CEAF: true, 0x2CEB0: true, 0x2EBEF: true, 0x2EBF0: false,
+		0x2FFFF: false, 0x30000: true, 0x323AF: true, 0x323B0: false,
+		'a': false, '，': false, 'あ': false,
+	}
+	for r, want := range cases {
+		if got := IsCJKIdeograph(r); got != want {
+			t.Errorf("IsCJKIdeograph(%#x) = %v, want %v", r, got, want)
+		}
+	}
+}
@@ -1,10 +1,12 @@
 package translation
 
 import (
+	"bytes"
 	"database/sql"
 	"encoding/json"
 	"errors"
 	"fmt"
+	"io"
 	"strings"
 	"time"
 )
@@ -26,7 +28,7 @@ func (s *SRSStore) SaveSegment(headword string, pinyin string, english string, t
 	}
 	now := time.Now().UTC().Format(time.RFC3339Nano)
 	id, _ := newID()
-	if _, err := s.db.Exec(
+	if _, err := s.stmts.exec(
 		`INSERT OR IGNORE INTO saved_segments (id, headword, pinyin, english, status, created_at, updated_at)
 		 VALUES (?, ?, ?, ?, ?, ?, ?)`,
 		id, strings.TrimSpace(headword), strings.TrimSpace(pinyin), strings.TrimSpace(english), status, now, now,
@@ -34,7 +36,7 @@ func (s *SRSStore) SaveSegment(headword string, pinyin string, english string, t
 		return "", fmt.Errorf("insert segment: %w", err)
 	}
 	var segmentID string
-	if err := s.db.QueryRow(
+	if err := s.stmts.queryRow(
 		`SELECT id FROM saved_segments WHERE headword = ? AND pinyin = ?`,
 		strings.TrimSpace(headword), strings.TrimSpace(pinyin),
 	).Scan(&segmentID); err != nil {
@@ -49,7 +51,7 @@ func (s *SRSStore) SaveSegment(headword string, pinyin string, english string, t
 	if snippet != nil {
 		snippetVal = *snippet
 	}
-	if _, err := s.db.Exec(
+	if _, err := s.stmts.exec(
 		`UPDATE saved_segments
 		 SET updated_at = ?,
 		     english = CASE WHEN ? = '' THEN english ELSE ? END,
@@ -102,16 +104,16 @@ func (s *SRSStore) UpdateCharacterStatus(characterID string, status string) erro
 }
 
 func (s *SRSStore) RecordLookup(segmentID string) (SegmentSRSInfo, bool) {
-	row := s.db.QueryRow(`SELECT id, headword, pinyin, english, status FROM saved_segments WHERE id = ?`, segmentID)
+	row := s.stmts.queryRow(`SELECT id, headword, pinyin, english, status FROM saved_segments WHERE id = ?`, segmentID)
 	var rec SegmentSRSInfo
 	if err := row.Scan(&rec.SegmentID, &rec.Headword, &rec.Pinyin, &rec.English, &rec.Status); err != nil {
 		return SegmentSRSInfo{}, false
 	}
 	now := time.Now().UTC().Format(time.RFC3339Nano)
 	lookupID, _ := newID()
-	_, _ = s.db.Exec(`INSERT INTO vocab_lookups (id, segment_id, looked_up_at) VALUES (?, ?, ?)`, lookupID, segmentID, now)
+	_, _ = s.stmts.exec(`INSERT INTO vocab_lookups (id, segment_id, looked_up_at) VALUES (?, ?, ?)`, lookupID, segmentID, now)
 	_ = s.ensureSegmentSRSState(segmentID, now)
-	_, _ = s.db.Exec(`UPDATE srs_state SET last_reviewed_at = ? WHERE segment_id = ?`, now, segmentID)
+	_, _ = s.stmts.exec(`UPDATE srs_state SET last_reviewed_at = ? WHERE segment_id = ?`, now, segmentID)
 	infoList, _ := s.GetSegmentSRSInfo([]string{rec.Headword})
 	if len(infoList) > 0 {
 		return infoList[0], true
@@ -120,25 +122,115 @@ func (s *SRSStore) RecordLookup(segmentID string) (SegmentSRSInfo, bool) {
 	return rec, true
 }
 
+// RecordLookups records a lookup for each segment ID in a single transaction
+// and returns SRS info for the segments that exist, in request order.
+// Unknown segment IDs are skipped.
+func (s *SRSStore) RecordLookups(segmentIDs []string) ([]SegmentSRSInfo, error) {
+	if len(segmentIDs) == 0 {
+		return []SegmentSRSInfo{}, nil
+	}
+	now := time.Now().UTC().Format(time.RFC3339Nano)
+
+	tx, err := s.db.Begin()
+	if err != nil {
+		return nil, fmt.Errorf("begin record lookups tx: %w", err)
+	}
+	defer tx.Rollback()
+
+	headwordStmt, err := tx.Prepare(`SELECT headword FROM saved_segments WHERE id = ?`)
+	if err != nil {
+		return nil, fmt.Errorf("prepare segment lookup: %w", err)
+	}
+	defer headwordStmt.Close()
+	insertStmt, err := tx.Prepare(`INSERT INTO vocab_lookups (id, segment_id, looked_up_at) VALUES (?, ?, ?)`)
+	if err != nil {
+		return nil, fmt.Errorf("prepare lookup insert: %w", err)
+	}
+	defer insertStmt.Close()
+	ensureStmt, err := tx.Prepare(
+		`INSERT OR IGNORE INTO srs_state (id, segment_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at)
+		 VALUES (?, ?, ?, 0, 2.5, 0, 0, ?)`,
+	)
+	if err != nil {
+		return nil, fmt.Errorf("prepare srs state init: %w", err)
+	}
+	defer ensureStmt.Close()
+	reviewedStmt, err := tx.Prepare(`UPDATE srs_state SET last_reviewed_at = ? WHERE segment_id = ?`)
+	if err != nil {
+		return nil, fmt.Errorf("prepare srs state update: %w", err)
+	}
+	defer reviewedStmt.Close()
+
+	foundIDs := make([]string, 0, len(segmentIDs))
+	headwords := make([]string, 0, len(segmentIDs))
+	for _, segmentID := range segmentIDs {
+		var headword string
+		if err := headwordStmt.QueryRow(segmentID).Scan(&headword); err != nil {
+			if errors.Is(err, sql.ErrNoRows) {
+				continue
+			}
+			return nil, fmt.Errorf("load segment %s: %w", segmentID, err)
+		}
+		lookupID, _ := newID()
+		if _, err := insertStmt.Exec(lookupID, segmentID, now); err != nil {
+			return nil, fmt.Errorf("insert lookup: %w", err)
+		}
+		if _, err := ensureStmt.Exec("seg-"+segmentID, segmentID, now, now); err != nil {
+			return nil, fmt.Errorf("init segment srs state: %w", err)
+		}
+		if _, err := reviewedStmt.Exec(now, segmentID); err != nil {
+			return nil, fmt.Errorf("update srs state: %w", err)
+		}
+		foundIDs = append(foundIDs, segmentID)
+		headwords = append(headwords, headword)
+	}
+	if err := tx.Commit(); err != nil {
+		return nil, fmt.Errorf("commit record lookups tx: %w", err)
+	}
+
+	infoList, err := s.GetSegmentSRSInfo(headwords)
+	if err != nil {
+		return nil, err
+	}
+	byID := make(map[string]SegmentSRSInfo, len(infoList))
+	for _, info := range infoList {
+		byID[info.SegmentID] = info
+	}
+	out := make([]SegmentSRSInfo, 0, len(foundIDs))
+	for _, segmentID := range foundIDs {
+		if info, ok := byID[segmentID]; ok {
+			out = append(out, info)
+		}
+	}
+	return out, nil
+}
+
 func (s *SRSStore) GetSegmentSRSInfo(headwords []string) ([]SegmentSRSInfo, error) {
-	filtered := make([]string, 0, len(headwords))
+	now := time.Now().UTC()
+	args := make([]any, 1, len(headwords)+1)
+	args[0] = now.Add(-7 * 24 * time.Hour).Format(time.RFC3339Nano)
+	seen := make(map[string]struct{}, len(headwords))
 	for _, h := range headwords {
 		h = strings.TrimSpace(h)
-		if h != "" {
-			filtered = append(filtered, h)
+		if h == "" {
+			continue
+		}
+		if _, dup := seen[h]; dup {
+			continue
 		}
+		seen[h] = struct{}{}
+		args = append(args, h)
 	}
-	if len(filtered) == 0 {
+	if len(args) == 1 {
 		return []SegmentSRSInfo{}, nil
 	}
-	placeholders := strings.Repeat("?,", len(filtered))
+	placeholders := strings.Repeat("?,", len(args)-1)
 	placeholders = strings.TrimSuffix(placeholders, ",")
-	args := make([]any, len(filtered))
-	for i, h := range filtered {
-		args[i] = h
-	}
+	// The recent-lookup count is a correlated subquery so the whole batch is
+	// a single statement rather than one extra COUNT per matched segment.
 	rows, err := s.db.Query(
-		fmt.Sprintf(`SELECT ss.id, ss.headword, ss.pinyin, ss.english, ss.status, st.last_reviewed_at, st.interval_days, st.due_at
+		fmt.Sprintf(`SELECT ss.id, ss.headword, ss.pinyin, ss.english, ss.status, st.last_reviewed_at, st.interval_days, st.due_at,
+				(SELECT COUNT(*) FROM vocab_lookups vl WHERE vl.segment_id = ss.id AND vl.looked_up_at >= ?)
 			FROM saved_segments ss
 			LEFT JOIN srs_state st ON ss.id = st.segment_id
 			WHERE ss.headword IN (%s)`, placeholders),
@@ -148,14 +240,14 @@ func (s *SRSStore) GetSegmentSRSInfo(headwords []string) ([]SegmentSRSInfo, erro
 		return nil, fmt.Errorf("query segment srs info: %w", err)
 	}
 	defer rows.Close()
-	now := time.Now().UTC()
 	out := make([]SegmentSRSInfo, 0)
 	for rows.Next() {
 		var info SegmentSRSInfo
 		var lastReviewed sql.NullString
 		var intervalDays sql.NullFloat64
 		var dueAt sql.NullString
-		if err := rows.Scan(&info.SegmentID, &info.Headword, &info.Pinyin, &info.English, &info.Status, &lastReviewed, &intervalDays, &dueAt); err != nil {
+		var recentCount int
+		if err := rows.Scan(&info.SegmentID, &info.Headword, &info.Pinyin, &info.English, &info.Status, &lastReviewed, &intervalDays, &dueAt, &recentCount); err != nil {
 			return nil, fmt.Errorf("scan segment srs info: %w", err)
 		}
 		if intervalDays.Valid {
@@ -164,12 +256,6 @@ func (s *SRSStore) GetSegmentSRSInfo(headwords []string) ([]SegmentSRSInfo, erro
 		if dueAt.Valid {
 			info.NextDueAt = &dueAt.String
 		}
-		recentCount := 0
-		_ = s.db.QueryRow(
-			`SELECT COUNT(*) FROM vocab_lookups WHERE segment_id = ? AND looked_up_at >= ?`,
-			info.SegmentID,
-			now.Add(-7*24*time.Hour).Format(time.RFC3339Nano),
-		).Scan(&recentCount)
 		info.IsStruggling = recentCount >= 3
 		if !lastReviewed.Valid {
 			info.Opacity = 0
@@ -231,7 +317,7 @@ func (s *SRSStore) GetSegmentReviewQueue(limit int) ([]SegmentReviewCard, error)
 func (s *SRSStore) GetSegmentDueCount() int {
 	now := time.Now().UTC().Format(time.RFC3339Nano)
 	var cnt int
-	_ = s.db.QueryRow(
+	_ = s.stmts.queryRow(
 		`SELECT COUNT(*) FROM saved_segments ss
 		 JOIN srs_state st ON ss.id = st.segment_id
 		 WHERE ss.status = 'learning' AND (st.due_at IS NULL OR st.due_at <= ?)`,
@@ -252,28 +338,29 @@ func (s *SRSStore) RecordReviewAnswer(entityID string, entityType string, grade
 		return ReviewAnswerResult{}, false, errors.New("invalid entity type")
 	}
 
-	entityExistsQuery := `SELECT 1 FROM saved_segments WHERE id = ?`
+	// One round-trip both confirms the saved item exists and loads its SRS
+	// state; the state columns are NULL when no srs_state row exists yet.
+	stateQuery := `SELECT st.due_at, st.interval_days, st.ease, st.reps, st.lapses
+		 FROM saved_segments ss LEFT JOIN srs_state st ON st.segment_id = ss.id
+		 WHERE ss.id = ?`
 	if entityType == reviewEntityCharacter {
-		entityExistsQuery = `SELECT 1 FROM saved_characters WHERE id = ?`
+		stateQuery = `SELECT st.due_at, st.interval_days, st.ease, st.reps, st.lapses
+		 FROM saved_characters sc LEFT JOIN srs_state st ON st.character_id = sc.id
+		 WHERE sc.id = ?`
 	}
-	var exists int
-	err := s.db.QueryRow(entityExistsQuery, entityID).Scan(&exists)
-	if err != nil {
-		return ReviewAnswerResult{}, false, nil
-	}
-
 	now := time.Now().UTC()
 	nowStr := now.Format(time.RFC3339Nano)
 	var dueAt sql.NullString
-	var interval, ease float64
-	var reps, lapses int
-	stateQuery := `SELECT due_at, interval_days, ease, reps, lapses FROM srs_state WHERE segment_id = ?`
-	if entityType == reviewEntityCharacter {
-		stateQuery = `SELECT due_at, interval_days, ease, reps, lapses FROM srs_state WHERE character_id = ?`
-	}
-	err = s.db.QueryRow(stateQuery, entityID).
-		Scan(&dueAt, &interval, &ease, &reps, &lapses)
+	var storedInterval, storedEase sql.NullFloat64
+	var storedReps, storedLapses sql.NullInt64
+	err := s.stmts.queryRow(stateQuery, entityID).
+		Scan(&dueAt, &storedInterval, &storedEase, &storedReps, &storedLapses)
 	if err != nil {
+		return ReviewAnswerResult{}, false, nil
+	}
+	interval, ease := storedInterval.Float64, storedEase.Float64
+	reps, lapses := int(storedReps.Int64), int(storedLapses.Int64)
+	if !storedEase.Valid {
 		if entityType == reviewEntityCharacter {
 			_ = s.ensureCharacterSRSState(entityID, nowStr)
 		} else {
@@ -318,15 +405,16 @@ func (s *SRSStore) RecordReviewAnswer(entityID string, entityType string, grade
 	if entityType == reviewEntityCharacter {
 		updateQuery = `UPDATE srs_state SET due_at = ?, interval_days = ?, ease = ?, reps = ?, lapses = ?, last_reviewed_at = ? WHERE character_id = ?`
 	}
-	_, _ = s.db.Exec(updateQuery, nextDue, newInterval, newEase, newReps, newLapses, nowStr, entityID)
+	_, _ = s.stmts.exec(updateQuery, nextDue, newInterval, newEase, newReps, newLapses, nowStr, entityID)
 	nextDuePtr := nextDue
-	remainingDue := s.GetSegmentDueCount()
+	var remainingDue int
 	var segmentID *string
 	var characterID *string
 	if entityType == reviewEntityCharacter {
 		remainingDue = s.GetCharacterDueCount()
 		characterID = &entityID
 	} else {
+		remainingDue = s.GetSegmentDueCount()
 		segmentID = &entityID
 	}
 	return ReviewAnswerResult{
@@ -338,221 +426,581 @@ func (s *SRSStore) RecordReviewAnswer(entityID string, entityType string, grade
 	}, true, nil
 }
 
-func (s *SRSStore) CountSegmentsByStatus(status string) int {
-	var cnt int
-	_ = s.db.QueryRow(`SELECT COUNT(*) FROM saved_segments WHERE status = ?`, status).Scan(&cnt)
-	return cnt
+// SegmentCounts summarises saved segments by status.
+type SegmentCounts struct {
+	Known    int
+	Learning int
+	Total    int
 }
 
-func (s *SRSStore) CountTotalSegments() int {
-	var cnt int
-	_ = s.db.QueryRow(`SELECT COUNT(*) FROM saved_segments`).Scan(&cnt)
-	return cnt
+// CountSegments returns all segment counts from one scan of saved_segments
+// rather than one COUNT query per figure.
+func (s *SRSStore) CountSegments() SegmentCounts {
+	var c SegmentCounts
+	_ = s.db.QueryRow(
+		`SELECT COALESCE(SUM(status = 'known'), 0), COALESCE(SUM(status = 'learning'), 0), COUNT(*)
+		 FROM saved_segments`,
+	).Scan(&c.Known, &c.Learning, &c.Total)
+	return c
 }
 
-func (s *SRSStore) ExportProgressJSON() (string, error) {
-	bundle := map[string]any{
-		"schema_version": 2,
-		"exported_at":    time.Now().UTC().Format(time.RFC3339Nano),
-	}
-	type tableDump struct {
-		query string
-		key   string
-	}
-	dumps := []tableDump{
-		{query: "SELECT id, headword, pinyin, english, status, created_at, updated_at, last_seen_translation_id, last_seen_snippet, last_seen_at, seen_count FROM saved_segments ORDER BY created_at", key: "saved_segments"},
-		{query: "SELECT id, character, pinyin, english, status, created_at, updated_at FROM saved_characters ORDER BY created_at", key: "saved_characters"},
-		{query: "SELECT id, character_id, segment, segment_pinyin, segment_translation, created_at FROM character_segment_links ORDER BY created_at", key: "character_segment_links"},
-		{query: "SELECT id, segment_id, character_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at FROM srs_state", key: "srs_state"},
-		{query: "SELECT id, segment_id, character_id, looked_up_at FROM vocab_lookups ORDER BY looked_up_at", key: "vocab_lookups"},
+// Exported rows are scanned into typed records. encoding/json writes a struct
+// field by field, whereas a map[string]any costs an interface per column and
+// a key sort per row. NULL columns are pointers so they still encode as null.
+type savedSegmentExport struct {
+	ID                    string  `json:"id"`
+	Headword              string  `json:"headword"`
+	Pinyin                string  `json:"pinyin"`
+	English               string  `json:"english"`
+	Status                string  `json:"status"`
+	CreatedAt             string  `json:"created_at"`
+	UpdatedAt             string  `json:"updated_at"`
+	LastSeenTranslationID *string `json:"last_seen_translation_id"`
+	LastSeenSnippet       string  `json:"last_seen_snippet"`
+	LastSeenAt            *string `json:"last_seen_at"`
+	SeenCount             int64   `json:"seen_count"`
+}
+
+type savedCharacterExport struct {
+	ID        string `json:"id"`
+	Character string `json:"character"`
+	Pinyin    string `json:"pinyin"`
+	English   string `json:"english"`
+	Status    string `json:"status"`
+	CreatedAt string `json:"created_at"`
+	UpdatedAt string `json:"updated_at"`
+}
+
+type characterSegmentLinkExport struct {
+	ID                 string `json:"id"`
+	CharacterID        string `json:"character_id"`
+	Segment            string `json:"segment"`
+	SegmentPinyin      string `json:"segment_pinyin"`
+	SegmentTranslation string `json:"segment_translation"`
+	CreatedAt          string `json:"created_at"`
+}
+
+type srsStateExport struct {
+	ID             string  `json:"id"`
+	SegmentID      *string `json:"segment_id"`
+	CharacterID    *string `json:"character_id"`
+	DueAt          *string `json:"due_at"`
+	IntervalDays   float64 `json:"interval_days"`
+	Ease           float64 `json:"ease"`
+	Reps           int64   `json:"reps"`
+	Lapses         int64   `json:"lapses"`
+	LastReviewedAt *string `json:"last_reviewed_at"`
+}
+
+type vocabLookupExport struct {
+	ID          string  `json:"id"`
+	SegmentID   *string `json:"segment_id"`
+	CharacterID *string `json:"character_id"`
+	LookedUpAt  string  `json:"looked_up_at"`
+}
+
+// progressExports lists the query each bundle list is exported from and how
+// one of its rows is scanned. The queries have no ORDER BY. Only
+// vocab_lookups.looked_up_at is indexed, so sorting the other tables by
+// created_at needed a temp b-tree, and the NDJSON export could not start
+// until the whole table had been sorted. Rows come out in rowid order, which
+// is insertion order, and an import preserves it.
+var progressExports = []struct {
+	key   string
+	query string
+	scan  func(rows *sql.Rows) (any, error)
+}{
+	{
+		key:   "saved_segments",
+		query: "SELECT id, headword, pinyin, english, status, created_at, updated_at, last_seen_translation_id, last_seen_snippet, last_seen_at, seen_count FROM saved_segments",
+		scan: func(rows *sql.Rows) (any, error) {
+			var r savedSegmentExport
+			err := rows.Scan(&r.ID, &r.Headword, &r.Pinyin, &r.English, &r.Status, &r.CreatedAt, &r.UpdatedAt, &r.LastSeenTranslationID, &r.LastSeenSnippet, &r.LastSeenAt, &r.SeenCount)
+			return &r, err
+		},
+	},
+	{
+		key:   "saved_characters",
+		query: "SELECT id, character, pinyin, english, status, created_at, updated_at FROM saved_characters",
+		scan: func(rows *sql.Rows) (any, error) {
+			var r savedCharacterExport
+			err := rows.Scan(&r.ID, &r.Character, &r.Pinyin, &r.English, &r.Status, &r.CreatedAt, &r.UpdatedAt)
+			return &r, err
+		},
+	},
+	{
+		key:   "character_segment_links",
+		query: "SELECT id, character_id, segment, segment_pinyin, segment_translation, created_at FROM character_segment_links",
+		scan: func(rows *sql.Rows) (any, error) {
+			var r characterSegmentLinkExport
+			err := rows.Scan(&r.ID, &r.CharacterID, &r.Segment, &r.SegmentPinyin, &r.SegmentTranslation, &r.CreatedAt)
+			return &r, err
+		},
+	},
+	{
+		key:   "srs_state",
+		query: "SELECT id, segment_id, character_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at FROM srs_state",
+		scan: func(rows *sql.Rows) (any, error) {
+			var r srsStateExport
+			err := rows.Scan(&r.ID, &r.SegmentID, &r.CharacterID, &r.DueAt, &r.IntervalDays, &r.Ease, &r.Reps, &r.Lapses, &r.LastReviewedAt)
+			return &r, err
+		},
+	},
+	{
+		key:   "vocab_lookups",
+		query: "SELECT id, segment_id, character_id, looked_up_at FROM vocab_lookups",
+		scan: func(rows *sql.Rows) (any, error) {
+			var r vocabLookupExport
+			err := rows.Scan(&r.ID, &r.SegmentID, &r.CharacterID, &r.LookedUpAt)
+			return &r, err
+		},
+	},
+}
+
+// eachExportRow runs query and calls fn with every row scanned by scan.
+func (s *SRSStore) eachExportRow(query string, scan func(rows *sql.Rows) (any, error), fn func(row any) error) error {
+	rows, err := s.db.Query(query)
+	if err != nil {
+		return err
 	}
-	for _, d := range dumps {
-		rows, err := s.db.Query(d.query)
+	defer rows.Close()
+	for rows.Next() {
+		row, err := scan(rows)
 		if err != nil {
-			return "", err
+			return err
 		}
-		arr, err := rowsToMaps(rows)
-		_ = rows.Close()
-		if err != nil {
-			return "", err
+		if err := fn(row); err != nil {
+			return err
 		}
-		bundle[d.key] = arr
 	}
-	b, err := json.MarshalIndent(bundle, "", "  ")
-	if err != nil {
-		return "", err
-	}
-	return string(b), nil
+	return rows.Err()
 }
 
-func (s *SRSStore) ImportProgressJSON(input string) (map[string]int, error) {
-	var data map[string]any
-	if err := json.Unmarshal([]byte(input), &data); err != nil {
-		return nil, fmt.Errorf("invalid JSON: %w", err)
-	}
-	getArr := func(key string) ([]map[string]any, error) {
-		raw, ok := data[key]
-		if !ok {
-			return nil, fmt.Errorf("missing '%s' field", key)
-		}
-		list, ok := raw.([]any)
-		if !ok {
-			return nil, fmt.Errorf("'%s' must be a list", key)
-		}
-		out := make([]map[string]any, 0, len(list))
-		for _, it := range list {
-			obj, ok := it.(map[string]any)
-			if !ok {
-				return nil, fmt.Errorf("%s entry must be object", key)
-			}
-			out = append(out, obj)
-		}
-		return out, nil
+// progressHeader is the first line of an NDJSON export.
+type progressHeader struct {
+	SchemaVersion int    `json:"schema_version"`
+	ExportedAt    string `json:"exported_at"`
+}
+
+// progressLine is every other line of an NDJSON export: one row of one table.
+// Exports write typed rows; imports read each row back as a map.
+type progressLine[R any] struct {
+	Table string `json:"table"`
+	Row   R      `json:"row"`
+}
+
+// ExportProgressJSON returns the encoded bundle as bytes so a multi-megabyte
+// export is not copied into a string and back again on its way to the client.
+func (s *SRSStore) ExportProgressJSON() ([]byte, error) {
+	bundle := map[string]any{
+		"schema_version": 2,
+		"exported_at":    time.Now().UTC().Format(time.RFC3339Nano),
 	}
-	getArrOptional := func(key string) []map[string]any {
-		raw, ok := data[key]
-		if !ok {
+	for _, d := range progressExports {
+		arr := make([]any, 0)
+		if err := s.eachExportRow(d.query, d.scan, func(row any) error {
+			arr = append(arr, row)
 			return nil
+		}); err != nil {
+			return nil, err
 		}
-		list, ok := raw.([]any)
-		if !ok {
-			return nil
+		bundle[d.key] = arr
+	}
+	return json.MarshalIndent(bundle, "", "  ")
+}
+
+// ExportProgressNDJSON writes the same data as ExportProgressJSON as
+// newline-delimited JSON: a progressHeader line, then one progressLine per
+// row. Rows are written as they are scanned, so the export is never held in
+// memory as a whole.
+func (s *SRSStore) ExportProgressNDJSON(w io.Writer) error {
+	enc := json.NewEncoder(w)
+	if err := enc.Encode(progressHeader{
+		SchemaVersion: 2,
+		ExportedAt:    time.Now().UTC().Format(time.RFC3339Nano),
+	}); err != nil {
+		return err
+	}
+	for _, d := range progressExports {
+		if err := s.eachExportRow(d.query, d.scan, func(row any) error {
+			return enc.Encode(progressLine[any]{Table: d.key, Row: row})
+		}); err != nil {
+			return err
 		}
-		out := make([]map[string]any, 0, len(list))
-		for _, it := range list {
-			obj, ok := it.(map[string]any)
-			if ok {
-				out = append(out, obj)
+	}
+	return nil
+}
+
+// progressTable describes how one list in a progress bundle is restored. The
+// specs are built once at package level rather than per import.
+type progressTable struct {
+	key      string
+	required bool
+	insert   string
+	args     func(item map[string]any) []any
+}
+
+// progressTables lists every table a bundle restores, parents first.
+var progressTables = []progressTable{
+	{
+		key:      "saved_segments",
+		required: true,
+		insert:   `INSERT INTO saved_segments (id, headword, pinyin, english, status, created_at, updated_at, last_seen_translation_id, last_seen_snippet, last_seen_at, seen_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
+		args: func(item map[string]any) []any {
+			return []any{
+				toString(item["id"]),
+				toString(item["headword"]),
+				toString(item["pinyin"]),
+				toString(item["english"]),
+				toString(item["status"]),
+				toString(item["created_at"]),
+				toString(item["updated_at"]),
+				nullableString(item["last_seen_translation_id"]),
+				toString(item["last_seen_snippet"]),
+				nullableString(item["last_seen_at"]),
+				toInt(item["seen_count"]),
+			}
+		},
+	},
+	{
+		key:      "saved_characters",
+		required: true,
+		insert:   `INSERT INTO saved_characters (id, character, pinyin, english, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)`,
+		args: func(item map[string]any) []any {
+			return []any{
+				toString(item["id"]),
+				toString(item["character"]),
+				toString(item["pinyin"]),
+				toString(item["english"]),
+				toString(item["status"]),
+				toString(item["created_at"]),
+				toString(item["updated_at"]),
+			}
+		},
+	},
+	{
+		key:      "srs_state",
+		required: true,
+		insert:   `INSERT INTO srs_state (id, segment_id, character_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)`,
+		args: func(item map[string]any) []any {
+			return []any{
+				toString(item["id"]),
+				nullableString(item["segment_id"]),
+				nullableString(item["character_id"]),
+				nullableString(item["due_at"]),
+				toFloat(item["interval_days"]),
+				toFloat(item["ease"]),
+				toInt(item["reps"]),
+				toInt(item["lapses"]),
+				nullableString(item["last_reviewed_at"]),
+			}
+		},
+	},
+	{
+		key:      "vocab_lookups",
+		required: true,
+		insert:   `INSERT INTO vocab_lookups (id, segment_id, character_id, looked_up_at) VALUES (?, ?, ?, ?)`,
+		args: func(item map[string]any) []any {
+			return []any{
+				toString(item["id"]),
+				nullableString(item["segment_id"]),
+				nullableString(item["character_id"]),
+				toString(item["looked_up_at"]),
+			}
+		},
+	},
+	{
+		// Older bundles predate character links, so the list may be absent.
+		key:    "character_segment_links",
+		insert: `INSERT INTO character_segment_links (id, character_id, segment, segment_pinyin, segment_translation, created_at) VALUES (?, ?, ?, ?, ?, ?)`,
+		args: func(item map[string]any) []any {
+			return []any{
+				toString(item["id"]),
+				toString(item["character_id"]),
+				toString(item["segment"]),
+				toString(item["segment_pinyin"]),
+				toString(item["segment_translation"]),
+				toString(item["created_at"]),
 			}
+		},
+	},
+}
+
+func progressTableFor(key string) (progressTable, bool) {
+	for _, t := range progressTables {
+		if t.key == key {
+			return t, true
 		}
-		return out
 	}
-	segments, err := getArr("saved_segments")
+	return progressTable{}, false
+}
+
+// progressImport is one restore in flight: the transaction that cleared the
+// old progress, the INSERTs prepared so far and the rows inserted per table.
+type progressImport struct {
+	db     *sql.DB
+	tx     *sql.Tx
+	stmts  map[string]*sql.Stmt
+	counts map[string]int
+}
+
+// beginProgressImport starts the transaction a bundle is restored in and
+// clears the existing progress inside it. Callers must close the import.
+func (s *SRSStore) beginProgressImport() (*progressImport, error) {
+	tx, err := s.db.Begin()
 	if err != nil {
 		return nil, err
 	}
-	characters, err := getArr("saved_characters")
-	if err != nil {
+	// Check foreign keys once at commit instead of failing on the first row
+	// whose parent has not been inserted yet. This also makes the order of
+	// the rows in the bundle irrelevant. A bundle that still has dangling
+	// references fails the commit and nothing is applied. The pragma resets
+	// itself when the transaction ends.
+	//
+	// The reset runs as one Exec. None of these tables has triggers, so SQLite
+	// clears the child tables with its truncate optimization rather than row
+	// by row. The two parent tables are still deleted row by row because
+	// foreign keys are enabled.
+	if _, err := tx.Exec(`PRAGMA defer_foreign_keys = ON;
+		DELETE FROM character_segment_links;
+		DELETE FROM vocab_lookups;
+		DELETE FROM srs_state;
+		DELETE FROM saved_characters;
+		DELETE FROM saved_segments;`); err != nil {
+		_ = tx.Rollback()
 		return nil, err
 	}
-	charSegmentLinks := getArrOptional("character_segment_links")
-	srsState, err := getArr("srs_state")
-	if err != nil {
-		return nil, err
+	return &progressImport{
+		db:     s.db,
+		tx:     tx,
+		stmts:  make(map[string]*sql.Stmt, len(progressTables)),
+		counts: make(map[string]int, len(progressTables)),
+	}, nil
+}
+
+// insert adds one row to t's table. Each table's INSERT is prepared on first
+// use and reused, so SQLite parses and plans it once per import rather than
+// once per row.
+func (p *progressImport) insert(t progressTable, item map[string]any) error {
+	stmt, ok := p.stmts[t.key]
+	if !ok {
+		var err error
+		if stmt, err = p.tx.Prepare(t.insert); err != nil {
+			return err
+		}
+		p.stmts[t.key] = stmt
+	}
+	if _, err := stmt.Exec(t.args(item)...); err != nil {
+		return err
 	}
-	lookups, err := getArr("vocab_lookups")
+	p.counts[t.key]++
+	return nil
+}
+
+// commit commits the restore and then checkpoints the WAL. A restore writes
+// every table in one transaction, and the WAL keeps its high-water size
+// until a TRUNCATE checkpoint resets it. The checkpoint is best effort: it
+// stops early, harmlessly, if readers are still on older snapshots.
+func (p *progressImport) commit() error {
+	if err := p.tx.Commit(); err != nil {
+		return err
+	}
+	_, _ = p.db.Exec(`PRAGMA wal_checkpoint(TRUNCATE)`)
+	return nil
+}
+
+// close releases the prepared statements and rolls back unless commit
+// succeeded.
+func (p *progressImport) close() {
+	for _, stmt := range p.stmts {
+		_ = stmt.Close()
+	}
+	_ = p.tx.Rollback()
+}
+
+// ImportProgressJSON replaces all saved progress with the bundle in input. The
+// bundle is decoded one row at a time and each row is inserted as soon as it
+// is read, so no decoded copy of the whole bundle is ever held. Any error,
+// including a required list that turns out to be missing once the whole
+// bundle has been read, rolls the import back.
+func (s *SRSStore) ImportProgressJSON(input []byte) (map[string]int, error) {
+	dec := json.NewDecoder(bytes.NewReader(input))
+	tok, err := dec.Token()
 	if err != nil {
-		return nil, err
+		return nil, fmt.Errorf("invalid JSON: %w", err)
+	}
+	if tok != json.Delim('{') {
+		return nil, errors.New("invalid JSON: expected an object")
 	}
 
-	tx, err := s.db.Begin()
+	imp, err := s.beginProgressImport()
 	if err != nil {
 		return nil, err
 	}
-	defer tx.Rollback()
-	for _, stmt := range []string{
-		"DELETE FROM character_segment_links",
-		"DELETE FROM vocab_lookups",
-		"DELETE FROM srs_state",
-		"DELETE FROM saved_characters",
-		"DELETE FROM saved_segments",
-	} {
-		if _, err := tx.Exec(stmt); err != nil {
+	defer imp.close()
+	for dec.More() {
+		tok, err := dec.Token()
+		if err != nil {
+			return nil, fmt.Errorf("invalid JSON: %w", err)
+		}
+		key, _ := tok.(string)
+		t, ok := progressTableFor(key)
+		if !ok {
+			var skip json.RawMessage
+			if err := dec.Decode(&skip); err != nil {
+				return nil, fmt.Errorf("invalid JSON: %w", err)
+			}
+			continue
+		}
+		if err := imp.importList(dec, t); err != nil {
 			return nil, err
 		}
 	}
-	for _, item := range segments {
-		_, err := tx.Exec(`INSERT INTO saved_segments (id, headword, pinyin, english, status, created_at, updated_at, last_seen_translation_id, last_seen_snippet, last_seen_at, seen_count) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-			toString(item["id"]),
-			toString(item["headword"]),
-			toString(item["pinyin"]),
-			toString(item["english"]),
-			toString(item["status"]),
-			toString(item["created_at"]),
-			toString(item["updated_at"]),
-			nullableString(item["last_seen_translation_id"]),
-			toString(item["last_seen_snippet"]),
-			nullableString(item["last_seen_at"]),
-			toInt(item["seen_count"]),
-		)
-		if err != nil {
-			return nil, err
+	if _, err := dec.Token(); err != nil {
+		return nil, fmt.Errorf("invalid JSON: %w", err)
+	}
+	if _, err := dec.Token(); err != io.EOF {
+		return nil, errors.New("invalid JSON: unexpected data after top-level value")
+	}
+	for _, t := range progressTables {
+		n, ok := imp.counts[t.key]
+		if t.required && !ok {
+			return nil, fmt.Errorf("missing '%s' field", t.key)
+		}
+		if !t.required && ok && n == 0 {
+			delete(imp.counts, t.key)
 		}
 	}
-	for _, item := range characters {
-		_, err := tx.Exec(`INSERT INTO saved_characters (id, character, pinyin, english, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)`,
-			toString(item["id"]),
-			toString(item["character"]),
-			toString(item["pinyin"]),
-			toString(item["english"]),
-			toString(item["status"]),
-			toString(item["created_at"]),
-			toString(item["updated_at"]),
-		)
-		if err != nil {
-			return nil, err
+	if err := imp.commit(); err != nil {
+		return nil, err
+	}
+	return imp.counts, nil
+}
+
+// importList streams the list for t from dec into its table. A malformed
+// list is an error for required tables; for optional ones it is skipped, as
+// are entries that are not objects.
+func (p *progressImport) importList(dec *json.Decoder, t progressTable) error {
+	tok, err := dec.Token()
+	if err != nil {
+		return fmt.Errorf("invalid JSON: %w", err)
+	}
+	if tok != json.Delim('[') {
+		if t.required {
+			return fmt.Errorf("'%s' must be a list", t.key)
+		}
+		if err := skipJSONValue(dec, tok); err != nil {
+			return fmt.Errorf("invalid JSON: %w", err)
 		}
+		return nil
 	}
-	for _, item := range srsState {
-		_, err := tx.Exec(`INSERT INTO srs_state (id, segment_id, character_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-			toString(item["id"]),
-			nullableString(item["segment_id"]),
-			nullableString(item["character_id"]),
-			nullableString(item["due_at"]),
-			toFloat(item["interval_days"]),
-			toFloat(item["ease"]),
-			toInt(item["reps"]),
-			toInt(item["lapses"]),
-			nullableString(item["last_reviewed_at"]),
-		)
+	// Record the list as present even if it turns out to be empty.
+	p.counts[t.key] += 0
+	// Entries decode straight into one reused map, which insert only reads
+	// from. An entry that is not an object fails with an UnmarshalTypeError
+	// after the decoder has consumed it, and null leaves the map nil.
+	item := make(map[string]any)
+	for dec.More() {
+		clear(item)
+		err := dec.Decode(&item)
+		var typeErr *json.UnmarshalTypeError
+		if errors.As(err, &typeErr) || (err == nil && item == nil) {
+			if t.required {
+				return fmt.Errorf("%s entry must be object", t.key)
+			}
+			if item == nil {
+				item = make(map[string]any)
+			}
+			continue
+		}
 		if err != nil {
-			return nil, err
+			return fmt.Errorf("invalid JSON: %w", err)
+		}
+		if err := p.insert(t, item); err != nil {
+			return err
 		}
 	}
-	for _, item := range lookups {
-		_, err := tx.Exec(`INSERT INTO vocab_lookups (id, segment_id, character_id, looked_up_at) VALUES (?, ?, ?, ?)`,
-			toString(item["id"]),
-			nullableString(item["segment_id"]),
-			nullableString(item["character_id"]),
-			toString(item["looked_up_at"]),
-		)
-		if err != nil {
-			return nil, err
+	if _, err := dec.Token(); err != nil {
+		return fmt.Errorf("invalid JSON: %w", err)
+	}
+	return nil
+}
+
+// ImportProgressNDJSON is ImportProgressJSON for the ExportProgressNDJSON
+// format. Tables without rows have no lines, so every required table is
+// reported, with zero rows if none were read.
+func (s *SRSStore) ImportProgressNDJSON(input []byte) (map[string]int, error) {
+	dec := json.NewDecoder(bytes.NewReader(input))
+	var header progressHeader
+	if err := dec.Decode(&header); err != nil {
+		return nil, fmt.Errorf("invalid NDJSON: %w", err)
+	}
+	if header.SchemaVersion == 0 {
+		return nil, errors.New("missing 'schema_version' header line")
+	}
+
+	imp, err := s.beginProgressImport()
+	if err != nil {
+		return nil, err
+	}
+	defer imp.close()
+	for _, t := range progressTables {
+		if t.required {
+			imp.counts[t.key] = 0
 		}
 	}
-	for _, item := range charSegmentLinks {
-		_, err := tx.Exec(`INSERT INTO character_segment_links (id, character_id, segment, segment_pinyin, segment_translation, created_at) VALUES (?, ?, ?, ?, ?, ?)`,
-			toString(item["id"]),
-			toString(item["character_id"]),
-			toString(item["segment"]),
-			toString(item["segment_pinyin"]),
-			toString(item["segment_translation"]),
-			toString(item["created_at"]),
-		)
-		if err != nil {
+	// As in importList, every line decodes into the same row map.
+	line := progressLine[map[string]any]{Row: make(map[string]any)}
+	for {
+		line.Table = ""
+		clear(line.Row)
+		if err := dec.Decode(&line); err == io.EOF {
+			break
+		} else if err != nil {
+			return nil, fmt.Errorf("invalid NDJSON: %w", err)
+		}
+		t, ok := progressTableFor(line.Table)
+		if !ok {
+			continue
+		}
+		if line.Row == nil {
+			return nil, fmt.Errorf("%s entry must be object", t.key)
+		}
+		if err := imp.insert(t, line.Row); err != nil {
 			return nil, err
 		}
 	}
-	if err := tx.Commit(); err != nil {
+	if err := imp.commit(); err != nil {
 		return nil, err
 	}
-	counts := map[string]int{
-		"saved_segments":   len(segments),
-		"saved_characters": len(characters),
-		"srs_state":        len(srsState),
-		"vocab_lookups":    len(lookups),
+	return imp.counts, nil
+}
+
+// skipJSONValue consumes the rest of the value that starts with tok.
+func skipJSONValue(dec *json.Decoder, tok json.Token) error {
+	if tok != json.Delim('{') && tok != json.Delim('[') {
+		return nil
 	}
-	if len(charSegmentLinks) > 0 {
-		counts["character_segment_links"] = len(charSegmentLinks)
+	for depth := 1; depth > 0; {
+		tok, err := dec.Token()
+		if err != nil {
+			return err
+		}
+		switch tok {
+		case json.Delim('{'), json.Delim('['):
+			depth++
+		case json.Delim('}'), json.Delim(']'):
+			depth--
+		}
 	}
-	return counts, nil
+	return nil
 }
 
 func (s *SRSStore) ExtractAndLinkCharacters(segmentID string, segment string, segmentPinyin string, segmentEnglish string, charData []CharTranslation) error {
 	runes := []rune(segment)
 	cjkRunes := make([]rune, 0, len(runes))
 	for _, r := range runes {
-		if isCJKIdeograph(r) {
+		if IsCJKIdeograph(r) {
 			cjkRunes = append(cjkRunes, r)
 		}
 	}
@@ -659,7 +1107,7 @@ func (s *SRSStore) GetCharacterReviewQueue(limit int) ([]CharacterReviewCard, er
 func (s *SRSStore) GetCharacterDueCount() int {
 	now := time.Now().UTC().Format(time.RFC3339Nano)
 	var cnt int
-	_ = s.db.QueryRow(
+	_ = s.stmts.queryRow(
 		`SELECT COUNT(*) FROM saved_characters sc
 		 JOIN srs_state st ON sc.id = st.character_id
 		 WHERE sc.status = 'learning' AND (st.due_at IS NULL OR st.due_at <= ?)`,
@@ -670,7 +1118,7 @@ func (s *SRSStore) GetCharacterDueCount() int {
 
 func (s *SRSStore) ensureSegmentSRSState(segmentID string, now string) error {
 	id := "seg-" + segmentID
-	if _, err := s.db.Exec(
+	if _, err := s.stmts.exec(
 		`INSERT OR IGNORE INTO srs_state (id, segment_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at)
 		 VALUES (?, ?, ?, 0, 2.5, 0, 0, ?)`,
 		id, segmentID, now, now,
@@ -682,7 +1130,7 @@ func (s *SRSStore) ensureSegmentSRSState(segmentID string, now string) error {
 
 func (s *SRSStore) ensureCharacterSRSState(characterID string, now string) error {
 	id := "char-" + characterID
-	if _, err := s.db.Exec(
+	if _, err := s.stmts.exec(
 		`INSERT OR IGNORE INTO srs_state (id, character_id, due_at, interval_days, ease, reps, lapses, last_reviewed_at)
 		 VALUES (?, ?, ?, 0, 2.5, 0, 0, ?)`,
 		id, characterID, now, now,
@@ -696,15 +1144,6 @@ func isValidStatus(status string) bool {
 	return status == "unknown" || status == "learning" || status == "known"
 }
 
-func isCJKIdeograph(r rune) bool {
-	return (r >= 0x4E00 && r <= 0x9FFF) ||
-		(r >= 0x3400 && r <= 0x4DBF) ||
-		(r >= 0x20000 && r <= 0x2A6DF) ||
-		(r >= 0x2A700 && r <= 0x2CEAF) ||
-		(r >= 0x2CEB0 && r <= 0x2EBEF) ||
-		(r >= 0x30000 && r <= 0x323AF)
-}
-
 func maxFloat(a float64, b float64) float64 {
 	if a > b {
 		return a
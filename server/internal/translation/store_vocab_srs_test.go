@@ -1,10 +1,12 @@
 package translation
 
 import (
+	"bytes"
 	"database/sql"
 	"os"
 	"path/filepath"
 	"sort"
+	"strings"
 	"testing"
 
 	"github.com/anath2/language-app/internal/migrations"
@@ -202,3 +204,181 @@ func TestExportImportProgressJSONSplitTablesRoundtrip(t *testing.T) {
 		t.Fatal("expected character review queue to be populated after import")
 	}
 }
+
+func TestRecordLookupsBatchSkipsUnknownSegments(t *testing.T) {
+	srs := newSRSStoreWithMigrations(t)
+
+	firstID, err := srs.SaveSegment("你好", "ni hao", "hello", nil, nil, "learning")
+	if err != nil {
+		t.Fatalf("save first segment: %v", err)
+	}
+	secondID, err := srs.SaveSegment("世界", "shi jie", "world", nil, nil, "learning")
+	if err != nil {
+		t.Fatalf("save second segment: %v", err)
+	}
+
+	infos, err := srs.RecordLookups([]string{secondID, "missing", firstID})
+	if err != nil {
+		t.Fatalf("record lookups: %v", err)
+	}
+	if len(infos) != 2 {
+		t.Fatalf("expected 2 lookup results, got %d", len(infos))
+	}
+	if infos[0].SegmentID != secondID || infos[1].SegmentID != firstID {
+		t.Fatalf("expected results in request order, got %q then %q", infos[0].SegmentID, infos[1].SegmentID)
+	}
+
+	var lookups int
+	if err := srs.db.QueryRow(`SELECT COUNT(*) FROM vocab_lookups`).Scan(&lookups); err != nil {
+		t.Fatalf("count lookups: %v", err)
+	}
+	if lookups != 2 {
+		t.Fatalf("expected 2 recorded lookups, got %d", lookups)
+	}
+}
+
+func TestRecordReviewAnswerReturnsRemainingDueForEntityType(t *testing.T) {
+	srs := newSRSStoreWithMigrations(t)
+
+	segmentID, err := srs.SaveSegment("银行", "yin hang", "bank", nil, nil, "learning")
+	if err != nil {
+		t.Fatalf("save segment: %v", err)
+	}
+	if err := srs.ExtractAndLinkCharacters(segmentID, "银行", "yin hang", "bank", []CharTranslation{
+		{Char: "银", Pinyin: "yin"},
+		{Char: "行", Pinyin: "hang"},
+	}); err != nil {
+		t.Fatalf("extract and link characters: %v", err)
+	}
+	charactersDue := srs.GetCharacterDueCount()
+	if charactersDue == 0 {
+		t.Fatal("expected linked characters to be due")
+	}
+
+	res, ok, err := srs.RecordReviewAnswer(segmentID, reviewEntitySegment, 2)
+	if err != nil || !ok {
+		t.Fatalf("record segment review: ok=%v err=%v", ok, err)
+	}
+	if res.IntervalDays != 1 || res.RemainingDue != 0 {
+		t.Fatalf("expected 1 day interval and nothing left due, got %+v", res)
+	}
+
+	var characterID string
+	if err := srs.db.QueryRow(`SELECT id FROM saved_characters LIMIT 1`).Scan(&characterID); err != nil {
+		t.Fatalf("load character id: %v", err)
+	}
+	res, ok, err = srs.RecordReviewAnswer(characterID, reviewEntityCharacter, 0)
+	if err != nil || !ok {
+		t.Fatalf("record character review: ok=%v err=%v", ok, err)
+	}
+	if res.RemainingDue != charactersDue {
+		t.Fatalf("expected failed character to stay due (%d), got %d", charactersDue, res.RemainingDue)
+	}
+
+	if _, ok, err := srs.RecordReviewAnswer("missing", reviewEntitySegment, 1); ok || err != nil {
+		t.Fatalf("expected missing segment to report not found, got ok=%v err=%v", ok, err)
+	}
+}
+
+func TestGetSegmentSRSInfoBatchesLookupCounts(t *testing.T) {
+	srs := newSRSStoreWithMigrations(t)
+
+	strugglingID, err := srs.SaveSegment("你好", "ni hao", "hello", nil, nil, "learning")
+	if err != nil {
+		t.Fatalf("save first segment: %v", err)
+	}
+	if _, err := srs.SaveSegment("世界", "shi jie", "world", nil, nil, "learning"); err != nil {
+		t.Fatalf("save second segment: %v", err)
+	}
+	if _, err := srs.RecordLookups([]string{strugglingID, strugglingID, strugglingID}); err != nil {
+		t.Fatalf("record lookups: %v", err)
+	}
+
+	infos, err := srs.GetSegmentSRSInfo([]string{"你好", " ", "世界", "你好", "missing"})
+	if err != nil {
+		t.Fatalf("get segment srs info: %v", err)
+	}
+	if len(infos) != 2 {
+		t.Fatalf("expected 2 infos for distinct saved headwords, got %d", len(infos))
+	}
+	for _, info := range infos {
+		if want := info.SegmentID == strugglingID; info.IsStruggling != want {
+			t.Fatalf("segment %q: expected struggling=%v, got %v", info.Headword, want, info.IsStruggling)
+		}
+	}
+}
+
+func TestImportProgressJSONMissingListRollsBack(t *testing.T) {
+	srs := newSRSStoreWithMigrations(t)
+	if _, err := srs.SaveSegment("你好", "ni hao", "hello", nil, nil, "learning"); err != nil {
+		t.Fatalf("save segment: %v", err)
+	}
+
+	bundle := []byte(`{"saved_segments": [{"id": "s1", "headword": "世界", "created_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-01T00:00:00Z"}], "saved_characters": [], "srs_state": []}`)
+	_, err := srs.ImportProgressJSON(bundle)
+	if err == nil || !strings.Contains(err.Error(), "missing 'vocab_lookups' field") {
+		t.Fatalf("expected missing vocab_lookups error, got %v", err)
+	}
+
+	var headword string
+	if err := srs.db.QueryRow(`SELECT headword FROM saved_segments`).Scan(&headword); err != nil {
+		t.Fatalf("read saved segment: %v", err)
+	}
+	if headword != "你好" {
+		t.Fatalf("expected original progress to survive a failed import, got %q", headword)
+	}
+}
+
+func TestExportImportProgressNDJSONRoundtrip(t *testing.T) {
+	origin := newSRSStoreWithMigrations(t)
+	segmentID, err := origin.SaveSegment("人工智能", "ren gong zhi neng", "artificial intelligence", nil, nil, "learning")
+	if err != nil {
+		t.Fatalf("save segment: %v", err)
+	}
+	if err := origin.ExtractAndLinkCharacters(segmentID, "人工智能", "ren gong zhi neng", "artificial intelligence", nil); err != nil {
+		t.Fatalf("extract and link characters: %v", err)
+	}
+	var exported bytes.Buffer
+	if err := origin.ExportProgressNDJSON(&exported); err != nil {
+		t.Fatalf("export progress ndjson: %v", err)
+	}
+	lines := strings.Split(strings.TrimSuffix(exported.String(), "\n"), "\n")
+	if !strings.Contains(lines[0], `"schema_version":2`) {
+		t.Fatalf("expected header line first, got %q", lines[0])
+	}
+
+	target := newSRSStoreWithMigrations(t)
+	counts, err := target.ImportProgressNDJSON(exported.Bytes())
+	if err != nil {
+		t.Fatalf("import progress ndjson: %v", err)
+	}
+	if counts["saved_segments"] != 1 || counts["saved_characters"] != 4 {
+		t.Fatalf("unexpected import counts: %v", counts)
+	}
+	if counts["vocab_lookups"] != 0 {
+		t.Fatalf("expected empty required table to be reported, got %v", counts)
+	}
+	if len(lines)-1 != counts["saved_segments"]+counts["saved_characters"]+counts["character_segment_links"]+counts["srs_state"] {
+		t.Fatalf("expected one line per row, got %d lines for %v", len(lines)-1, counts)
+	}
+}
+
+func TestCountSegments(t *testing.T) {
+	srs := newSRSStoreWithMigrations(t)
+	if got := srs.CountSegments(); got != (SegmentCounts{}) {
+		t.Fatalf("expected zero counts for empty store, got %+v", got)
+	}
+	for _, seg := range []struct{ headword, status string }{
+		{"你好", "learning"},
+		{"世界", "known"},
+		{"银行", "learning"},
+	} {
+		if _, err := srs.SaveSegment(seg.headword, "", "", nil, nil, seg.status); err != nil {
+			t.Fatalf("save segment %q: %v", seg.headword, err)
+		}
+	}
+	want := SegmentCounts{Known: 1, Learning: 2, Total: 3}
+	if got := srs.CountSegments(); got != want {
+		t.Fatalf("CountSegments() = %+v, want %+v", got, want)
+	}
+}
@@ -59,7 +59,7 @@ func overrideDepsWithMockProvider(t *testing.T, cfg config.Config) *translation.
 	profileStore := translation.NewProfileStore(db)
 	transProv := mockTranslationProvider{}
 	chatProv := mockChatProvider{}
-	manager := queue.NewManager(translationStore, transProv)
+	manager := queue.NewManager(translationStore, transProv, 4)
 	handlers.ConfigureDependencies(translationStore, chatStore, srsStore, profileStore, manager, transProv, chatProv)
 	return translationStore
 }
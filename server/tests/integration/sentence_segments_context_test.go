@@ -55,7 +55,7 @@ func overrideDepsWithTranslationProvider(t *testing.T, cfg config.Config, transP
 	chatStore := translation.NewChatStore(db)
 	srsStore := translation.NewSRSStore(db)
 	profileStore := translation.NewProfileStore(db)
-	manager := queue.NewManager(translationStore, transProv)
+	manager := queue.NewManager(translationStore, transProv, 4)
 	handlers.ConfigureDependencies(translationStore, chatStore, srsStore, profileStore, manager, transProv, mockChatProvider{})
 }
 
@@ -96,6 +96,11 @@ export type StreamProgressEvent = {
   result: StreamSegmentResult;
 };
 
+export type StreamFullTranslationEvent = {
+  type: 'full_translation';
+  fullTranslation?: string | null;
+};
+
 export type StreamCompleteEvent = {
   type: 'complete';
   sentences?: SentenceResult[];
@@ -110,6 +115,7 @@ export type StreamErrorEvent = {
 export type StreamEvent =
   | StreamStartEvent
   | StreamProgressEvent
+  | StreamFullTranslationEvent
   | StreamCompleteEvent
   | StreamErrorEvent;
 